@@ -0,0 +1,40 @@
+# This code benchmarks the Dauber generators, so a change can be checked for speed and for identical output.
+# Each generator is run at each number of layers, and SweepToolpaths at each sweep size, recording the wall time, the
+# peak memory traced by tracemalloc and the bytes written. The results are saved as JSON and can be compared with an
+# earlier run, e.g.
+#   python BenchmarkToolpaths.py -lc 10 1000 100000 -o after.json -cm before.json
+# Profiles (-pd) are cProfile stats, which snakeviz or flameprof can show as a flame graph.
+
+import argparse
+import json
+from dauber import benchmark
+
+parser = argparse.ArgumentParser(prog='BenchmarkToolpaths',
+                                 formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+parser.add_argument('-g', '--generators',           help='Generators to run: line, N and/or pillar',                                                    type=str,   default=list(benchmark.generators), nargs='+')
+parser.add_argument('-lc', '--layer_counts',        help='Numbers of layers to run the line and N generators at, [unitless]',                           type=int,   default=benchmark.layer_counts, nargs='+')
+parser.add_argument('-ss', '--sweep_sizes',         help='Numbers of programs in the benchmark sweeps, none to skip them, [unitless]',                  type=int,   default=benchmark.sweep_sizes, nargs='*')
+parser.add_argument('-sl', '--sweep_layers',        help='Number of layers of each program in a sweep, [unitless]',                                     type=int,   default=benchmark.sweep_layers)
+parser.add_argument('-j', '--jobs',                 help='Number of worker processes for the sweeps, [unitless]',                                       type=int,   default=1)
+parser.add_argument('-sm', '--skip_memory',         help='Whether to skip the run of each case that traces the peak memory (True) or not (False)',      type=bool,  default=False)
+parser.add_argument('-pd', '--profile_dir',         help='Directory to save a cProfile of each case in, none to not profile',                           type=str,   default=None)
+parser.add_argument('-o', '--output',               help='JSON file to save the results to',                                                            type=str,   default='benchmark.json')
+parser.add_argument('-cm', '--compare',             help='JSON file of an earlier run to compare the results with',                                     type=str,   default=None)
+args = parser.parse_args()
+
+cases = [case + (None,) for case in benchmark.generator_cases(args.generators, args.layer_counts)]
+cases += [benchmark.sweep_case(size, args.sweep_layers, args.jobs) for size in args.sweep_sizes]
+run = {'environment': benchmark.environment(), 'results': []}
+for name, script, argv, setup in cases:
+    result = benchmark.measure(name, script, argv, not args.skip_memory, args.profile_dir, setup)
+    run['results'].append(result)
+    line = '{:<28}{:9.3f} [s] {:12d} [bytes]'.format(name, result['wall_time'], result['output_bytes'])
+    if 'peak_memory' in result:
+        line += ' {:9.1f} [MB peak]'.format(result['peak_memory'] / 1e6)
+    print(line, flush=True)
+    with open(args.output, 'w') as file: # Saved after every case, so a long run can be stopped early
+        json.dump(run, file, indent=1)
+
+if (args.compare):
+    with open(args.compare) as file:
+        print('\n'.join(benchmark.compare(json.load(file), run)))
@@ -0,0 +1,55 @@
+# This code generates a toolpath for Dauber that deposits the paths of a 2D drawing, controlled by the Centroid Acorn.
+# The drawing is a DXF file (lines, arcs, circles and polylines), a CSV file with x, y and optional path columns, or a
+# JSON list of polylines. The paths are joined end to end and ordered to keep the moves between them short.
+
+import argparse
+import os
+from dauber.gcode import GcodeWriter
+from dauber import toolpath, compact, timing, cache
+
+parser = argparse.ArgumentParser(prog='DrawingToolpath',
+                                 formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+parser.add_argument('drawing',                      help='DXF, CSV or JSON file holding the paths to deposit')
+# --- Invariants ---
+parser.add_argument('-ah', '--approach_height',     help='Height above surface to rapid to when program starts, should be above any screws, [mm]',      type=float, default=20.0)
+parser.add_argument('-ad', '--approach_duration',   help='Duration over which to approach the layer height, [s]',                                       type=float, default=30.0)
+parser.add_argument('-wd', '--wire_diameter',       help='Diameter of the feedstock wire, [mm]',                                                        type=float, default=0.9)
+parser.add_argument('-dd', '--deposition_diameter', help='Estimated diameter of deposition area, [mm]',                                                 type=float, default=3.5)
+
+# --- Drawing ---
+parser.add_argument('-sc', '--scale',               help='Size of one drawing unit, e.g. 25.4 for a drawing in inches, [mm]',                           type=float, default=1.0)
+parser.add_argument('-to', '--tolerance',           help='Largest distance between an arc and the chords it is split into, [mm]',                       type=float, default=0.01)
+
+# --- Process Parameters ---
+parser.add_argument('-nl', '--num_layers',          help='Number of layers to deposit, [unitless]',                                                     type=int,   default=5)
+parser.add_argument('-fr', '--feed_rate',           help='Wire feed rate, [mm/s]',                                                                      type=float, default=1.0)
+parser.add_argument('-lh', '--layer_height',        help='Height of tool tip above substrate or previous layer, [mm]',                                  type=float, default=0.05)
+parser.add_argument('-tr', '--travel_rate',         help='Feedrate of the moves between paths, made without feeding, [mm/min]',                         type=float, default=600.0)
+parser.add_argument('-ss', '--spindle_speed',       help='Spindle speed, [rpm]',                                                                        type=int,   default=24000)
+parser.add_argument('-ip', '--initial_pause',       help='Whether to wait at zero height (True) or not (False) for use input to start',                 type=bool,  default=False)
+
+# --- Sample ID ---
+parser.add_argument('-sn', '--sample_num',          help='Unique sample number in XXX format (e.g. 006)',                                               type=int,   default=999)
+
+# --- Output ---
+parser.add_argument('-hm', '--heightmap_cell',      help='Cell size of a heightmap to adapt the feed to where moves overlap, 0 for flat layers, [mm]',  type=float, default=0.0)
+parser.add_argument('-c', '--compact',              help='Whether to write the layers as calls to a subprogram (True) or unrolled (False)',             type=bool,  default=False)
+parser.add_argument('-mp', '--machine_profile',     help='Machine profile to estimate the program time with, e.g. machines/acorn.json',                 type=str,   default=None)
+parser.add_argument('-ca', '--cache',               help='Directory to cache programs in and reuse them from, e.g. ~/.cache/dauber',                    type=str,   default=None)
+parser.add_argument('-o', '--output',               help='File to write the gcode to, or - for stdout, uses <sample ID>.nc if not given',               type=str,   default=None)
+args = parser.parse_args()
+
+profile = timing.load_profile(args.machine_profile) if args.machine_profile else None
+sample_id = toolpath.Drawing.sample_id(args.sample_num)
+filename = sample_id + '.nc'
+with GcodeWriter(args.output if args.output else filename) as out: # Lines are streamed to the file as they are generated
+    if (args.cache):
+        cache.Cache(os.path.expanduser(args.cache)).write(toolpath.Drawing, toolpath.Drawing.arguments(args), out, args.sample_num, args.compact, profile)
+    else:
+        pattern = toolpath.Drawing.from_args(args)
+        if (profile):
+            timing.annotate(pattern, profile)
+        if (args.compact):
+            compact.write(pattern, out, sample_id)
+        else:
+            pattern.write(out, sample_id)
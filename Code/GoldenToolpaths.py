@@ -0,0 +1,21 @@
+# This code checks that the Dauber generators still write exactly the golden programs in golden/, the output of
+# LineToolpath, NToolpath and PillarToolpath with their default arguments. Run it before and after a change that is
+# only meant to make generation faster. Regenerate the golden files (-u) only when a change to the output is intended.
+
+import argparse
+import sys
+from dauber import benchmark
+
+parser = argparse.ArgumentParser(prog='GoldenToolpaths',
+                                 formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+parser.add_argument('-u', '--update',               help='Whether to overwrite the golden files with the output (True) or check against them (False)',  type=bool,  default=False)
+args = parser.parse_args()
+
+problems = benchmark.golden_check(args.update)
+if (args.update):
+    print('Golden files written to {}'.format(benchmark.golden_directory))
+for problem in problems:
+    print(problem)
+if not args.update and not problems:
+    print('{} programs match the golden files'.format(len(benchmark.golden_cases)))
+sys.exit(1 if problems else 0)
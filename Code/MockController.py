@@ -0,0 +1,33 @@
+# This code stands in for the controller when testing StreamToolpath.py: it listens on a TCP port and acknowledges
+# each line it receives with "ok" after a delay, answering with an error if the sender overflows its receive buffer.
+
+import argparse
+import asyncio
+from dauber import stream
+
+parser = argparse.ArgumentParser(prog='MockController',
+                                 formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+parser.add_argument('-ho', '--host',                help='Address to listen on',                                                                        type=str,   default='localhost')
+parser.add_argument('-p', '--port',                 help='Port to listen on',                                                                           type=int,   default=5000)
+parser.add_argument('-d', '--delay',                help='Time taken to process each line before acknowledging it, [s]',                                type=float, default=0.001)
+parser.add_argument('-rb', '--rx_buffer',           help='Size of the receive buffer, [bytes]',                                                         type=int,   default=128)
+parser.add_argument('-o', '--output',               help='File to write the received lines to',                                                         type=str,   default=None)
+args = parser.parse_args()
+
+async def main():
+    log = open(args.output, 'w', buffering=1) if args.output else None # Line buffered, so killing the mock keeps the transcript
+    controller = stream.MockController(args.delay, args.rx_buffer, log)
+    server = await controller.serve(args.host, args.port)
+    print('Listening on {}:{}'.format(args.host, args.port))
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if log:
+            log.close()
+        print('Received {} lines, {} buffer overflows'.format(controller.lines_received, controller.overflows))
+
+try:
+    asyncio.run(main())
+except KeyboardInterrupt:
+    pass
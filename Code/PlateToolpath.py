@@ -0,0 +1,24 @@
+# This code generates one program depositing several samples on a build plate for Dauber, controlled by the Centroid Acorn.
+# The layout is a JSON file with the plate settings, a grid and the parts, e.g.
+#   {"wire_diameter": 0.9, "clearance": 2.0, "spacing": [25, 25], "columns": 2,
+#    "parts": [{"pattern": "N", "feed_rate": 1.0}, {"pattern": "line", "feed_rate": 1.5}, {"pattern": "pillar"}]}
+# Each part is given like a sweep row and may set its own sample_num, x and y. Layer k of every part is deposited
+# before any part starts layer k+1.
+
+import argparse
+from dauber.gcode import GcodeWriter
+from dauber import plate
+
+parser = argparse.ArgumentParser(prog='PlateToolpath',
+                                 formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+parser.add_argument('layout',                       help='JSON file describing the plate and its parts')
+parser.add_argument('-pn', '--plate_num',           help='Unique plate number in XXX format (e.g. 006)',                                                type=int,   default=999)
+parser.add_argument('-fs', '--first_sample',        help='Sample number given to the first part without a sample_num, [unitless]',                      type=int,   default=1)
+parser.add_argument('-o', '--output',               help='File to write the gcode to, or - for stdout, uses <plate ID>.nc if not given',                type=str,   default=None)
+args = parser.parse_args()
+
+build_plate = plate.load_layout(args.layout, args.first_sample)
+plate_id = plate.plate_id(args.plate_num)
+filename = plate_id + '.nc'
+with GcodeWriter(args.output if args.output else filename) as out:
+    build_plate.write(out, plate_id)
@@ -0,0 +1,51 @@
+# This code drip-feeds a program to the Centroid Acorn (or MockController.py) over a TCP or serial link.
+# The program is an existing .nc file, or - to stream the output of a generator as it is made, e.g.
+#   python NToolpath.py -nl 100000 -o - | python StreamToolpath.py localhost:5000 -
+# Each line is sent once the controller has room for it, and streaming pauses at M0 until Enter is pressed
+# (or carries straight on with --no_pause).
+
+import argparse
+import asyncio
+import sys
+from dauber import stream
+
+parser = argparse.ArgumentParser(prog='StreamToolpath',
+                                 formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+parser.add_argument('target',                       help='host:port of a TCP link, or a serial port such as /dev/ttyUSB0 or COM3')
+parser.add_argument('program',                      help='Program to send, or - to read it from stdin')
+parser.add_argument('-b', '--baudrate',             help='Baud rate of a serial link, [bits/s]',                                                        type=int,   default=115200)
+parser.add_argument('-w', '--window',               help='Largest number of lines waiting for an acknowledgement, 1 to send line by line, [unitless]',  type=int,   default=16)
+parser.add_argument('-bb', '--buffer_bytes',        help='Size of the controller receive buffer, [bytes]',                                              type=int,   default=128)
+parser.add_argument('-np', '--no_pause',            help='Whether to carry straight on after an M0 instead of waiting for Enter',                       action='store_true')
+parser.add_argument('-ri', '--report_interval',     help='Time between progress reports, [s]',                                                          type=float, default=1.0)
+args = parser.parse_args()
+
+def report(stats):
+    print('\r{:10d} lines, {:8.0f} [lines/s], {:8.1f} [kB/s], latency {:7.2f} [ms], buffer {:5.0f} [bytes] '.format(
+        stats['lines_acked'], stats['lines_per_second'], stats['bytes_per_second'] / 1e3, stats['mean_latency'] * 1e3,
+        stats['mean_buffer']), end='', file=sys.stderr, flush=True)
+
+async def main():
+    reader, writer = await stream.open_link(args.target, args.baudrate)
+    sender = stream.Sender(reader, writer, args.window, args.buffer_bytes, not args.no_pause, report, args.report_interval)
+    loop = asyncio.get_running_loop()
+    def pause(line):
+        try:
+            terminal = open('/dev/tty') if args.program == '-' else sys.stdin # stdin may be carrying the program
+        except OSError:
+            print('\nNo terminal to resume from, carrying on after {}'.format(line), file=sys.stderr)
+            sender.resume()
+            return
+        print('\nPaused at {}, press Enter to resume'.format(line), file=sys.stderr)
+        loop.run_in_executor(None, terminal.readline).add_done_callback(lambda _: sender.resume())
+    sender.on_pause = pause
+    with (sys.stdin if args.program == '-' else open(args.program)) as program:
+        stats = await sender.send(stream.read_lines(program))
+    writer.close()
+    report(stats)
+    print('', file=sys.stderr)
+    for line, response in stats['errors']:
+        print('Line {}: {}'.format(line, response), file=sys.stderr)
+    return 1 if stats['errors'] else 0
+
+sys.exit(asyncio.run(main()))
@@ -0,0 +1,28 @@
+# This code generates a series of toolpaths for Dauber from a parameter sweep, controlled by the Centroid Acorn.
+# The sweep is a CSV file with one row per sample, or a JSON file holding a list of rows or a grid, e.g.
+#   {"pattern": "N", "feed_rate": [0.5, 1.0, 1.5], "layer_height": [0.05, 0.1], "num_layers": 50}
+# where every list is swept. Each row needs a pattern (line, N or pillar) and may set a sample_num.
+
+import argparse
+import os
+import time
+from dauber import sweep, timing
+
+parser = argparse.ArgumentParser(prog='SweepToolpaths',
+                                 formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+parser.add_argument('spec',                         help='CSV or JSON file describing the sweep')
+parser.add_argument('-od', '--output_dir',          help='Directory to write the programs and manifest to',                                             type=str,   default='.')
+parser.add_argument('-fs', '--first_sample',        help='Sample number given to the first row without a sample_num, [unitless]',                       type=int,   default=1)
+parser.add_argument('-j', '--jobs',                 help='Number of worker processes, [unitless]',                                                      type=int,   default=os.cpu_count())
+parser.add_argument('-c', '--compact',              help='Whether to write the layers as calls to a subprogram (True) or unrolled (False)',             type=bool,  default=False)
+parser.add_argument('-mp', '--machine_profile',     help='Machine profile to estimate the program times with, e.g. machines/acorn.json',                type=str,   default=None)
+parser.add_argument('-ca', '--cache',               help='Directory to cache programs in and reuse them from, e.g. ~/.cache/dauber',                    type=str,   default=None)
+parser.add_argument('-m', '--manifest',             help='Name of the manifest file written in the output directory',                                   type=str,   default='manifest.csv')
+args = parser.parse_args()
+
+start = time.perf_counter()
+profile = timing.load_profile(args.machine_profile) if args.machine_profile else None
+cache_dir = os.path.expanduser(args.cache) if args.cache else None
+entries = sweep.run(sweep.load_rows(args.spec), args.output_dir, args.first_sample, args.jobs, args.compact, profile, cache_dir)
+sweep.write_manifest(entries, os.path.join(args.output_dir, args.manifest))
+print('Generated {} programs in {:.2f} [s]'.format(len(entries), time.perf_counter() - start))
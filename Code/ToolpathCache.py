@@ -0,0 +1,27 @@
+# This code reports on or empties the cache of generated Dauber programs used by the toolpath scripts' --cache option.
+
+import argparse
+import os
+from dauber import cache
+
+parser = argparse.ArgumentParser(prog='ToolpathCache',
+                                 formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+parser.add_argument('command',                      help='stats, trim (to the size limit) or clear', choices=['stats', 'trim', 'clear'])
+parser.add_argument('-ca', '--cache',               help='Directory the programs are cached in',                                                        type=str,   default=cache.default_directory)
+parser.add_argument('-ms', '--max_size',            help='Size limit of the cache, [MB]',                                                               type=float, default=cache.default_max_bytes / 1e6)
+args = parser.parse_args()
+
+programs = cache.Cache(os.path.expanduser(args.cache), int(args.max_size * 1e6))
+if (args.command == 'stats'):
+    stats = programs.stats()
+    print('Requests:      {:10d}'.format(stats['requests']))
+    print('Hits:          {:10d} [whole program reused]'.format(stats['hits']))
+    print('Body reuses:   {:10d} [header regenerated, layers reused]'.format(stats['body_reuses']))
+    print('Extensions:    {:10d} [cached layers extended]'.format(stats['extensions']))
+    print('Misses:        {:10d}'.format(stats['misses']))
+    print('Bytes saved:   {:10d} [bytes]'.format(stats['bytes_saved']))
+    print('Entries:       {:10d} [{:.1f} MB stored]'.format(stats['entries'], stats['bytes_stored'] / 1e6))
+elif (args.command == 'trim'):
+    programs.trim()
+else:
+    programs.clear()
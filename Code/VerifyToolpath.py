@@ -0,0 +1,40 @@
+# This code checks gcode generated for Dauber, controlled by the Centroid Acorn, before it is sent to the machine.
+# Each program is simulated and compared with the calculated values written in its header.
+
+import argparse
+import sys
+from dauber import simulate, compact, timing
+
+parser = argparse.ArgumentParser(prog='VerifyToolpath',
+                                 formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+parser.add_argument('files',                        help='Gcode files to check', nargs='+')
+parser.add_argument('-x', '--expand',               help='Whether to inline subprogram calls (True) or not (False), for compact output',                type=bool,  default=False)
+parser.add_argument('-rr', '--rapid_rate',          help='Rapid rate used to time G0 moves, 0 to leave them out, [mm/min]',                             type=float, default=0.0)
+parser.add_argument('-mp', '--machine_profile',     help='Machine profile to estimate the program times with, e.g. machines/acorn.json',                type=str,   default=None)
+args = parser.parse_args()
+profile = timing.load_profile(args.machine_profile) if args.machine_profile else None
+
+failed = 0
+for filename in args.files:
+    try:
+        if (args.expand):
+            with open(filename) as file:
+                result = simulate.verify(compact.expand(file), args.rapid_rate)
+        else:
+            result = simulate.verify(filename, args.rapid_rate)
+    except ValueError as error:
+        print('{}: {}'.format(filename, error))
+        failed += 1
+        continue
+    print('{}: {} moves, {:.2f} [min], {:.2f} [mm] of wire ({:.2f} [mm^3]), final Z {:.2f} [mm]'.format(
+        filename, result['moves'], result['total_time'], result['wire_length'], result.get('wire_volume', float('nan')), result['final_z']))
+    if 'x_range' in result:
+        print('    X {:.2f} to {:.2f} [mm], Y {:.2f} to {:.2f} [mm]'.format(*result['x_range'], *result['y_range']))
+    if profile:
+        estimate = timing.estimate(*timing.program_moves(result['table'], result), profile)
+        print('    Estimated {:.2f} [min] with acceleration limits, slowest wire feed {:.2f} [mm/min], {} speed limited moves'.format(
+            estimate['total_time'], estimate['feed_rate'][estimate['feed_rate'] > 0].min() * 60, int(estimate['limited'].sum())))
+    for problem in result['problems']:
+        print('    ' + problem)
+    failed += len(result['problems']) > 0
+sys.exit(1 if failed else 0)
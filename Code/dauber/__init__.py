@@ -0,0 +1 @@
+# Shared code for generating Dauber toolpaths, controlled by the Centroid Acorn.
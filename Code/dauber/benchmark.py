@@ -0,0 +1,184 @@
+# Benchmarks of the Dauber generators, and golden-file checks of their output.
+# Each benchmark runs a generator script in this process, as it would run from the command line, in a temporary
+# directory. It is run once for the wall time and once more under tracemalloc for the peak memory, since tracing
+# slows everything down. It can also be run under cProfile, saving stats that snakeviz, flameprof or gprof2dot can
+# turn into a call graph or flame graph. The output of every run is hashed, so runs saved as JSON can be compared
+# for speed and for identical output.
+# The golden files are the programs the generators write with their default arguments, kept in Code/golden.
+# A change that is only meant to make generation faster must leave them byte for byte the same.
+
+import cProfile
+import datetime
+import hashlib
+import json
+import os
+import platform
+import runpy
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+
+code_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+golden_directory = os.path.join(code_directory, 'golden')
+
+# Generator scripts and whether they take a number of layers (a pillar is a single climb)
+generators = {'line': ('LineToolpath.py', True),
+              'N': ('NToolpath.py', True),
+              'pillar': ('PillarToolpath.py', False)}
+layer_counts = [10, 100, 1000, 10000, 100000, 1000000]
+sweep_sizes = [1, 10, 100]
+sweep_layers = 100 # Number of layers of each program in a benchmark sweep, [unitless]
+
+# Argument lists of the golden-file cases, each writing one program named after its sample ID
+golden_cases = [('LineToolpath.py', []),
+                ('NToolpath.py', []),
+                ('PillarToolpath.py', [])]
+
+def _directory_bytes(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+def _directory_hash(directory):
+    # Hash of the names and contents of the files in a directory
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(directory)):
+        digest.update(name.encode())
+        with open(os.path.join(directory, name), 'rb') as file:
+            for piece in iter(lambda: file.read(1 << 20), b''):
+                digest.update(piece)
+    return digest.hexdigest()
+
+def run_script(script, argv, directory, trace_memory=False, profile_file=None):
+    # Run a script from Code as if from the command line in directory, returning its wall time, [s], and, when
+    # trace_memory is set, the peak memory traced while it ran, [bytes]
+    old_argv, old_directory = sys.argv, os.getcwd()
+    sys.argv = [script] + [str(arg) for arg in argv]
+    os.chdir(directory)
+    profiler = cProfile.Profile() if profile_file else None
+    if (trace_memory):
+        tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        if (profiler):
+            profiler.enable()
+        runpy.run_path(os.path.join(code_directory, script), run_name='__main__')
+        if (profiler):
+            profiler.disable()
+        wall_time = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if (trace_memory):
+            tracemalloc.stop()
+        sys.argv = old_argv
+        os.chdir(old_directory)
+    if (profiler):
+        profiler.dump_stats(profile_file)
+    return wall_time, peak
+
+def measure(name, script, argv, trace_memory=True, profile_dir=None, setup=None):
+    # Wall time, peak memory and output of one benchmark case. setup(directory) may write input files first, and
+    # returns the paths they should be given as.
+    result = {'case': name, 'script': script, 'arguments': [str(arg) for arg in argv]}
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, 'output')
+        inputs = setup(directory) if setup else []
+        os.makedirs(output)
+        result['wall_time'], _ = run_script(script, inputs + argv, output)
+        result['output_bytes'] = _directory_bytes(output)
+        result['output_sha256'] = _directory_hash(output)
+        if (trace_memory):
+            shutil.rmtree(output)
+            os.makedirs(output)
+            _, result['peak_memory'] = run_script(script, inputs + argv, output, trace_memory=True)
+        if (profile_dir):
+            os.makedirs(profile_dir, exist_ok=True)
+            result['profile'] = os.path.join(os.path.abspath(profile_dir), name.replace(' ', '_') + '.prof')
+            shutil.rmtree(output)
+            os.makedirs(output)
+            run_script(script, inputs + argv, output, profile_file=result['profile'])
+    return result
+
+def generator_cases(names=generators, counts=layer_counts):
+    # (name, script, arguments) of each generator at each number of layers
+    for name in names:
+        script, layered = generators[name]
+        if not layered:
+            yield name, script, []
+            continue
+        for n in counts:
+            yield '{} {} layers'.format(name, n), script, ['-nl', n]
+
+def sweep_case(size, layers=sweep_layers, jobs=1):
+    # (name, script, arguments, setup) of a sweep of size N programs, differing in their feed rate
+    def setup(directory):
+        spec = os.path.join(directory, 'sweep.json')
+        with open(spec, 'w') as file:
+            json.dump({'pattern': 'N', 'num_layers': layers, 'feed_rate': np.linspace(0.5, 1.5, size).round(4).tolist()}, file)
+        return [spec]
+    return 'sweep {} programs'.format(size), 'SweepToolpaths.py', ['-od', '.', '-j', jobs], setup
+
+def environment():
+    # What the benchmarks ran on, saved with the results
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=code_directory, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {'date': datetime.datetime.now().isoformat(timespec='seconds'),
+            'commit': commit,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count()}
+
+def compare(old, new):
+    # Lines comparing two saved runs case by case: the time taken relative to the old run and whether the output changed
+    before = {result['case']: result for result in old['results']}
+    lines = []
+    for result in new['results']:
+        if result['case'] not in before:
+            continue
+        previous = before[result['case']]
+        line = '{:<28}{:9.3f} -> {:9.3f} [s] {:6.2f}x'.format(result['case'], previous['wall_time'], result['wall_time'],
+                                                          result['wall_time'] / max(previous['wall_time'], 1e-9))
+        if result.get('peak_memory') and previous.get('peak_memory'):
+            line += '  {:9.1f} -> {:9.1f} [MB]'.format(previous['peak_memory'] / 1e6, result['peak_memory'] / 1e6)
+        if result['output_sha256'] != previous['output_sha256']:
+            line += '  OUTPUT CHANGED'
+        lines.append(line)
+    return lines
+
+def golden_check(update=False, directory=golden_directory):
+    # Run the golden cases in a fresh process each and compare their programs with the golden files, or replace the
+    # golden files with them when update is set. Returns a list of the files that differ or are missing.
+    problems = []
+    with tempfile.TemporaryDirectory() as output:
+        for script, argv in golden_cases:
+            before = set(os.listdir(output))
+            subprocess.run([sys.executable, os.path.join(code_directory, script)] + argv, cwd=output, check=True)
+            for name in sorted(set(os.listdir(output)) - before):
+                golden = os.path.join(directory, name)
+                if (update):
+                    os.makedirs(directory, exist_ok=True)
+                    shutil.copyfile(os.path.join(output, name), golden)
+                    continue
+                if not os.path.exists(golden):
+                    problems.append('{}: no golden file {}'.format(name, golden))
+                    continue
+                with open(os.path.join(output, name), 'rb') as file:
+                    generated = file.read()
+                with open(golden, 'rb') as file:
+                    expected = file.read()
+                if generated != expected:
+                    problems.append('{}: differs from the golden file from line {}'.format(name, _first_difference(generated, expected)))
+    return problems
+
+def _first_difference(a, b):
+    # Line number of the first difference between two programs
+    for i, (line_a, line_b) in enumerate(zip(a.split(b'\n'), b.split(b'\n'))):
+        if line_a != line_b:
+            return i + 1
+    return min(a.count(b'\n'), b.count(b'\n')) + 1
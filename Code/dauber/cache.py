@@ -0,0 +1,330 @@
+# On-disk cache of generated Dauber programs.
+# Entries are named by a hash of the pattern name, its parameters, the output options and the version of the code
+# (a hash of the dauber sources), so a program is reused only when it would come out the same.
+# Two kinds of entry are kept:
+#   <key>.nc      whole programs, copied straight back for a repeated request
+#   <key>.layers  the layer stream of an unrolled program (everything between the prefix moves and the escape),
+#                 keyed without the sample number, num_layers and the parameters that only change the header and
+#                 preamble. A request that differs only in those reuses the stream: fewer layers are a slice of it,
+#                 more layers carry on from its last C and Z. <key>.npy holds the end of each layer in the stream
+#                 and <key>.json the number of layers and the final C and Z.
+# The least recently used entries are removed once the directory grows past its size limit.
+# Several processes (the sweep workers) may share a cache: every file is written under a temporary name and moved into
+# place with os.replace, and an entry removed by another process is treated as missing.
+
+import glob
+import hashlib
+import io
+import json
+import os
+import tempfile
+import numpy as np
+
+from dauber import compact
+
+default_directory = os.environ.get('DAUBER_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'dauber'))
+default_max_bytes = 1 << 30 # Size limit of the cache directory, [bytes]
+copy_size = 1 << 20         # Size of the pieces cached text is copied in, [characters]
+events_file = 'events.log'  # One line per request: what was reused and how many bytes were not regenerated
+events_max_bytes = 1 << 20  # Size past which the event log is summed into one line per kind of event, [bytes]
+rescan_writes = 64          # Number of writes after which the size of the cache is measured again, [unitless]
+
+_version = None
+
+def code_version():
+    # Hash of the dauber sources, so entries written by other versions of the code are never used
+    global _version
+    if _version is None:
+        digest = hashlib.sha256()
+        for filename in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '*.py'))):
+            with open(filename, 'rb') as file:
+                digest.update(file.read())
+        _version = digest.hexdigest()
+    return _version
+
+def file_hash(filename):
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for piece in iter(lambda: file.read(copy_size), b''):
+            digest.update(piece)
+    return digest.hexdigest()
+
+def canonical_params(cls, params):
+    # The full parameters of a request, with defaults filled in and each value converted to the type of its default,
+    # so that e.g. {'line_length': 10}, {'line_length': 10.0} and {} all name the same program
+    params = dict(cls.parameters(), **params)
+    for name, default in cls.parameters().items():
+        if isinstance(default, (bool, int, float)) and params[name] is not None:
+            params[name] = type(default)(params[name])
+    return params
+
+def key(kind, cls, params, **options):
+    # Canonical hash of a request: the same pattern, parameters and options always give the same key
+    params = canonical_params(cls, params)
+    for name in cls.input_files: # Files the pattern reads are keyed by their contents
+        if params.get(name):
+            params[name] = [params[name], file_hash(params[name])]
+    request = {'kind': kind, 'pattern': cls.name, 'params': params, 'options': options, 'version': code_version()}
+    return hashlib.sha256(json.dumps(request, sort_keys=True, separators=(',', ':'), default=repr).encode()).hexdigest()
+
+class _Tee:
+    # Writes the text given to it to several outputs
+    def __init__(self, *outputs):
+        self.outputs = outputs
+
+    def write(self, text):
+        for output in self.outputs:
+            output.write(text)
+
+def _copy_file(file, out, size=None):
+    # Copy the first size characters of an open file (the rest of it if size is None) to out
+    remaining = np.inf if size is None else size
+    while remaining > 0:
+        piece = file.read(int(min(copy_size, remaining)))
+        if not piece:
+            break
+        out.write(piece)
+        remaining -= len(piece)
+
+class Cache:
+    def __init__(self, directory=default_directory, max_bytes=default_max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.size = None # Size of the cache as last measured, plus what this process has written since, [bytes]
+        self.writes = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _record(self, event, saved):
+        # Appending one short line is atomic, so sweep workers can share the log
+        with open(self._path(events_file), 'a') as file:
+            file.write('{} {}\n'.format(event, saved))
+            if file.tell() > events_max_bytes:
+                self._sum_events()
+
+    def _events(self):
+        # Number of requests and bytes saved for each kind of event in the log
+        totals = {}
+        try:
+            with open(self._path(events_file)) as file:
+                for line in file:
+                    event, saved, *count = line.split()
+                    requests, total = totals.get(event, (0, 0))
+                    totals[event] = (requests + int(count[0] if count else 1), total + int(saved))
+        except FileNotFoundError:
+            pass
+        return totals
+
+    def _sum_events(self):
+        # Replace the log by one "event saved count" line per kind of event, keeping its size bounded
+        lines = ''.join('{} {} {}\n'.format(event, saved, requests) for event, (requests, saved) in self._events().items())
+        self._replace(events_file, lines.encode())
+
+    def _touch(self, name):
+        # Entries are aged by their modification time; one removed by another process is left alone
+        try:
+            os.utime(self._path(name))
+        except FileNotFoundError:
+            pass
+
+    def _copy(self, name, out, size=None):
+        # Copy the first size characters of a cached entry (all of it if size is None) to out.
+        # Raises FileNotFoundError, before writing anything, if the entry has gone.
+        with open(self._path(name), newline='') as file:
+            self._touch(name)
+            _copy_file(file, out, size)
+
+    def _temporary(self):
+        # A new file in the cache directory, moved into place with os.replace once it is complete
+        handle, name = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        return os.fdopen(handle, 'w', newline=''), name
+
+    def _replace(self, name, data):
+        # Write bytes to a cached file all at once, so other processes see either the old or the new contents.
+        # Returns the number of bytes written.
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                file.write(data)
+            os.replace(temporary, self._path(name))
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+        return len(data)
+
+    def _added(self, size):
+        # Account for size bytes written to the cache, trimming it when it may have grown past its limit.
+        # The directory is only measured again every rescan_writes writes, as other processes write to it too.
+        self.writes += 1
+        if self.size is None or self.writes % rescan_writes == 0:
+            self.size = sum(entry_size for mtime, entry_size, names in self.entries())
+        else:
+            self.size += size
+        if self.size > self.max_bytes:
+            self.trim()
+
+    def write(self, cls, params, out, sample_num, compact_output=False, profile=None, pattern=None):
+        # Write the program for a pattern class and its parameters to out, reusing whatever the cache holds.
+        # The pattern is only built when the whole program is not cached, unless it is given (already annotated
+        # with the profile's estimate). Returns what was reused: 'hit', 'body', 'extend' or 'miss'.
+        params = canonical_params(cls, params)
+        program_key = key('program', cls, params, sample_num=sample_num, compact=compact_output, profile=profile)
+        program_name = program_key + '.nc'
+        try:
+            self._copy(program_name, out)
+        except FileNotFoundError:
+            pass
+        else:
+            self._record('hit', os.path.getsize(self._path(program_name)) if os.path.exists(self._path(program_name)) else 0)
+            return 'hit'
+
+        if pattern is None:
+            pattern = cls(**params)
+            if profile:
+                from dauber import timing # timing needs the simulator, which the cache does not otherwise use
+                timing.annotate(pattern, profile)
+        sample_id = pattern.sample_id(sample_num)
+        file, temporary = self._temporary()
+        try:
+            tee = _Tee(out, file)
+            if compact_output or pattern.num_layers < 1:
+                (compact.write if compact_output else cls.write)(pattern, tee, sample_id)
+                event, saved, stored = 'miss', 0, 0
+            else:
+                tee.write(pattern.header(sample_id))
+                tee.write(pattern.preamble())
+                tee.write(''.join(fmt.format(x=x, y=y, c=0.0, f=f) for kind, x, y, f, fmt in pattern.prefix_moves()))
+                tee.write(pattern.layer_separator)
+                event, saved, stored = self._write_layers(cls, params, pattern, tee)
+                tee.write(pattern.escape())
+            file.close()
+            size = os.path.getsize(temporary)
+            os.replace(temporary, self._path(program_name))
+        finally:
+            if not file.closed:
+                file.close()
+            if os.path.exists(temporary):
+                os.remove(temporary)
+        self._record(event, saved)
+        self._added(size + stored)
+        return event
+
+    def _write_layers(self, cls, params, pattern, out):
+        # Write the layers of an unrolled program to out, from the cached layer stream where there is one.
+        # Returns what was reused, the bytes not regenerated and the bytes of layer stream files written to the cache.
+        shared = {k: v for k, v in params.items() if k not in cls.preamble_parameters and k != 'num_layers'}
+        layers_key = key('layers', cls, shared)
+        stream, ends, info = (layers_key + suffix for suffix in ('.layers', '.npy', '.json'))
+        # The stream is opened once and only ever read up to the end of the layers its metadata lists. Other
+        # processes replace the three files one after another, but the stream of a key only ever grows by more layers,
+        # so any stream at least as long as the layers listed starts with them.
+        cached = 0
+        try:
+            cached_stream = open(self._path(stream), newline='')
+        except FileNotFoundError:
+            cached_stream = None
+        try:
+            if cached_stream:
+                try:
+                    with open(self._path(info)) as file:
+                        meta = json.load(file)
+                    layer_ends = np.load(self._path(ends))
+                    if len(layer_ends) == meta['num_layers'] and os.fstat(cached_stream.fileno()).st_size >= layer_ends[-1]:
+                        cached = meta['num_layers']
+                except (OSError, ValueError, KeyError, IndexError):
+                    pass
+            n = pattern.num_layers
+            if cached >= n:
+                size = int(layer_ends[n - 1])
+                _copy_file(cached_stream, out, size)
+                for name in (stream, ends, info):
+                    self._touch(name)
+                return 'body', size, 0
+
+            # Generate the missing layers, carrying on from the cached ones, and store the longer stream
+            file, temporary = self._temporary()
+            try:
+                tee = _Tee(out, file)
+                offsets = [np.zeros(0, dtype=np.int64)]
+                first, c0, z0, saved = 1, 0.0, 0.0, 0
+                if cached:
+                    saved = int(layer_ends[-1])
+                    _copy_file(cached_stream, tee, saved)
+                    offsets.append(layer_ends)
+                    first, c0, z0 = cached + 1, meta['c'], meta['z']
+                for table in pattern.iter_segments(first=first, c0=c0, z0=z0):
+                    rows = pattern.format_rows(table)
+                    tee.write(''.join(rows))
+                    lengths = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+                    layer_ends = np.cumsum(lengths)[pattern.rows_per_layer - 1::pattern.rows_per_layer]
+                    offsets.append(layer_ends + (offsets[-1][-1] if len(offsets[-1]) else 0))
+                    c0, z0 = table['c'][-1], table['z'][-1]
+                file.close()
+                buffer = io.BytesIO()
+                np.save(buffer, np.concatenate(offsets))
+                stored = os.path.getsize(temporary)
+                stored += self._replace(ends, buffer.getvalue())
+                stored += self._replace(info, json.dumps({'num_layers': n, 'c': float(c0), 'z': float(z0)}).encode())
+                os.replace(temporary, self._path(stream))
+            finally:
+                if not file.closed:
+                    file.close()
+                if os.path.exists(temporary):
+                    os.remove(temporary)
+        finally:
+            if cached_stream:
+                cached_stream.close()
+        return ('extend', saved, stored) if cached else ('miss', 0, stored)
+
+    def entries(self):
+        # (modification time, size, names) of each entry, the files of a layer stream counting as one entry
+        groups = {}
+        for name in os.listdir(self.directory):
+            if name == events_file or name.endswith('.tmp'):
+                continue
+            stem = name.split('.', 1)[0]
+            try:
+                stat = os.stat(self._path(name))
+            except FileNotFoundError: # Removed by another process since the listing
+                continue
+            mtime, size, names = groups.get(stem, (0.0, 0, []))
+            groups[stem] = (max(mtime, stat.st_mtime), size + stat.st_size, names + [name])
+        return list(groups.values())
+
+    def trim(self):
+        # Remove the least recently used entries until the cache fits in max_bytes
+        entries = sorted(self.entries())
+        total = sum(size for mtime, size, names in entries)
+        for mtime, size, names in entries:
+            if total <= self.max_bytes:
+                break
+            for name in names:
+                try:
+                    os.remove(self._path(name))
+                except FileNotFoundError: # Already removed by another process sharing the cache
+                    pass
+            total -= size
+        self.size = total
+
+    def stats(self):
+        # Counts of each kind of request, the bytes not regenerated, and the size of the cache
+        counts = {'hit': 0, 'body': 0, 'extend': 0, 'miss': 0}
+        saved = 0
+        for event, (requests, total) in self._events().items():
+            counts[event] = counts.get(event, 0) + requests
+            saved += total
+        entries = self.entries()
+        return {'requests': sum(counts.values()),
+                'hits': counts['hit'],
+                'body_reuses': counts['body'],
+                'extensions': counts['extend'],
+                'misses': counts['miss'],
+                'bytes_saved': saved,
+                'entries': len(entries),
+                'bytes_stored': sum(size for mtime, size, names in entries)}
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            os.remove(self._path(name))
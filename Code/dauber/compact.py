@@ -0,0 +1,166 @@
+# Compact gcode output for Dauber, using a subprogram for the repeating layers.
+# Only Z and the absolute C change from one pair of layers to the next, so the odd/even layer pair is written once
+# as a subprogram in incremental mode (G91) and the main program calls it num_layers/2 times with M98 P... L....
+# The file size no longer depends on the number of layers.
+# The rounding of the increments adds up over every call, so they are written with enough decimals to keep the total
+# drift from the unrolled program within max_drift.
+# expand() inlines the subprogram calls again and trace() follows the positions, so a compact program can be checked
+# against the unrolled one with max_deviation().
+
+import io
+import re
+import numpy as np
+
+from dauber import toolpath
+
+subprogram_number = 1000 # O number of the layer pair subprogram
+max_drift = 0.005        # Largest total difference in any axis from rounding the increments, half the 0.01 the unrolled programs are written to, [mm]
+min_decimals = 4         # Fewest decimals the increments are written with, [unitless]
+
+# Comments used in the subprogram for moves whose unrolled comment names the layer
+kind_comments = {toolpath.BLANK: 'Move without feeding',
+                 toolpath.CLIMB: 'Move up one layer height while feeding',
+                 toolpath.TRAVERSE: 'Feed across the line',
+                 toolpath.VERTICAL: 'Feed along a vertical',
+                 toolpath.DIAGONAL: 'Feed along the diagonal',
+                 toolpath.TRACE: 'Feed along the drawing'}
+
+def _comment(fmt, kind):
+    comment = fmt.split(' ; ', 1)[1].rstrip()
+    return kind_comments[kind] if '{' in comment else comment
+
+def increment_decimals(moves):
+    # Decimals to write the increments of moves incremental moves with, so their rounding adds up to at most max_drift
+    return max(min_decimals, int(np.ceil(np.log10(moves * 0.5 / max_drift))))
+
+def layer_block(pattern, parities, decimals=min_decimals):
+    # Incremental gcode for the layers with the given parities, starting and ending where the layers start.
+    # Each increment is rounded by at most half a unit in its last decimal.
+    number = '{:.' + str(decimals) + 'f}'
+    climb = 'G1 Z' + number + ' C' + number + ' F{:.2f} ; {} \n'
+    move = 'G1 X' + number + ' Y' + number + ' C' + number + ' F{:.2f} ; {} \n'
+    output = ''
+    x0, y0 = pattern.template[parities[0], 0]['x'], pattern.template[parities[0], 0]['y']
+    for p in parities:
+        for j in range(pattern.rows_per_layer):
+            x, y, z, c, f, kind, layer = pattern.template[p, j].tolist()
+            dc = pattern.template_dc[p, j]
+            fmt = pattern.layer_formats[p][j]
+            if kind == toolpath.CLIMB:
+                output += climb.format(pattern.template_dz[p, j], dc, f, _comment(fmt, kind))
+            else:
+                output += move.format(x - x0, y - y0, dc, f, _comment(fmt, kind))
+            x0, y0 = x, y
+    return output
+
+def settling_block(pattern, settling, decimals):
+    # Absolute gcode for the layers before a heightmap-adapted pattern settles into its template. The increments
+    # carry on from the end of the last of them, so it is written to their decimals rather than rounded to 0.01.
+    table = pattern.layer_segments(1, settling + 1)
+    rows = pattern.format_rows(table)
+    number = '.' + str(decimals) + 'f}'
+    fmt = pattern.layer_formats[settling % 2][-1].replace('.2f}', number).replace('{f:' + number, '{f:.2f}')
+    x, y, z, c, f, kind, layer = table[-1].tolist()
+    rows[-1] = fmt.format(x=x, y=y, z=z, c=c, f=f, layer=layer)
+    return ''.join(rows)
+
+def write(pattern, out, sample_id, subprogram=subprogram_number):
+    # Write the program for pattern to out, with the layers as calls to a subprogram holding one odd/even layer pair
+    # The first layers of a pattern adapted to a heightmap differ from the template, so they are written out in full
+    settling = 0 if pattern.layer_dc is None else len(pattern.layer_dc)
+    pairs = (pattern.num_layers - settling) // 2
+    if pairs < 1:
+        pattern.write(out, sample_id)
+        return
+    out.write(pattern.header(sample_id))
+    out.write(pattern.preamble())
+    out.write(''.join(fmt.format(x=x, y=y, c=0.0, f=f) for kind, x, y, f, fmt in pattern.prefix_moves()))
+    out.write(pattern.layer_separator)
+    decimals = increment_decimals((2 * pairs + 1) * pattern.rows_per_layer + 1)
+    if settling:
+        out.write(settling_block(pattern, settling, decimals))
+    out.write('M98 P{} L{} ; Deposit layers {} to {}, two layers per call \n'.format(subprogram, pairs, settling + 1, settling + 2 * pairs))
+    if (pattern.num_layers - settling) % 2:
+        out.write('G91 ; Relative positioning mode \n')
+        out.write(layer_block(pattern, [1], decimals))
+        out.write('G90 ; Absolute positioning mode \n')
+    out.write(pattern.escape())
+    out.write(' \nM30 ; End of program \n\n')
+    out.write('O{} ; One odd and one even layer \n'.format(subprogram))
+    out.write('G91 ; Relative positioning mode \n')
+    out.write(layer_block(pattern, [1, 0], decimals))
+    out.write('G90 ; Absolute positioning mode \n')
+    out.write('M99 ; Return from subprogram')
+
+def _words(line):
+    # Code and (letter, value) words of a line, ignoring the comment
+    code = line.split(';', 1)[0].split('(', 1)[0]
+    return [(m.group(1).upper(), m.group(2)) for m in re.finditer(r'([A-Za-z])\s*([-+]?[0-9]*\.?[0-9]*)', code)]
+
+def expand(lines):
+    # Yields the lines of a program with every M98 call replaced by the body of its subprogram, L times over
+    lines = [line.rstrip('\n') for line in lines]
+    subprograms = {}
+    main_end = len(lines)
+    for i, line in enumerate(lines):
+        words = _words(line)
+        if words and words[0][0] == 'O':
+            main_end = min(main_end, i)
+            body = []
+            for body_line in lines[i + 1:]:
+                if ('M', '99') in _words(body_line):
+                    break
+                body.append(body_line)
+            subprograms[int(words[0][1])] = body
+    for line in lines[:main_end]:
+        words = dict(_words(line))
+        if words.get('M') == '98':
+            body = subprograms[int(words['P'])]
+            for _ in range(int(words.get('L', 1))):
+                yield from body
+        elif words.get('M') != '30':
+            yield line
+
+def trace(lines):
+    # Absolute X/Y/Z/C at the end of every G1 move, following G90/G91 and G92, as an (N, 4) array
+    position = {'X': 0.0, 'Y': 0.0, 'Z': 0.0, 'C': 0.0}
+    relative = False
+    motion = None
+    ends = []
+    for line in lines:
+        words = _words(line)
+        codes = [value for letter, value in words if letter == 'G']
+        axes = {letter: float(value) for letter, value in words if letter in position}
+        for code in codes:
+            if code in ('90', '90.0'):
+                relative = False
+            elif code in ('91', '91.0'):
+                relative = True
+            elif code in ('0', '00', '1', '01'):
+                motion = int(code)
+        if '92' in codes:
+            position.update(axes)
+            continue
+        if not axes:
+            continue
+        for axis, value in axes.items():
+            position[axis] = position[axis] + value if relative else value
+        if motion == 1:
+            ends.append((position['X'], position['Y'], position['Z'], position['C']))
+    return np.array(ends).reshape(-1, 4)
+
+def deviation(pattern, sample_id='DEP-X-000'):
+    # Difference in X/Y/Z/C between the compact and unrolled programs at the end of every G1 move, as an (N, 4) array, [mm]
+    unrolled, compact = io.StringIO(), io.StringIO()
+    pattern.write(unrolled, sample_id)
+    write(pattern, compact, sample_id)
+    unrolled_path = trace(unrolled.getvalue().split('\n'))
+    compact_path = trace(expand(compact.getvalue().split('\n')))
+    if unrolled_path.shape != compact_path.shape:
+        raise ValueError('Compact program makes {} moves, unrolled program makes {}'.format(len(compact_path), len(unrolled_path)))
+    return np.abs(unrolled_path - compact_path)
+
+def max_deviation(pattern, sample_id='DEP-X-000'):
+    # Largest difference in X/Y/Z/C between the compact and unrolled programs over all G1 moves, [mm]. The rounding of
+    # the increments adds up over the layers, so this is normally the difference at the end of the last layer.
+    return deviation(pattern, sample_id).max(axis=0)
@@ -0,0 +1,37 @@
+# Streaming G-code output shared by the toolpath scripts.
+# Lines are written to the target as they are generated instead of being collected into one string,
+# so memory use does not depend on the number of layers and a partial program survives a crash.
+
+import sys
+
+buffer_size = 1 << 16 # Size of the write buffer used for files, [bytes]
+
+class GcodeWriter:
+    # target can be a filename, '-' for stdout, or anything with a write() method (e.g. a pipe)
+    def __init__(self, target, buffer_size=buffer_size):
+        if target == '-':
+            self.file = sys.stdout
+            self.owns_file = False
+        elif hasattr(target, 'write'):
+            self.file = target
+            self.owns_file = False
+        else:
+            self.file = open(target, 'w', buffering=buffer_size)
+            self.owns_file = True
+        self.chars_written = 0 # Number of characters written so far, [unitless]
+
+    def write(self, text):
+        self.file.write(text)
+        self.chars_written += len(text)
+
+    def close(self):
+        if self.owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,324 @@
+# 2D geometry for Dauber drawings: polylines read from DXF, CSV or JSON files, and the order to deposit them in.
+# The drawing is read as polylines (arcs and circles are split into chords), polylines that meet end to end are joined
+# into paths, and the paths are ordered and oriented so the tool travels as little as possible without feeding:
+# a nearest-neighbour tour using a uniform grid over the path ends, improved with 2-opt moves between nearby paths.
+# Both steps only look at neighbouring grid cells or a window of the tour, so they scale with the number of paths.
+
+import csv
+import json
+import math
+import numpy as np
+
+join_tolerance = 1e-4 # Distance within which two path ends are treated as the same point, [mm]
+window = 50           # Largest number of paths reversed at once by a 2-opt move, [unitless]
+max_passes = 10       # Largest number of 2-opt passes over the tour, [unitless]
+min_gain = 0.002      # Fraction of the travel a 2-opt pass must save for another pass to be made, [unitless]
+
+# --- Reading ---
+
+def arc_points(cx, cy, r, start, sweep, tolerance):
+    # Points along an arc from angle start through sweep, [rad], with chords at most tolerance from the arc
+    step = 2 * math.acos(1 - tolerance / r) if tolerance < r else math.pi / 2
+    n = max(1, math.ceil(abs(sweep) / step))
+    angle = start + sweep * np.linspace(0, 1, n + 1)
+    return np.column_stack([cx + r * np.cos(angle), cy + r * np.sin(angle)])
+
+def bulge_points(p0, p1, bulge, tolerance):
+    # Points from p0 to p1 along a DXF polyline segment, which is an arc when its bulge is not zero
+    p0, p1 = np.asarray(p0, dtype=float), np.asarray(p1, dtype=float)
+    chord = p1 - p0
+    length = np.hypot(*chord)
+    if abs(bulge) < 1e-12 or length == 0:
+        return np.array([p0, p1])
+    left = np.array([-chord[1], chord[0]]) / length
+    center = (p0 + p1) / 2 + left * length / 2 * (1 - bulge**2) / (2 * bulge)
+    r = np.hypot(*(p0 - center))
+    start = math.atan2(p0[1] - center[1], p0[0] - center[0])
+    return arc_points(center[0], center[1], r, start, 4 * math.atan(bulge), tolerance)
+
+def _vertex_points(vertices, closed, tolerance):
+    # Points of a polyline from its (x, y, bulge) vertices
+    if closed:
+        vertices = vertices + vertices[:1]
+    pieces = [bulge_points(a[:2], b[:2], a[2], tolerance) for a, b in zip(vertices[:-1], vertices[1:])]
+    if not pieces:
+        return np.array([v[:2] for v in vertices], dtype=float).reshape(-1, 2)
+    return np.vstack([pieces[0]] + [piece[1:] for piece in pieces[1:]])
+
+def _entities(filename):
+    # (type, [(group code, value), ...]) of each entity in the ENTITIES section of a DXF file
+    with open(filename, errors='replace') as file:
+        lines = file.read().splitlines()
+    pairs = [(int(code), value.strip()) for code, value in zip(lines[0::2], lines[1::2])]
+    entities = []
+    in_entities = False
+    for i, (code, value) in enumerate(pairs):
+        if code == 2 and value == 'ENTITIES' and pairs[i - 1] == (0, 'SECTION'):
+            in_entities = True
+        elif code == 0 and in_entities:
+            if value == 'ENDSEC':
+                break
+            entities.append((value, []))
+        elif in_entities and entities:
+            entities[-1][1].append((code, value))
+    return entities
+
+def read_dxf(filename, tolerance=0.01):
+    # Polylines of the LINE, ARC, CIRCLE, LWPOLYLINE and POLYLINE entities of a DXF file, in drawing units.
+    # Blocks (INSERT) and other entities are skipped.
+    polylines = []
+    polyline = None # Vertices of the POLYLINE being read, until its SEQEND
+    for kind, groups in _entities(filename):
+        values = {}
+        for code, value in groups:
+            values.setdefault(code, value)
+        number = lambda code, default=0.0: float(values.get(code, default))
+        if kind == 'LINE':
+            polylines.append(np.array([[number(10), number(20)], [number(11), number(21)]]))
+        elif kind == 'ARC':
+            start, end = math.radians(number(50)), math.radians(number(51))
+            sweep = (end - start) % (2 * math.pi) or 2 * math.pi # Arcs run counterclockwise from start to end
+            polylines.append(arc_points(number(10), number(20), number(40), start, sweep, tolerance))
+        elif kind == 'CIRCLE':
+            polylines.append(arc_points(number(10), number(20), number(40), 0.0, 2 * math.pi, tolerance))
+        elif kind == 'LWPOLYLINE':
+            vertices = []
+            for code, value in groups:
+                if code == 10:
+                    vertices.append([float(value), 0.0, 0.0])
+                elif code == 20 and vertices:
+                    vertices[-1][1] = float(value)
+                elif code == 42 and vertices:
+                    vertices[-1][2] = float(value)
+            polylines.append(_vertex_points(vertices, int(number(70)) & 1, tolerance))
+        elif kind == 'POLYLINE':
+            polyline = ([], int(number(70)) & 1)
+        elif kind == 'VERTEX' and polyline is not None:
+            polyline[0].append([number(10), number(20), number(42)])
+        elif kind == 'SEQEND' and polyline is not None:
+            polylines.append(_vertex_points(polyline[0], polyline[1], tolerance))
+            polyline = None
+    return [points for points in polylines if len(points) > 1]
+
+def read_csv(filename):
+    # Polylines from a CSV file with x and y columns, one row per point. Rows with the same path value, if there is a
+    # path column, make up one polyline; otherwise all the rows make one polyline.
+    with open(filename, newline='') as file:
+        rows = list(csv.DictReader(file))
+    polylines = {}
+    for row in rows:
+        polylines.setdefault(row.get('path', ''), []).append((float(row['x']), float(row['y'])))
+    return [np.array(points) for points in polylines.values() if len(points) > 1]
+
+def read_json(filename):
+    # Polylines from a JSON list, each a list of [x, y] points or {"points": [[x, y], ...], "closed": true}
+    with open(filename) as file:
+        data = json.load(file)
+    polylines = []
+    for item in data:
+        if isinstance(item, dict):
+            points = np.array(item['points'], dtype=float).reshape(-1, 2)
+            if item.get('closed', False):
+                points = np.vstack([points, points[:1]])
+        else:
+            points = np.array(item, dtype=float).reshape(-1, 2)
+        if len(points) > 1:
+            polylines.append(points)
+    return polylines
+
+def load(filename, scale=1.0, tolerance=0.01):
+    # Polylines of a drawing in [mm], multiplying the drawing units by scale (e.g. 25.4 for a drawing in inches).
+    # Arcs are split into chords at most tolerance [mm] from the arc.
+    if filename.lower().endswith('.dxf'):
+        polylines = read_dxf(filename, tolerance / scale)
+    elif filename.lower().endswith('.csv'):
+        polylines = read_csv(filename)
+    elif filename.lower().endswith('.json'):
+        polylines = read_json(filename)
+    else:
+        raise ValueError('Unknown drawing format {!r}, expected a .dxf, .csv or .json file'.format(filename))
+    if not polylines:
+        raise ValueError('Drawing {} has no lines to deposit'.format(filename))
+    return [points * scale for points in polylines]
+
+# --- Joining ---
+
+def join(polylines, tolerance=join_tolerance):
+    # Join polylines that meet end to end into longer paths, in either direction
+    starts = np.round(np.array([points[0] for points in polylines]) / tolerance).astype(np.int64)
+    ends = np.round(np.array([points[-1] for points in polylines]) / tolerance).astype(np.int64)
+    start_keys, end_keys = list(map(tuple, starts.tolist())), list(map(tuple, ends.tolist()))
+    at = {} # Polylines with an end at each point
+    for i, (start, end) in enumerate(zip(start_keys, end_keys)):
+        at.setdefault(start, []).append(i)
+        at.setdefault(end, []).append(i)
+    used = [False] * len(polylines)
+
+    def take(key):
+        # An unused polyline with an end at key, oriented to start there, and the key of its other end
+        for i in at[key]:
+            if not used[i]:
+                used[i] = True
+                if start_keys[i] == key:
+                    return polylines[i], end_keys[i]
+                return polylines[i][::-1], start_keys[i]
+        return None, None
+
+    paths = []
+    for i, points in enumerate(polylines):
+        if used[i]:
+            continue
+        used[i] = True
+        first, last = start_keys[i], end_keys[i]
+        pieces = [points]
+        while last != first:
+            piece, key = take(last)
+            if piece is None:
+                break
+            pieces.append(piece[1:])
+            last = key
+        while last != first:
+            piece, key = take(first)
+            if piece is None:
+                break
+            pieces.insert(0, piece[::-1][:-1])
+            first = key
+        paths.append(np.vstack(pieces) if len(pieces) > 1 else points)
+    return paths
+
+def merge_short(points, min_length):
+    # The points of a path without those closer than min_length to the point kept before them, so each chord is at
+    # least min_length long. A short last chord is merged into the one before it. A path shorter than min_length
+    # keeps only its two ends.
+    xy = points.tolist()
+    kept = [0]
+    for i in range(1, len(xy) - 1):
+        if math.hypot(xy[i][0] - xy[kept[-1]][0], xy[i][1] - xy[kept[-1]][1]) >= min_length:
+            kept.append(i)
+    if len(kept) > 1 and math.hypot(xy[-1][0] - xy[kept[-1]][0], xy[-1][1] - xy[kept[-1]][1]) < min_length:
+        kept.pop()
+    return points[kept + [len(xy) - 1]]
+
+# --- Ordering ---
+
+class _Grid:
+    # Uniform grid over the ends of the paths not yet deposited, for nearest neighbour queries
+    def __init__(self, points, ids, xy):
+        self.points = xy # points as a list, which is faster to index one at a time
+        self.ids = ids
+        low, high = points[ids].min(axis=0), points[ids].max(axis=0)
+        w, h = (high - low).tolist()
+        self.cell = max(math.sqrt(w * h / len(ids)), max(w, h) / len(ids), 1e-9)
+        self.low = low.tolist()
+        self.key = {}
+        self.cells = {}
+        for i, key in zip(ids.tolist(), np.floor((points[ids] - low) / self.cell).astype(np.int64).tolist()):
+            key = tuple(key)
+            self.key[i] = key
+            self.cells.setdefault(key, []).append(i)
+        self.size = len(ids)
+
+    def remove(self, i):
+        self.cells[self.key.pop(i)].remove(i)
+        self.size -= 1
+
+    def nearest(self, p, max_ring=12):
+        # Nearest point to p in the grid, or None when it is further than max_ring cells away
+        px, py = p
+        ci, cj = math.floor((px - self.low[0]) / self.cell), math.floor((py - self.low[1]) / self.cell)
+        best, best_distance = None, math.inf
+        for r in range(max_ring + 1):
+            if r == 0:
+                ring = [(ci, cj)]
+            else:
+                ring = ([(ci + d, cj - r) for d in range(-r, r + 1)] + [(ci + d, cj + r) for d in range(-r, r + 1)] +
+                        [(ci - r, cj + d) for d in range(-r + 1, r)] + [(ci + r, cj + d) for d in range(-r + 1, r)])
+            for key in ring:
+                for i in self.cells.get(key, ()):
+                    x, y = self.points[i]
+                    distance = math.hypot(x - px, y - py)
+                    if distance < best_distance:
+                        best, best_distance = i, distance
+            if best_distance <= r * self.cell: # Points in the next ring are at least r cells away
+                return best
+        return None
+
+def nearest_neighbour(starts, ends, position):
+    # Tour of the paths, each time going to the nearest unvisited path end, and whether each path is reversed
+    n = len(starts)
+    points = np.concatenate([starts, ends]) # Point i is the start of path i, point n + i its end
+    xy = points.tolist()
+    alive = np.ones(2 * n, dtype=bool)
+    grid = _Grid(points, np.arange(2 * n), xy)
+    built = grid.size
+    order = np.empty(n, dtype=np.int64)
+    reverse = np.zeros(n, dtype=bool)
+    position = tuple(position)
+    for step in range(n):
+        i = grid.nearest(position)
+        if i is None: # Nothing nearby, search all the remaining ends
+            ids = grid.ids[alive[grid.ids]]
+            i = int(ids[np.argmin(np.hypot(*(points[ids] - position).T))])
+        path = i % n
+        order[step], reverse[step] = path, i >= n
+        position = xy[path + n] if i < n else xy[path]
+        for j in (path, path + n):
+            alive[j] = False
+            grid.remove(j)
+        if 0 < grid.size < built / 2:
+            grid = _Grid(points, np.flatnonzero(alive), xy) # Keep the cells small as the paths are used up
+            built = grid.size
+    return order, reverse
+
+def two_opt(order, reverse, starts, ends, position):
+    # Improve a tour with 2-opt moves: reversing the run of paths i..j (and the direction of each) when that shortens
+    # the travel from the exit of path i-1 to the entry of path j+1. For each run length, the gain of every run is
+    # found at once and the best runs that do not touch are reversed together.
+    n = len(order)
+    order, reverse = order.copy(), reverse.copy()
+    entry = np.where(reverse[:, None], ends[order], starts[order])
+    exit = np.where(reverse[:, None], starts[order], ends[order])
+    previous = np.empty_like(exit) # Exit of the path before each path, or the start position
+    travel = np.hypot(*(np.vstack([[position], exit[:-1]]) - entry).T).sum()
+    for _ in range(max_passes):
+        gained = 0.0
+        for k in range(min(window, n)):
+            previous[0], previous[1:] = position, exit[:-1]
+            m = n - k - 1           # Runs a..a+k with a path after them; the run ending the tour has no travel after it
+            old = np.hypot(*(previous[:n - k] - entry[:n - k]).T)
+            new = np.hypot(*(previous[:n - k] - exit[k:]).T)
+            old[:m] += np.hypot(*(exit[k:n - 1] - entry[k + 1:]).T)
+            new[:m] += np.hypot(*(entry[:m] - entry[k + 1:]).T)
+            gain = old - new
+            candidates = np.flatnonzero(gain > 1e-9)
+            if not len(candidates):
+                continue
+            taken = np.zeros(n, dtype=bool)
+            for a in candidates[np.argsort(-gain[candidates])]:
+                # Runs sharing a path or the travel between two paths would change each other's gain
+                if taken[max(a - 1, 0):a + k + 2].any():
+                    continue
+                b = a + k + 1
+                taken[a:b] = True
+                order[a:b], reverse[a:b] = order[a:b][::-1], ~reverse[a:b][::-1]
+                entry[a:b], exit[a:b] = exit[a:b][::-1].copy(), entry[a:b][::-1].copy()
+                gained += gain[a]
+        if gained < min_gain * travel: # Later passes only shorten the travel a little
+            break
+        travel -= gained
+    return order, reverse
+
+def travel_length(paths, position=(0.0, 0.0)):
+    # Length of the moves between the paths in order, starting from position, [mm]
+    entry = np.array([path[0] for path in paths])
+    exit = np.vstack([[position], [path[-1] for path in paths[:-1]]])
+    return np.hypot(*(entry - exit).T).sum()
+
+def order_paths(paths, position=(0.0, 0.0)):
+    # The paths ordered and oriented to keep the travel between them short, starting from position
+    position = np.asarray(position, dtype=float)
+    starts = np.array([path[0] for path in paths])
+    ends = np.array([path[-1] for path in paths])
+    order, reverse = nearest_neighbour(starts, ends, position)
+    order, reverse = two_opt(order, reverse, starts, ends, position)
+    return [paths[i][::-1] if r else paths[i] for i, r in zip(order, reverse)]
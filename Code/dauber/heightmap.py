@@ -0,0 +1,84 @@
+# Heightmap-based feed planning for Dauber patterns.
+# The flat-layer model feeds every move the volume of a length x deposition_diameter x layer_height box, but where
+# moves cross or meet (the corners of an N, the diagonal over the verticals, the climb spots) the tool passes over
+# material it has just put down. Here a 2D grid of deposit heights is kept under the path. Each move fills the cells
+# within deposition_diameter/2 of it up to the tool height, and is fed the volume it actually fills.
+# The footprint of each template move is found once, as the flat indices of its cells, so stamping a move only reads
+# and writes those cells. The layers repeat, so once the heights below the tool (z - H) come back the same two layers
+# apart the fill is periodic: only the first few layers are stamped and the rest reuse the last two.
+
+import numpy as np
+
+cell_size = 0.1 # Default size of a heightmap cell, [mm]
+
+def footprint(x, y, shape, low, cell, x0, y0, x1, y1, radius):
+    # Flat indices of the cells whose centres are within radius of the segment from (x0, y0) to (x1, y1)
+    i0 = max(int(np.floor((min(x0, x1) - radius - low[0]) / cell)), 0)
+    i1 = min(int(np.ceil((max(x0, x1) + radius - low[0]) / cell)) + 1, shape[0])
+    j0 = max(int(np.floor((min(y0, y1) - radius - low[1]) / cell)), 0)
+    j1 = min(int(np.ceil((max(y0, y1) + radius - low[1]) / cell)) + 1, shape[1])
+    px, py = x[i0:i1, None], y[None, j0:j1]
+    dx, dy = x1 - x0, y1 - y0
+    length2 = dx * dx + dy * dy
+    t = np.clip(((px - x0) * dx + (py - y0) * dy) / length2, 0, 1) if length2 > 0 else 0.0
+    inside = (px - x0 - t * dx)**2 + (py - y0 - t * dy)**2 <= radius * radius
+    ii, jj = np.nonzero(inside)
+    return (ii + i0) * shape[1] + (jj + j0)
+
+def plan(template, template_dc, deposition_diameter, layer_height, num_layers, cell=cell_size):
+    # Volume filled by each move of each layer, [mm^3], from a template like Pattern.template (row 0 of each parity
+    # the climb, rows with no feed left out). Returns the volumes of the first T layers as a (T, m) array and the (2, m)
+    # volumes of the layers of each parity from layer T+1 on, when every layer repeats the one two before it.
+    # T is even, or num_layers when the fill never settles.
+    radius = deposition_diameter / 2
+    low = np.array([template['x'].min(), template['y'].min()]) - radius - cell
+    high = np.array([template['x'].max(), template['y'].max()]) + radius + cell
+    shape = tuple(np.ceil((high - low) / cell).astype(int) + 1)
+    x = low[0] + cell * np.arange(shape[0]) # Cell centres, [mm]
+    y = low[1] + cell * np.arange(shape[1])
+
+    # Cells under each move that feeds: a disc for the climb, a capsule from the previous position for the others.
+    # Layers of the other parity often make the same moves backwards, which cover the same cells.
+    m = template.shape[1]
+    cells = [[None] * m for p in range(2)]
+    found = {}
+    covered = np.zeros(shape[0] * shape[1], dtype=bool)
+    for p in range(2):
+        x0, y0 = template[p, 0]['x'], template[p, 0]['y']
+        for j in range(m):
+            x1, y1 = template[p, j]['x'], template[p, j]['y']
+            if template_dc[p, j] > 0:
+                ends = tuple(sorted([(x0, y0), (x1, y1)]))
+                if ends not in found:
+                    found[ends] = footprint(x, y, shape, low, cell, x0, y0, x1, y1, radius)
+                cells[p][j] = found[ends]
+                covered[cells[p][j]] = True
+            x0, y0 = x1, y1
+    union = np.flatnonzero(covered)
+
+    heights = np.zeros(shape[0] * shape[1]) # Top of the deposit in each cell, [mm]
+    volumes, below = [], []
+    for layer in range(1, num_layers + 1):
+        p = layer % 2
+        z = layer * layer_height
+        volume = np.zeros(m)
+        for j in range(m):
+            if cells[p][j] is None:
+                continue
+            h = heights[cells[p][j]]
+            volume[j] = np.maximum(z - h, 0).sum() * cell * cell
+            heights[cells[p][j]] = np.maximum(h, z)
+        volumes.append(volume)
+        below.append(z - heights[union])
+        if (layer > 2 and np.allclose(below[-1], below[-3], rtol=0, atol=1e-6 * layer_height)
+                and np.allclose(volumes[-1], volumes[-3])):
+            # The heights under the tool are back to what they were two layers ago, so from layer-1 on each layer
+            # fills like the one two before it
+            steady = np.zeros((2, m))
+            steady[p], steady[1 - p] = volumes[-1], volumes[-2]
+            first = layer - 2 + layer % 2
+            return np.array(volumes[:first]).reshape(-1, m), steady
+    steady = np.array([volumes[-1], volumes[-1]])
+    if len(volumes) > 1:
+        steady[(len(volumes) - 1) % 2] = volumes[-2]
+    return np.array(volumes).reshape(-1, m), steady
@@ -0,0 +1,197 @@
+# Build plate programs for Dauber: several line, N and pillar samples deposited by one program.
+# Layer k of every part is deposited in turn before any part starts layer k+1, which shares the approach and spindle
+# start-up between the parts and gives each part time to cool between its layers. Between parts the tool retracts
+# above the tallest part on the plate, rapids to the next part and feeds back down onto the top of that part.
+# The parts of each round are visited in nearest-neighbour order from where the tool is.
+# C is kept as one running total for the plate, increased only by the depositing moves of each part.
+
+import json
+import numpy as np
+
+from dauber import toolpath, sweep
+
+plate_prefix = 'PLATE-' # Plate ID prefix
+
+climb_format = 'G1 Z{z:.2f} C{c:.2f} F{f:.2f} ; {part} move up to layer {layer} \n'
+move_format = 'G1 X{x:.2f} Y{y:.2f} C{c:.2f} F{f:.2f} ; {part} layer {layer} {kind} \n'
+
+class Part:
+    # One sample on the plate, with its segment table moved to its place
+    def __init__(self, pattern, sample_num, x, y):
+        self.pattern = pattern
+        self.sample_id = pattern.sample_id(sample_num)
+        self.x, self.y = x, y # Offset of the part on the plate, [mm]
+        self.table = pattern.segments()
+        self.table['x'] += x
+        self.table['y'] += y
+        self.dc = np.diff(self.table['c'], prepend=0.0) # Wire fed by each move of the part, [mm]
+        self.duration = 60 / self.table['f']            # Duration of each move, [s]
+        self.bounds = np.array([self.table['x'].min(), self.table['y'].min(), self.table['x'].max(), self.table['y'].max()])
+        radius = pattern.deposition_diameter / 2
+        self.footprint = self.bounds + [-radius, -radius, radius, radius]
+        # Rows of each layer, layer 0 being the blank moves before the first layer
+        self.layer_start = np.searchsorted(self.table['layer'], np.arange(self.table['layer'].max() + 2))
+
+    def rows(self, layer):
+        if layer + 1 >= len(self.layer_start):
+            return slice(0, 0)
+        return slice(self.layer_start[layer], self.layer_start[layer + 1])
+
+    def end(self, layer):
+        # Where the tool is after depositing a layer: the end of its last move
+        rows = self.rows(layer)
+        if rows.stop <= rows.start:
+            return self.start(layer)
+        last = self.table[rows.stop - 1]
+        return last['x'], last['y']
+
+    def start(self, layer):
+        # Where the tool starts depositing a layer: the climb position, or the start of the blank moves
+        if layer == 0:
+            sx, sy = self.pattern.start_position()
+            return sx + self.x, sy + self.y
+        first = self.table[self.rows(layer).start]
+        return first['x'], first['y']
+
+class Plate:
+    def __init__(self, parts, approach_height=20.0, clearance=2.0, plunge_rate=30.0, initial_pause=False):
+        self.parts = parts
+        self.approach_height = approach_height # Height above the plate to rapid to when the program starts, [mm]
+        self.clearance = clearance             # Height above the tallest part to travel between parts at, [mm]
+        self.plunge_rate = plunge_rate         # Rate to feed down onto a part at, [mm/min]
+        self.initial_pause = initial_pause     # Whether to wait for user input before the first layer
+        if clearance <= 0 or plunge_rate <= 0:
+            raise ValueError('The clearance height and plunge rate must be positive')
+        if len({part.pattern.wire_diameter for part in parts}) > 1:
+            raise ValueError('All parts on a plate are fed from the same wire, set one wire_diameter for the plate')
+        for i, a in enumerate(parts):
+            for b in parts[i + 1:]:
+                if (a.footprint[0] < b.footprint[2] and b.footprint[0] < a.footprint[2] and
+                        a.footprint[1] < b.footprint[3] and b.footprint[1] < a.footprint[3]):
+                    raise ValueError('Parts {} and {} overlap on the plate'.format(a.sample_id, b.sample_id))
+        self.visits = self.plan()
+
+    def plan(self):
+        # Order of the (round, part) visits, each round visiting the parts nearest first from where the tool is
+        rounds = max(part.layer_start.size - 1 for part in self.parts)
+        position = np.array([0.0, 0.0])
+        visits = []
+        self.travel = 0.0 # Distance travelled between parts in XY, [mm]
+        for layer in range(rounds):
+            active = [part for part in self.parts if part.rows(layer).stop > part.rows(layer).start]
+            starts = np.array([part.start(layer) for part in active]).reshape(-1, 2)
+            remaining = list(range(len(active)))
+            while remaining:
+                distance = np.hypot(*(starts[remaining] - position).T)
+                nearest = remaining.pop(int(np.argmin(distance)))
+                self.travel += distance.min()
+                position = np.array(active[nearest].end(layer)) # The next part is found from where this one ends
+                visits.append((layer, active[nearest]))
+        return visits
+
+    def plunge_time(self, height):
+        # Time to feed down from the travel height to a part, [s]
+        return height / self.plunge_rate * 60
+
+    def total_time(self):
+        # Time spent feeding, plunging and dwelling, not counting rapids or blank moves, as in the sample headers, [min]
+        time = 0.0
+        top = {id(part): 0.0 for part in self.parts}
+        safe = self.approach_height
+        for layer, part in self.visits:
+            rows = part.rows(layer)
+            blank = part.table['kind'][rows] == toolpath.BLANK
+            time += part.duration[rows][~blank].sum() + self.plunge_time(safe - top[id(part)])
+            if layer == 1:
+                time += part.pattern.dwell_time()
+            top[id(part)] = part.table['z'][rows].max()
+            safe = max(top.values()) + self.clearance
+        return time / 60
+
+    def header(self, plate_id):
+        output =  '; Plate ID:                   {} \n'.format(plate_id)
+        output += '; ~~~ Arguments used for gcode generation ~~~\n'
+        output += '; Approach Height:            {:7.2f} [mm] \n'.format(self.approach_height)
+        output += '; Clearance Height:           {:7.2f} [mm] \n'.format(self.clearance)
+        output += '; Plunge Rate:                {:7.2f} [mm/min] \n'.format(self.plunge_rate)
+        output += '; Wire Diameter:              {:7.2f} [mm] \n'.format(self.parts[0].pattern.wire_diameter)
+        output += '; Number of Parts:            {:7.0f} [unitless] \n'.format(len(self.parts))
+        output += '; Initial Preheating Pause:      {} \n'.format(self.initial_pause)
+        output += '; ~~~ Parts ~~~\n'
+        for part in self.parts:
+            output += '; {} at X{:.2f} Y{:.2f}, {} layers, {:.2f} [mm] of wire \n'.format(
+                part.sample_id, part.x, part.y, part.pattern.num_layers, part.dc.sum())
+        output += '; ~~~ Calculated Values ~~~\n'
+        output += '; Travel Distance:            {:7.2f} [mm] \n'.format(self.travel)
+        output += '; Wire Fed:                   {:7.2f} [mm] \n'.format(sum(part.dc.sum() for part in self.parts))
+        output += '; Total Time:                 {:7.2f} [min] \n\n'.format(self.total_time())
+        return output
+
+    def write(self, out, plate_id):
+        # Write the whole plate program to out (anything with a write() method, such as a GcodeWriter)
+        out.write(self.header(plate_id))
+        out.write(toolpath.program_start)
+        out.write('G0 Z{:.2f} ; Rapid to the approach height \n'.format(self.approach_height))
+        spindle_speed = None
+        c = 0.0
+        top = {id(part): 0.0 for part in self.parts}
+        safe = self.approach_height
+        z = self.approach_height
+        first = True
+        for layer, part in self.visits:
+            if z < safe:
+                out.write('G0 Z{:.2f} ; Retract above the parts \n'.format(safe))
+            x, y = part.start(layer)
+            out.write('\nG0 X{:.2f} Y{:.2f} ; Rapid to {} layer {} \n'.format(x, y, part.sample_id, layer))
+            if part.pattern.spindle_speed != spindle_speed:
+                spindle_speed = part.pattern.spindle_speed
+                out.write('M3 S{} ; Start the spindle \n'.format(spindle_speed))
+            if first:
+                out.write('G93 ; Turn on Inverse Time mode \n')
+            out.write('G1 Z{:.2f} F{:.2f} ; Feed down onto {} \n'.format(top[id(part)], 60 / self.plunge_time(safe - top[id(part)]), part.sample_id))
+            if first and self.initial_pause:
+                out.write('M0 ; Pause for operator to allow preheating \n')
+            first = False
+            if layer == 1 and part.pattern.dwell_time() > 0:
+                out.write('G4 P{:.2f} ; Pause at zero height \n'.format(part.pattern.dwell_time()))
+            rows = part.rows(layer)
+            table = part.table[rows]
+            cs = c + np.cumsum(part.dc[rows])
+            out.write(''.join((climb_format if kind == toolpath.CLIMB else move_format).format(
+                x=x, y=y, z=z, c=c, f=f, part=part.sample_id, layer=layer, kind=toolpath.kind_names[kind])
+                for (x, y, z, _, f, kind, _), c in zip(table.tolist(), cs.tolist())))
+            c = cs[-1]
+            z = table['z'][-1]
+            top[id(part)] = table['z'].max()
+            safe = max(top.values()) + self.clearance
+        # The escape is the one of the part deposited last, raised first if it would not clear the other parts
+        last = self.visits[-1][1].pattern
+        lift = safe - (z + last.escape_move()[0])
+        if lift > 0:
+            out.write('G0 Z{:.2f} ; Retract so the escape clears the parts \n'.format(z + lift))
+        out.write(last.escape())
+
+def plate_id(plate_num):
+    return plate_prefix + str(plate_num).zfill(3)
+
+def load_layout(filename, first_sample=1):
+    # Parts of a plate from a JSON layout: plate settings, a grid (origin, spacing and columns) and a list of parts.
+    # Each part names its pattern and parameters like a sweep row, and may give its own x and y. Lists in a part are swept
+    # as in a sweep grid, giving one part for each combination.
+    # A wire_diameter given for the plate applies to every part that does not set one.
+    with open(filename) as file:
+        layout = json.load(file)
+    rows = sweep.assign_sample_nums([row for part in layout['parts'] for row in sweep.expand_grid(part)], first_sample)
+    if 'wire_diameter' in layout: # The wire is shared by all the parts
+        for row in rows:
+            row.setdefault('wire_diameter', layout['wire_diameter'])
+    origin = layout.get('origin', [0.0, 0.0])
+    spacing = layout.get('spacing', [25.0, 25.0])
+    columns = layout.get('columns', int(np.ceil(np.sqrt(len(rows)))))
+    parts = []
+    for i, row in enumerate(rows):
+        x = float(row.pop('x', origin[0] + (i % columns) * spacing[0]))
+        y = float(row.pop('y', origin[1] + (i // columns) * spacing[1]))
+        parts.append(Part(sweep.make_pattern(row), row['sample_num'], x, y))
+    settings = {k: layout[k] for k in ('approach_height', 'clearance', 'plunge_rate', 'initial_pause') if k in layout}
+    return Plate(parts, **settings)
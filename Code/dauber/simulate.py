@@ -0,0 +1,297 @@
+# Parser and simulator for the gcode written by the Dauber toolpath scripts.
+# parse() reads a program in one streaming pass, a few megabytes at a time, into a NumPy table with one row per
+# motion, dwell or G92 line. Each chunk is split into words with array operations on its bytes rather than line by line.
+# simulate() then works out positions, durations and wire use for the whole table at once, respecting inverse time F
+# under G93, and check() compares the results with the calculated values in the header.
+
+import re
+import numpy as np
+
+pi = 3.14159
+
+chunk_bytes = 1 << 22 # Size of the pieces a program is read in, [bytes]
+chunk_lines = 1 << 16 # Number of lines joined into one piece when parsing lines rather than a file, [unitless]
+
+# --- Line codes ---
+RAPID = 0  # G0
+FEED = 1   # G1
+DWELL = 4  # G4
+SET = 92   # G92
+
+line_dtype = np.dtype([('code', 'i2'),          # One of the line codes above
+                       ('x', 'f8'),             # X word, NaN if not given, [mm]
+                       ('y', 'f8'),             # Y word, NaN if not given, [mm]
+                       ('z', 'f8'),             # Z word, NaN if not given, [mm]
+                       ('c', 'f8'),             # C word, NaN if not given, [mm]
+                       ('f', 'f8'),             # F word, carried over from earlier lines under G94
+                       ('p', 'f8'),             # P word of a dwell, [s]
+                       ('relative', '?'),       # Whether G91 was in effect
+                       ('inverse_time', '?'),   # Whether G93 was in effect
+                       ('line', 'i8')])         # Line number in the file, starting at 1
+
+header_pattern = re.compile(r';\s*([^:~]+?)\s*:?\s+(\S+)\s*(\[[^\]]*\])?\s*$')
+
+supported_g = {0, 1, 4, 17, 21, 54, 90, 91, 92, 93, 94}
+supported_m = {0, 3, 5}
+
+def parse_header(line, section, header):
+    # Add '; Name: value [unit]' comments to header[section]
+    if '~~~ Calculated Values ~~~' in line:
+        return 'calculated'
+    match = header_pattern.match(line)
+    if match:
+        name, value = match.group(1).rstrip(':').strip(), match.group(2)
+        try:
+            value = float(value)
+        except ValueError:
+            pass
+        header[section].setdefault(name.lower(), value)
+    return section
+
+def _pieces(source):
+    # Bytes of a program (a filename or an iterable of lines) in pieces that end at a line end
+    if isinstance(source, str):
+        with open(source, 'rb') as file:
+            rest = b''
+            while True:
+                data = file.read(chunk_bytes)
+                if not data:
+                    break
+                data = rest + data
+                end = data.rfind(b'\n') + 1
+                rest = data[end:]
+                if end:
+                    yield data[:end]
+            if rest:
+                yield rest + b'\n'
+        return
+    lines = []
+    for line in source:
+        lines.append(line if line.endswith('\n') else line + '\n')
+        if len(lines) >= chunk_lines:
+            yield ''.join(lines).encode()
+            lines = []
+    if lines:
+        yield ''.join(lines).encode()
+
+def _fill(events, lines, carry):
+    # Forward fill per-line modal values: events[i] >= 0 where line i sets the mode, carry before the first one
+    last = np.maximum.accumulate(np.where(events >= 0, np.arange(lines), -1))
+    return np.where(last >= 0, events[np.maximum(last, 0)], carry)
+
+def _words(data):
+    # Letters, values and line indices of the words in a piece, ignoring comments after ';' or '('
+    b = np.frombuffer(data, dtype=np.uint8)
+    line_end = np.flatnonzero(b == ord('\n'))
+    line_start = np.concatenate(([0], line_end[:-1] + 1))
+    # Mark the bytes from the first comment character of each line to its end
+    comment_start = np.flatnonzero((b == ord(';')) | (b == ord('(')))
+    first = np.searchsorted(comment_start, line_start)
+    has_comment = first < len(comment_start)
+    has_comment[has_comment] = comment_start[first[has_comment]] < line_end[has_comment]
+    marker = np.zeros(len(b) + 1, dtype=np.int8)
+    marker[comment_start[first[has_comment]]] = 1
+    marker[line_end[has_comment]] = -1
+    comment = np.cumsum(marker[:-1], dtype=np.int8).view(bool)
+    letter = ((b | 0x20) - ord('a')).astype(np.uint8) < 26
+    letter &= ~comment
+    numbers = b.copy()
+    numbers[letter] = ord(' ')
+    numbers = numbers[~comment].tobytes().decode('ascii', 'replace')
+    values = np.fromstring(numbers, sep=' ') if numbers.strip() else np.zeros(0)
+    letter_position = np.flatnonzero(letter)
+    letters = b[letter_position] & 0xDF
+    if len(values) != len(letters):
+        raise ValueError('Could not split the program into words, every letter must be followed by a number')
+    return letters, values, np.searchsorted(line_end, letter_position), len(line_end)
+
+def parse(source):
+    # Returns the line table, the header values and the number of M0 pauses of a program (a filename or lines)
+    header = {'arguments': {}, 'calculated': {}}
+    section = 'arguments'
+    in_header = True
+    pauses = 0
+    motion, relative, inverse_time, feed = -1, False, False, np.nan # Modal state carried between pieces
+    offset = 0 # Number of lines in the earlier pieces
+    chunks = []
+    for data in _pieces(source):
+        letters, values, word_line, lines = _words(data)
+        if in_header:
+            # The header is the comments before the first line of code
+            first_code = word_line[0] if len(word_line) else lines
+            for text in data.decode().split('\n')[:first_code]:
+                section = parse_header(text, section, header)
+            in_header = len(word_line) == 0
+
+        def codes(letter):
+            rows = letters == ord(letter)
+            return values[rows], word_line[rows]
+        g, g_line = codes('G')
+        m, m_line = codes('M')
+        for name, value, value_line, supported in (('G', g, g_line, supported_g), ('M', m, m_line, supported_m)):
+            bad = ~np.isin(value, list(supported))
+            if np.any(bad):
+                first = np.flatnonzero(bad)[0]
+                hint = ', expand the program first with compact.expand()' if name == 'M' and value[first] == 98 else ''
+                raise ValueError('Unsupported code {}{:g} on line {}{}'.format(name, value[first], offset + value_line[first] + 1, hint))
+        pauses += int(np.count_nonzero(m == 0))
+
+        def events(mapping):
+            output = np.full(lines, -1)
+            for code, state in mapping.items():
+                output[g_line[g == code]] = state
+            return output
+        line_motion = _fill(events({0: RAPID, 1: FEED}), lines, motion)
+        line_relative = _fill(events({90: 0, 91: 1}), lines, int(relative)).astype(bool)
+        line_inverse = _fill(events({93: 1, 94: 0}), lines, int(inverse_time)).astype(bool)
+        f, f_line = codes('F')
+        f_events = np.full(lines, np.nan)
+        f_events[f_line] = f
+        has_f = np.zeros(lines, dtype=bool)
+        has_f[f_line] = True
+        last_f = np.maximum.accumulate(np.where(has_f, np.arange(lines), -1))
+        line_f = np.where(last_f >= 0, f_events[np.maximum(last_f, 0)], feed)
+
+        axes = {}
+        has_axis = np.zeros(lines, dtype=bool)
+        for axis in 'XYZCP':
+            value, value_line = codes(axis)
+            axes[axis] = np.full(lines, np.nan)
+            axes[axis][value_line] = value
+            if axis != 'P':
+                has_axis[value_line] = True
+        code = np.where(has_axis, line_motion, -1)
+        code[g_line[g == 4]] = DWELL
+        code[g_line[g == 92]] = SET
+        if np.any((code == -1) & has_axis):
+            raise ValueError('Move without G0 or G1 on line {}'.format(offset + np.flatnonzero(has_axis & (code == -1))[0] + 1))
+        missing_f = (code == FEED) & line_inverse & ~has_f
+        if np.any(missing_f):
+            raise ValueError('G1 without F in inverse time mode on line {}'.format(offset + np.flatnonzero(missing_f)[0] + 1))
+
+        rows = np.flatnonzero(code >= 0)
+        table = np.zeros(len(rows), dtype=line_dtype)
+        table['code'] = code[rows]
+        table['x'], table['y'], table['z'], table['c'], table['p'] = (axes[axis][rows] for axis in 'XYZCP')
+        table['f'] = line_f[rows]
+        table['relative'] = line_relative[rows]
+        table['inverse_time'] = line_inverse[rows]
+        table['line'] = offset + rows + 1
+        chunks.append(table)
+
+        if lines:
+            motion, relative, inverse_time, feed = line_motion[-1], bool(line_relative[-1]), bool(line_inverse[-1]), line_f[-1]
+        offset += lines
+    if not chunks:
+        return np.zeros(0, dtype=line_dtype), header, pauses
+    return np.concatenate(chunks), header, pauses
+
+def _positions(values, relative, is_set):
+    # Axis position after every line, given the word of the axis on each line (NaN if absent).
+    # Absolute words and G92 set the position, relative words add to it, and the start position is 0.
+    given = ~np.isnan(values)
+    sets = given & (~relative | is_set)
+    increments = np.where(given & ~sets, values, 0.0)
+    total = np.cumsum(increments)
+    last_set = np.maximum.accumulate(np.where(sets, np.arange(len(values)), -1))
+    safe = np.maximum(last_set, 0)
+    return np.where(last_set >= 0, values[safe] + (total - total[safe]), total)
+
+def units_duration(distance, dc, f):
+    # Duration of feed moves under G94, [s]: F [mm/min] applies to the XYZ distance, or to the C distance for moves of C alone
+    return np.where(distance > 0, distance, np.abs(dc)) / f * 60
+
+def simulate(table, wire_diameter=None, rapid_rate=None):
+    # Positions, per-line durations and wire use for a line table from parse().
+    # Under G94 the feed applies to the XYZ distance, or to the C distance for moves of C alone.
+    # Rapids take no time unless rapid_rate [mm/min] is given, and M0 pauses are not counted.
+    is_set = table['code'] == SET
+    position = {axis: _positions(table[axis], table['relative'], is_set) for axis in 'xyzc'}
+    previous = {axis: np.concatenate(([0.0], position[axis][:-1])) for axis in 'xyzc'}
+    delta = {axis: np.where(is_set, 0.0, position[axis] - previous[axis]) for axis in 'xyzc'}
+    distance = np.sqrt(delta['x']**2 + delta['y']**2 + delta['z']**2)
+
+    feed = table['code'] == FEED
+    rapid = table['code'] == RAPID
+    duration = np.zeros(len(table)) # Duration of each line, [s]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inverse = feed & table['inverse_time']
+        duration[inverse] = 60 / table['f'][inverse]
+        units = feed & ~table['inverse_time']
+        duration[units] = units_duration(distance, delta['c'], table['f'])[units]
+        if rapid_rate:
+            duration[rapid] = distance[rapid] / rapid_rate * 60
+    dwell = table['code'] == DWELL
+    duration[dwell] = table['p'][dwell]
+    if np.any(~np.isfinite(duration)):
+        raise ValueError('Feed move without a usable F on line {}'.format(table['line'][~np.isfinite(duration)][0]))
+
+    fed = np.where(feed, np.maximum(delta['c'], 0.0), 0.0) # Wire fed on each line, [mm]
+    moves = feed | rapid
+    result = {'position': position, 'delta': delta, 'distance': distance, 'duration': duration, 'fed': fed,
+              'moves': int(np.count_nonzero(moves)),
+              'total_time': duration.sum() / 60, # [min]
+              'wire_length': fed.sum(),          # [mm]
+              'final_z': position['z'][-1] if len(table) else 0.0}
+    if wire_diameter:
+        result['wire_volume'] = fed.sum() * pi * wire_diameter ** 2 / 4 # [mm^3]
+    if np.any(feed):
+        result['x_range'] = (position['x'][feed].min(), position['x'][feed].max())
+        result['y_range'] = (position['y'][feed].min(), position['y'][feed].max())
+    return result
+
+def deposition_time(table, result):
+    # The time the generators report as Total Time: everything except the final escape move and the blank XY passes
+    # made before the first layer, [min]
+    feed = table['code'] == FEED
+    delta = result['delta']
+    blank = feed & (result['fed'] == 0) & ((delta['x'] != 0) | (delta['y'] != 0))
+    blank &= np.cumsum(feed & (result['fed'] > 0)) == 0
+    counted = ~blank
+    moves = np.flatnonzero((table['code'] == FEED) | (table['code'] == RAPID))
+    if len(moves):
+        counted[moves[-1]] = False
+    return result['duration'][counted].sum() / 60
+
+def rates(table, result):
+    # Linear feedrates of the feeding moves by kind, as shown on the controller, [mm/min]
+    delta, duration = result['delta'], result['duration']
+    feeding = (table['code'] == FEED) & (result['fed'] > 0)
+    moves = np.flatnonzero((table['code'] == FEED) | (table['code'] == RAPID))
+    if len(moves):
+        feeding[moves[-1]] = False # The escape is not part of the deposition
+    dx, dy, dz = np.abs(delta['x']), np.abs(delta['y']), np.abs(delta['z'])
+    kinds = {'climb rate': feeding & (dx == 0) & (dy == 0) & (dz > 0),
+             'traverse rate': feeding & (dx > 0) & (dy == 0),
+             'vertical rate': feeding & (dx == 0) & (dy > 0),
+             'diagonal rate': feeding & (dx > 0) & (dy > 0),
+             'wire feed rate': feeding}
+    output = {}
+    for name, rows in kinds.items():
+        if np.any(rows):
+            length = result['fed'] if name == 'wire feed rate' else result['distance']
+            output[name] = length[rows].sum() / duration[rows].sum() * 60
+    return output
+
+def check(table, header, result, rtol=0.02, atol=0.01):
+    # Compare the simulation with the calculated values in the header, returning a list of mismatches
+    problems = []
+    calculated = header['calculated']
+    if 'total time' in calculated:
+        simulated = deposition_time(table, result)
+        if not np.isclose(simulated, calculated['total time'], rtol=rtol, atol=atol):
+            problems.append('Total Time is {:.2f} [min] in the header but {:.2f} [min] when simulated'.format(calculated['total time'], simulated))
+    for name, simulated in rates(table, result).items():
+        if name in calculated and not np.isclose(simulated, calculated[name], rtol=rtol, atol=atol):
+            problems.append('{} is {:.2f} [mm/min] in the header but {:.2f} [mm/min] when simulated'.format(name.title(), calculated[name], simulated))
+    return problems
+
+def verify(lines, rapid_rate=None):
+    # Parse, simulate and check a program, returning the simulation results with the header and any problems
+    table, header, pauses = parse(lines)
+    result = simulate(table, header['arguments'].get('wire diameter'), rapid_rate)
+    result['pauses'] = pauses
+    result['table'] = table
+    result['header'] = header
+    result['problems'] = check(table, header, result)
+    return result
@@ -0,0 +1,257 @@
+# Drip-feed (DNC) streaming of Dauber programs to the controller over a TCP or serial link.
+# Lines are sent as the controller acknowledges the earlier ones (one "ok" per line, as grbl-style controllers do),
+# keeping at most window lines and buffer_bytes bytes unacknowledged, so the controller's receive buffer never
+# overflows. A window of 1 sends line by line. The lines can come from a file, from stdin (a generator writing to -)
+# or from a pattern generating in a thread, through a bounded queue so only a few chunks are held in memory.
+# At an M0 the sender waits for the controller to finish everything before it, then pauses until resumed.
+# MockController stands in for the controller, acknowledging each line after a configurable delay.
+
+import asyncio
+import re
+import threading
+import time
+from collections import deque
+
+read_size = 1 << 16 # Size of the pieces files are read in, [bytes]
+queue_chunks = 4    # Number of generated chunks held in memory while streaming a pattern, [unitless]
+
+def clean(line):
+    # The line without comments or surrounding spaces, as sent to the controller
+    return line.split(';', 1)[0].split('(', 1)[0].strip()
+
+def is_pause(line):
+    # Whether a cleaned line is a program pause (M0)
+    return any(int(code) == 0 for code in re.findall(r'[Mm]\s*(\d+)', line))
+
+async def read_lines(file, size=read_size):
+    # Lines of an open text file (or stdin), read in a worker thread so the event loop keeps running
+    loop = asyncio.get_running_loop()
+    while True:
+        lines = await loop.run_in_executor(None, file.readlines, size)
+        if not lines:
+            break
+        for line in lines:
+            yield line
+
+class _QueueWriter:
+    # Writer for Pattern.write() that hands the text to the event loop, blocking while the queue is full
+    def __init__(self, queue, loop):
+        self.queue, self.loop = queue, loop
+
+    def write(self, text):
+        asyncio.run_coroutine_threadsafe(self.queue.put(text), self.loop).result()
+
+async def pattern_lines(write, *args):
+    # Lines of a program generated in a thread by write(out, *args), e.g. pattern.write or compact.write with pattern
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(queue_chunks)
+    def generate():
+        try:
+            write(_QueueWriter(queue, loop), *args)
+        finally:
+            asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+    thread = threading.Thread(target=generate, daemon=True)
+    thread.start()
+    partial = ''
+    while True:
+        text = await queue.get()
+        if text is None:
+            break
+        lines = (partial + text).split('\n')
+        partial = lines.pop()
+        for line in lines:
+            yield line
+    if partial:
+        yield partial
+
+async def open_link(target, baudrate=115200):
+    # (reader, writer) for host:port over TCP, or a serial port such as /dev/ttyUSB0 or COM3
+    match = re.fullmatch(r'(?:tcp://)?([^/:]+):(\d+)', target)
+    if match:
+        return await asyncio.open_connection(match.group(1), int(match.group(2)))
+    try:
+        import serial_asyncio
+    except ImportError:
+        raise RuntimeError('Streaming to the serial port {} needs the pyserial-asyncio package'.format(target))
+    return await serial_asyncio.open_serial_connection(url=target, baudrate=baudrate)
+
+class Sender:
+    def __init__(self, reader, writer, window=16, buffer_bytes=128, pause_at_m0=True, report=None, report_interval=1.0):
+        self.reader, self.writer = reader, writer
+        self.window = window                 # Largest number of lines waiting for an acknowledgement, [unitless]
+        self.buffer_bytes = buffer_bytes     # Largest number of bytes waiting for an acknowledgement, [bytes]
+        self.pause_at_m0 = pause_at_m0       # Whether to wait for resume() after sending an M0
+        self.report = report                 # Called with the stats every report_interval [s] while streaming
+        self.report_interval = report_interval
+        self.pending = deque()               # (bytes, time sent, line number) of the lines waiting for an acknowledgement
+        self.pending_bytes = 0
+        self.acked = asyncio.Event()
+        self.resumed = asyncio.Event()
+        self.on_pause = None                 # Called with the paused line when the sender pauses at an M0
+        self.lines_sent = self.bytes_sent = self.lines_acked = 0
+        self.errors = []                     # (line number in the program, response) of the lines the controller rejected
+        self.unmatched = 0                   # Acknowledgements received with no line waiting for one (echoes, repeats)
+        self.acks = None                     # Task reading the acknowledgements while sending
+        self.latency_total = self.latency_max = 0.0
+        self.buffer_total = self.buffer_max = 0
+        self.paused_time = 0.0
+        self.start = self.end = None
+        self.closed = False
+
+    def resume(self):
+        self.resumed.set()
+
+    async def _read_acks(self):
+        # Match each ok or error from the controller to the oldest line waiting for one
+        while True:
+            response = await self.reader.readline()
+            if not response:
+                self.closed = True
+                self.acked.set()
+                return
+            response = response.decode(errors='replace').strip()
+            if not (response == 'ok' or response.startswith('error')):
+                continue # Status and other messages do not acknowledge a line
+            if not self.pending:
+                self.unmatched += 1
+                continue
+            size, sent, number = self.pending.popleft()
+            latency = time.perf_counter() - sent
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+            self.pending_bytes -= size
+            self.lines_acked += 1
+            if response != 'ok':
+                self.errors.append((number, response))
+            self.acked.set()
+
+    async def _wait(self, lines, size):
+        # Wait until sending a line of size bytes leaves at most lines lines unacknowledged and fits the buffer
+        while self.pending and (len(self.pending) > lines or self.pending_bytes + size > self.buffer_bytes):
+            if self.closed:
+                raise ConnectionError('The controller closed the connection with {} lines unacknowledged'.format(len(self.pending)))
+            self.acked.clear()
+            acked = asyncio.ensure_future(self.acked.wait())
+            await asyncio.wait([acked, self.acks], return_when=asyncio.FIRST_COMPLETED)
+            acked.cancel()
+            if self.acks.done():
+                self.acks.result() # Raises whatever stopped the acknowledgements being read
+
+    async def _report(self):
+        while True:
+            await asyncio.sleep(self.report_interval)
+            self.report(self.stats())
+
+    async def send(self, lines):
+        # Stream the lines (an iterable or async iterable) to the controller, returning the stats at the end
+        self.acks = asyncio.create_task(self._read_acks())
+        reporter = asyncio.create_task(self._report()) if self.report else None
+        self.start = time.perf_counter()
+        try:
+            if not hasattr(lines, '__aiter__'):
+                lines = _async_iter(lines)
+            number = 0 # Line number in the program, counting the blank and comment lines that are not sent
+            async for line in lines:
+                number += 1
+                line = clean(line)
+                if not line:
+                    continue
+                data = (line + '\n').encode()
+                await self._wait(self.window - 1, len(data))
+                self.writer.write(data)
+                self.pending.append((len(data), time.perf_counter(), number))
+                self.pending_bytes += len(data)
+                self.lines_sent += 1
+                self.bytes_sent += len(data)
+                self.buffer_total += self.pending_bytes
+                self.buffer_max = max(self.buffer_max, self.pending_bytes)
+                if len(self.pending) >= self.window or self.pending_bytes >= self.buffer_bytes:
+                    await self.writer.drain()
+                if self.pause_at_m0 and is_pause(line):
+                    await self.writer.drain()
+                    await self._wait(0, 0) # Everything up to the M0 has been done
+                    paused = time.perf_counter()
+                    self.resumed.clear()
+                    if self.on_pause:
+                        self.on_pause(line)
+                    await self.resumed.wait()
+                    self.paused_time += time.perf_counter() - paused
+            await self.writer.drain()
+            await self._wait(0, 0)
+        finally:
+            self.end = time.perf_counter()
+            self.acks.cancel()
+            if reporter:
+                reporter.cancel()
+        return self.stats()
+
+    def stats(self):
+        # Throughput and latency so far, not counting the time spent paused
+        elapsed = max((self.end or time.perf_counter()) - self.start - self.paused_time, 1e-9)
+        return {'lines_sent': self.lines_sent,
+                'lines_acked': self.lines_acked,
+                'bytes_sent': self.bytes_sent,
+                'elapsed': elapsed,                                               # [s]
+                'lines_per_second': self.lines_acked / elapsed,                   # [1/s]
+                'bytes_per_second': self.bytes_sent / elapsed,                    # [bytes/s]
+                'mean_latency': self.latency_total / max(self.lines_acked, 1),   # Time from sending a line to its ok, [s]
+                'max_latency': self.latency_max,                                  # [s]
+                'mean_buffer': self.buffer_total / max(self.lines_sent, 1),       # Unacknowledged bytes after each send, [bytes]
+                'max_buffer': self.buffer_max,                                    # [bytes]
+                'paused_time': self.paused_time,                                  # [s]
+                'unmatched_acks': self.unmatched,
+                'errors': list(self.errors)}
+
+async def _async_iter(lines):
+    for line in lines:
+        yield line
+
+class MockController:
+    # Stand-in for the controller on a TCP port: lines go into a receive buffer of rx_buffer bytes and are acknowledged
+    # with "ok" one at a time, delay [s] after the previous one. A line that overflows the buffer is dropped and answered
+    # with an error in its turn, after the lines before it and before the lines after it.
+    def __init__(self, delay=0.001, rx_buffer=128, log=None):
+        self.delay = delay
+        self.rx_buffer = rx_buffer
+        self.log = log               # File to write the received lines to, if any
+        self.lines_received = 0
+        self.overflows = 0
+
+    async def _client(self, reader, writer):
+        received = asyncio.Queue()
+        buffered = 0
+        async def process():
+            nonlocal buffered
+            while True:
+                line, overflowed = await received.get()
+                if line is None:
+                    return
+                if (overflowed):
+                    writer.write(b'error:overflow\n')
+                    continue
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                buffered -= len(line)
+                if self.log:
+                    self.log.write(line.decode())
+                    self.log.flush() # The end of the transcript is kept if the mock is killed
+                writer.write(b'ok\n')
+        worker = asyncio.create_task(process())
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            self.lines_received += 1
+            if buffered + len(line) > self.rx_buffer:
+                self.overflows += 1
+                await received.put((line, True))
+                continue
+            buffered += len(line)
+            await received.put((line, False))
+        await received.put((None, False))
+        await worker
+        writer.close()
+
+    async def serve(self, host='localhost', port=0):
+        # Start listening, returning the server (its port is server.sockets[0].getsockname()[1])
+        return await asyncio.start_server(self._client, host, port)
@@ -0,0 +1,142 @@
+# Batch generation of DEP sample series for process development sweeps.
+# A sweep is a list of rows, each naming a pattern (line, N or pillar) and the parameters that differ from its defaults.
+# Every row becomes one DEP-*.nc program, generated in a process pool, and one line of a CSV manifest.
+
+import concurrent.futures
+import csv
+import itertools
+import json
+import os
+
+from dauber import toolpath, compact, timing, cache
+from dauber.gcode import GcodeWriter
+
+def expand_grid(spec):
+    # Expand a grid spec, where every list value is swept and every other value is fixed, into rows
+    names = list(spec)
+    values = [spec[k] if isinstance(spec[k], list) else [spec[k]] for k in names]
+    return [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+def load_rows(path):
+    # Read a sweep from a CSV file (one row per sample) or a JSON file (a list of rows, or a grid spec)
+    if path.lower().endswith('.csv'):
+        with open(path, newline='') as file:
+            return [{k: v for k, v in row.items() if v != ''} for row in csv.DictReader(file)]
+    with open(path) as file:
+        spec = json.load(file)
+    if isinstance(spec, dict):
+        return expand_grid(spec)
+    rows = []
+    for row in spec:
+        rows += expand_grid(row)
+    return rows
+
+def convert(value, default):
+    # Convert a value read from a sweep file to the type of the parameter's default
+    if isinstance(default, bool):
+        if isinstance(value, str):
+            return value.strip().lower() in ('true', '1', 'yes')
+        return bool(value)
+    if isinstance(default, int):
+        # Spreadsheets and JSON grids may write whole numbers as 100.0, but 2.5 layers is a mistake
+        number = float(value)
+        if not number.is_integer():
+            raise ValueError('Expected a whole number, got {!r}'.format(value))
+        return int(number)
+    return type(default)(value)
+
+def row_parameters(row):
+    # Pattern class and converted parameters of a sweep row, checking the parameter names and values
+    if 'pattern' not in row:
+        raise ValueError('Sweep row has no pattern: {}'.format(row))
+    if row['pattern'] not in toolpath.patterns:
+        raise ValueError('Unknown pattern {!r}, expected one of {}'.format(row['pattern'], ', '.join(toolpath.patterns)))
+    cls = toolpath.patterns[row['pattern']]
+    defaults = cls.parameters()
+    params = {}
+    for k, v in row.items():
+        if k in ('pattern', 'sample_num'):
+            continue
+        if k not in defaults:
+            raise ValueError('Pattern {} has no parameter {!r}'.format(cls.name, k))
+        params[k] = convert(v, defaults[k])
+    return cls, params
+
+def make_pattern(row):
+    # Build the pattern for a sweep row
+    cls, params = row_parameters(row)
+    return cls(**params)
+
+def assign_sample_nums(rows, first_sample):
+    # Rows without a sample_num are numbered in order, skipping the numbers already taken
+    for row in rows:
+        if 'sample_num' in row:
+            row['sample_num'] = convert(row['sample_num'], first_sample)
+    taken = {row['sample_num'] for row in rows if 'sample_num' in row}
+    sample_num = first_sample
+    for row in rows:
+        if 'sample_num' in row:
+            continue
+        while sample_num in taken:
+            sample_num += 1
+        row['sample_num'] = sample_num
+        taken.add(sample_num)
+    return rows
+
+def generate(row, output_dir, compact_output=False, profile=None, cache_dir=None):
+    # Write the program for one sweep row and return its manifest entry
+    pattern = make_pattern(row)
+    if profile:
+        timing.annotate(pattern, profile)
+    sample_id = pattern.sample_id(row['sample_num'])
+    filename = os.path.join(output_dir, sample_id + '.nc')
+    with GcodeWriter(filename) as out:
+        if (cache_dir):
+            params = {k: getattr(pattern, k) for k in pattern.parameters()}
+            cache.Cache(cache_dir).write(type(pattern), params, out, row['sample_num'], compact_output, profile, pattern)
+        elif (compact_output):
+            compact.write(pattern, out, sample_id)
+        else:
+            pattern.write(out, sample_id)
+    entry = {'sample_id': sample_id, 'pattern': pattern.name, 'filename': os.path.basename(filename)}
+    entry.update({k: getattr(pattern, k) for k in pattern.parameters()})
+    entry.update(pattern.calculated_values())
+    if pattern.estimate:
+        entry['estimated_time'] = pattern.estimate['total_time']
+        entry['slowest_feed_rate'] = pattern.estimate['slowest_feed_rate']
+        entry['speed_limited_moves'] = pattern.estimate['limited']
+    return entry
+
+def _generate_batch(batch, output_dir, compact_output, profile, cache_dir):
+    return [generate(row, output_dir, compact_output, profile, cache_dir) for row in batch]
+
+def run(rows, output_dir='.', first_sample=1, jobs=None, compact_output=False, profile=None, cache_dir=None):
+    # Generate every row of the sweep in a process pool, returning the manifest entries in row order
+    rows = assign_sample_nums([dict(row) for row in rows], first_sample)
+    for row in rows:
+        row_parameters(row) # Fail on a bad row before starting any workers, without building the patterns twice
+    sample_ids = [toolpath.patterns[row['pattern']].id_prefix + str(row['sample_num']).zfill(3) for row in rows]
+    if len(set(sample_ids)) != len(sample_ids):
+        raise ValueError('Sweep contains duplicate sample IDs')
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(rows) < 2:
+        return _generate_batch(rows, output_dir, compact_output, profile, cache_dir)
+    # Rows are sent to the workers in batches to keep the overhead per task small
+    batch_size = max(1, len(rows) // (jobs * 4))
+    batches = [rows[i:i + batch_size] for i in range(0, len(rows), batch_size)]
+    entries = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        for result in pool.map(_generate_batch, batches, itertools.repeat(output_dir), itertools.repeat(compact_output), itertools.repeat(profile), itertools.repeat(cache_dir)):
+            entries += result
+    return entries
+
+def write_manifest(entries, filename):
+    # One CSV line per sample, with the columns of every pattern in the sweep
+    columns = []
+    for entry in entries:
+        columns += [k for k in entry if k not in columns]
+    with open(filename, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=columns, restval='')
+        writer.writeheader()
+        writer.writerows(entries)
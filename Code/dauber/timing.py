@@ -0,0 +1,133 @@
+# Acceleration-aware cycle time estimate for Dauber programs.
+# The Total Time in the headers assumes the tool changes velocity instantly at every corner and climb. Here the moves are
+# planned with trapezoidal velocity profiles through the segment list, using the per-axis velocity and acceleration
+# limits of a machine profile and a junction deviation limit at the corners (as in grbl).
+# The lookahead passes, v_entry^2 <= min(junction^2, v_exit^2 + 2*a*L), are min-plus recurrences, so they are solved
+# for the whole program at once with prefix sums and a cumulative minimum instead of a loop over the segments.
+
+import json
+import os
+import numpy as np
+
+from dauber import toolpath, simulate
+
+axes = 'xyzc'
+default_profile = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'machines', 'acorn.json')
+
+def load_profile(filename=default_profile):
+    # Machine profile: max_velocity [mm/min] and max_acceleration [mm/s^2] for each axis, and junction_deviation [mm]
+    with open(filename) as file:
+        profile = json.load(file)
+    for key in ('max_velocity', 'max_acceleration'):
+        missing = [axis for axis in axes if axis not in profile.get(key, {})]
+        if missing:
+            raise ValueError('Machine profile {} has no {} for axes {}'.format(filename, key, ', '.join(missing)))
+    profile.setdefault('junction_deviation', 0.01)
+    return profile
+
+def plan(delta, duration, stop_after, profile):
+    # Time taken by each move, [s], and whether the axis limits stop it reaching its commanded speed.
+    # delta: (N, 4) X/Y/Z/C distance of each move, [mm]
+    # duration: commanded duration of each move, [s], or inf for rapids
+    # stop_after: whether the machine comes to rest after each move (dwell, pause or end of a block)
+    delta = np.asarray(delta, dtype=float).reshape(-1, 4)
+    duration = np.asarray(duration, dtype=float)
+    vmax_axis = np.array([profile['max_velocity'][axis] for axis in axes]) / 60 # [mm/s]
+    amax_axis = np.array([profile['max_acceleration'][axis] for axis in axes], dtype=float)
+
+    # Moves are planned along their XYZ path, or along C for moves of C alone
+    xyz = np.sqrt((delta[:, :3]**2).sum(axis=1))
+    length = np.where(xyz > 0, xyz, np.abs(delta[:, 3]))
+    moving = length > 0
+    safe_length = np.where(moving, length, 1.0)
+    ratio = np.abs(delta) / safe_length[:, None] # Axis distance per unit of path length
+    with np.errstate(divide='ignore'):
+        axis_speed = np.min(np.where(ratio > 0, vmax_axis / ratio, np.inf), axis=1)
+        accel = np.min(np.where(ratio > 0, amax_axis / ratio, np.inf), axis=1)
+        commanded = np.where(moving, np.where(np.isfinite(duration), length / duration, np.inf), 0.0) # Rapids go as fast as the axes allow
+    limited = moving & np.isfinite(duration) & (axis_speed < commanded * (1 - 1e-9))
+    speed = np.minimum(commanded, axis_speed)
+    accel = np.where(moving, accel, np.inf)
+
+    # Junction speeds between consecutive moves, from the angle between their XYZ directions
+    unit = np.where(xyz[:, None] > 0, delta[:, :3] / np.where(xyz > 0, xyz, 1.0)[:, None], 0.0)
+    cos_theta = -(unit[:-1] * unit[1:]).sum(axis=1)
+    sin_half = np.sqrt(np.clip((1 - cos_theta) / 2, 0, 1))
+    junction_accel = np.minimum(accel[:-1], accel[1:])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        junction2 = np.where(sin_half < 1, junction_accel * profile['junction_deviation'] * sin_half / (1 - sin_half), np.inf)
+    junction2 = np.minimum(junction2, np.minimum(speed[:-1], speed[1:])**2)
+    # Moves of C alone have no direction to blend with, so they start and end at rest
+    junction2 = np.where((xyz[:-1] > 0) & (xyz[1:] > 0), junction2, 0.0)
+    junction2[stop_after[:-1]] = 0.0
+    limit2 = np.concatenate(([0.0], junction2, [0.0])) # Largest v^2 at the start of each move and at the end, [mm^2/s^2]
+
+    # Backward pass: w[i] = min over k >= i of (limit2[k] + S[k]) - S[i], with S the prefix sum of 2*a*L
+    reach = np.where(moving, 2 * np.where(moving, accel, 0.0) * length, 0.0)
+    S = np.concatenate(([0.0], np.cumsum(reach)))
+    backward = np.minimum.accumulate((limit2 + S)[::-1])[::-1] - S
+    # Forward pass: u[k] = min over i <= k of (w[i] - S[i]) + S[k]
+    forward = np.minimum.accumulate(backward - S) + S
+    v2 = np.clip(np.minimum(backward, forward), 0.0, None)
+    v0, v1 = np.sqrt(v2[:-1]), np.sqrt(v2[1:])
+
+    # Time of a trapezoidal (or triangular) profile from v0 to v1 over each move
+    with np.errstate(divide='ignore', invalid='ignore'):
+        peak = np.sqrt((2 * accel * length + v0**2 + v1**2) / 2)
+        top = np.minimum(peak, speed)
+        ramp = ((top - v0) + (top - v1)) / accel
+        cruise = (length - (top**2 - v0**2) / (2 * accel) - (top**2 - v1**2) / (2 * accel)) / top
+        time = np.where(moving, np.nan_to_num(ramp) + np.clip(np.nan_to_num(cruise), 0, None), 0.0)
+    return time, limited
+
+def estimate(delta, duration, stop_after, dwell, profile):
+    # Planned time and effective wire feed rate of each move, with totals
+    time, limited = plan(delta, duration, stop_after, profile)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        feed_rate = np.where(time > 0, np.maximum(delta[:, 3], 0) / time, 0.0) # Effective wire feed rate, [mm/s]
+    return {'time': time,
+            'feed_rate': feed_rate,
+            'limited': limited,
+            'total_time': (time.sum() + dwell) / 60} # [min]
+
+def pattern_moves(pattern):
+    # Moves of a pattern's program from the approach to the escape, with the kind of each (-1 for approach and escape)
+    table = pattern.segments()
+    sx, sy = pattern.start_position()
+    points = np.column_stack([table['x'], table['y'], table['z'], table['c']])
+    points = np.vstack([[sx, sy, pattern.approach_height, 0.0], [sx, sy, 0.0, 0.0], points])
+    dz, dc, escape_time = pattern.escape_move()
+    points = np.vstack([points, points[-1] + [0.0, 0.0, dz, dc]])
+    delta = np.diff(points, axis=0)
+    duration = np.concatenate(([pattern.approach_duration], 60 / table['f'], [escape_time]))
+    kind = np.concatenate(([-1], table['kind'], [-1]))
+    stop_after = np.zeros(len(delta), dtype=bool)
+    stop_after[0] = True # The approach ends at rest, for the pause or dwell before depositing
+    return delta, duration, stop_after, kind
+
+def annotate(pattern, profile):
+    # Estimate the program time of a pattern and store it on the pattern, so it is written to the header
+    delta, duration, stop_after, kind = pattern_moves(pattern)
+    result = estimate(delta, duration, stop_after, pattern.dwell_time(), profile)
+    feeding = (delta[:, 3] > 0) & (kind >= 0)
+    rates = {}
+    for k in np.unique(kind[feeding]):
+        rows = feeding & (kind == k)
+        rates[toolpath.kind_names[k]] = delta[rows, 3].sum() / result['time'][rows].sum()
+    pattern.estimate = {'total_time': result['total_time'],
+                        'feed_rates': rates,
+                        'slowest_feed_rate': result['feed_rate'][feeding].min() if np.any(feeding) else 0.0,
+                        'limited': int(np.count_nonzero(result['limited'] & (kind >= 0)))}
+    return result
+
+def program_moves(table, result):
+    # Moves of a program read with simulate.parse() and simulate.simulate(), for estimating its time
+    rows = np.flatnonzero((table['code'] == simulate.FEED) | (table['code'] == simulate.RAPID))
+    delta = np.column_stack([result['delta'][axis][rows] for axis in axes])
+    duration = np.where(table['code'][rows] == simulate.RAPID, np.inf, result['duration'][rows])
+    # The machine comes to rest for a dwell between two moves, and at the end of the program
+    dwells = np.cumsum(table['code'] == simulate.DWELL)
+    stop_after = np.ones(len(rows), dtype=bool)
+    stop_after[:-1] = dwells[rows[1:]] > dwells[rows[:-1]]
+    dwell = result['duration'][table['code'] == simulate.DWELL].sum()
+    return delta, duration, stop_after, dwell
@@ -0,0 +1,638 @@
+# Toolpath patterns for Dauber, controlled by the Centroid Acorn.
+# Each pattern turns its parameters into a segment table: a NumPy structured array with one row per G1 move made
+# while depositing, holding the absolute X/Y/Z/C at the end of the move, the inverse-time F and the kind of move.
+# The C and Z columns are built with a single cumsum over the per-move increments, so programs with millions of
+# segments can be generated and analysed without a Python loop over the layers.
+
+import inspect
+import warnings
+import numpy as np
+
+from dauber import geometry, heightmap, simulate
+
+pi = 3.14159
+
+# --- Segment kinds ---
+BLANK = 0    # Move in XY without feeding wire
+CLIMB = 1    # Move up one layer in Z while feeding
+TRAVERSE = 2 # Move across the line while feeding
+VERTICAL = 3 # Move along a vertical of the N while feeding
+DIAGONAL = 4 # Move along the diagonal of the N while feeding
+TRACE = 5    # Move along a path of a drawing while feeding
+kind_names = ['blank', 'climb', 'traverse', 'vertical', 'diagonal', 'trace']
+
+segment_dtype = np.dtype([('x', 'f8'),     # Tool position in X at the end of the move, [mm]
+                          ('y', 'f8'),     # Tool position in Y at the end of the move, [mm]
+                          ('z', 'f8'),     # Tool position in Z at the end of the move, [mm]
+                          ('c', 'f8'),     # Wire position in feeder at the end of the move, [mm]
+                          ('f', 'f8'),     # Inverse time feedrate of the move, [1/min]
+                          ('kind', 'u1'),  # One of the segment kinds above
+                          ('layer', 'i4')]) # Layer the move belongs to, 0 before the first layer
+
+chunk_layers = 4096     # Number of layers generated at once when writing a program, [unitless]
+chunk_rows = 1 << 16    # Largest number of segments generated at once, for patterns with long layers, [unitless]
+
+max_speedup = 4.0       # Fastest a move adapted to the heightmap may run, as a multiple of its flat-layer rate, [unitless]
+
+output_resolution = 0.01 # Smallest change in a coordinate the programs are written with, [mm]
+
+escape_feed_length = 10 # Length of wire to feed while escaping, [mm]
+escape_travel = 20      # How far the Z axis should move upward while escaping, [mm]
+
+program_start = ('G17 ; Select XY plane for circular interpolation \n'
+                 'G21 ; Select metric units of [mm] \n'
+                 'G54 ; Select G54 Work Coordinate System \n'
+                 'G90 ; Absolute positioning mode \n\n'
+                 'G92 C0.0 ; Reset the C axis to zero \n')
+
+class Pattern:
+    # Subclasses set these, and fill in the layer templates in __init__
+    name = ''        # Name of the pattern, used by the batch tools
+    id_prefix = ''   # Sample ID prefix, e.g. 'DEP-L-'
+    climb_format = ''      # Format of the climb at the start of each layer
+    layer_separator = ''   # Text written between the prefix moves and the first layer
+    calculated = []        # Calculated values written to the header, reported by the batch tools
+    header_width = 28      # Width of the names in the header, [characters]
+    input_files = []       # Parameters naming files the pattern reads
+    preamble_parameters = ['approach_height', 'approach_duration', 'spindle_speed', 'initial_pause'] # Parameters that leave the layers unchanged
+    estimate = None        # Set by timing.annotate() to add the planned program time to the header
+    heightmap_cell = 0.0   # Cell size of the heightmap the feed was adapted to, 0 for the flat-layer model, [mm]
+    layer_dc = None        # Wire fed by each move of the layers before the template repeats, set by adapt_feed()
+    layer_f = None         # Inverse time feedrate of each move of those layers, set by adapt_feed()
+
+    @classmethod
+    def parameters(cls):
+        # Names and default values of the parameters the pattern takes
+        return {k: p.default for k, p in inspect.signature(cls.__init__).parameters.items() if k != 'self'}
+
+    @classmethod
+    def arguments(cls, args):
+        # The parameters of the pattern among parsed command line arguments
+        names = cls.parameters()
+        return {k: v for k, v in vars(args).items() if k in names}
+
+    @classmethod
+    def from_args(cls, args):
+        # Build the pattern from parsed command line arguments, ignoring the ones it does not take
+        return cls(**cls.arguments(args))
+
+    def calculated_values(self):
+        return {k: getattr(self, k) for k in self.calculated}
+
+    @classmethod
+    def sample_id(cls, sample_num):
+        return cls.id_prefix + str(sample_num).zfill(3)
+
+    def _set_layer_template(self, bodies, climb_x, climb_y):
+        # bodies[p] lists the (kind, x, y, feed length, F, format) moves of a layer with parity p, after its climb.
+        # climb_x/y[p] is where the tool sits while climbing to a layer with parity p.
+        self.bodies = bodies
+        self.rows_per_layer = 1 + len(bodies[0])
+        self.template = np.zeros((2, self.rows_per_layer), dtype=segment_dtype)
+        self.template_dc = np.zeros((2, self.rows_per_layer))
+        self.template_dz = np.zeros((2, self.rows_per_layer))
+        self.layer_formats = []
+        for p in range(2):
+            moves = [(CLIMB, climb_x[p], climb_y[p], self.climb_feed_length, 60/self.climb_time, self.climb_format)] + list(bodies[p])
+            for j, (kind, x, y, dc, f, fmt) in enumerate(moves):
+                self.template[p, j] = (x, y, 0, 0, f, kind, 0)
+                self.template_dc[p, j] = dc
+            self.template_dz[p, 0] = self.layer_height
+            self.layer_formats.append([move[5] for move in moves])
+
+    def prefix_moves(self):
+        # (kind, x, y, F, format) of the moves made at zero height before the first layer, without feeding
+        return []
+
+    def prefix_segments(self):
+        moves = self.prefix_moves()
+        table = np.zeros(len(moves), dtype=segment_dtype)
+        for i, (kind, x, y, f, fmt) in enumerate(moves):
+            table[i] = (x, y, 0, 0, f, kind, 0)
+        return table
+
+    def layer_segments(self, first, last, c0=0.0, z0=0.0):
+        # Segment table of layers first to last-1, starting from wire position c0 and height z0
+        # The layers repeat every two layers, so the table is the two-layer template tiled over the range
+        layers = np.arange(first, last)
+        period = [first % 2, (first + 1) % 2]
+        reps = (len(layers) + 1) // 2
+        rows = len(layers) * self.rows_per_layer
+        table = np.tile(self.template[period], (reps, 1)).ravel()[:rows]
+        table['layer'] = np.repeat(layers, self.rows_per_layer)
+        dc = np.tile(self.template_dc[period], (reps, 1)).ravel()[:rows]
+        if self.layer_dc is not None and first <= len(self.layer_dc):
+            # The first layers of a pattern adapted to a heightmap fill differently before settling into the template
+            k = (min(last - 1, len(self.layer_dc)) - first + 1) * self.rows_per_layer
+            dc[:k] = self.layer_dc[first - 1:].ravel()[:k]
+            table['f'][:k] = self.layer_f[first - 1:].ravel()[:k]
+        table['c'] = np.cumsum(np.concatenate(([c0], dc)))[1:]
+        table['z'] = np.cumsum(np.concatenate(([z0], np.tile(self.template_dz[period], (reps, 1)).ravel()[:rows])))[1:]
+        return table
+
+    def adapt_feed(self, cell=heightmap.cell_size):
+        # Feed each move the volume it fills on a heightmap of the deposit instead of a flat-layer box, keeping the
+        # wire feed rate. The moves speed up where they pass over earlier moves, up to max_speedup times their
+        # flat-layer rate. The calculated rates and total time become the averages over the whole program.
+        self.heightmap_cell = cell
+        self.flat_feed_length = float(self.template_dc.sum() * (self.num_layers // 2) + self.template_dc[1].sum() * (self.num_layers % 2))
+        feeding = self.template_dc > 0
+        flat_time = 60 / self.template['f']
+        transient, steady = heightmap.plan(self.template, self.template_dc, self.deposition_diameter, self.layer_height, max(self.num_layers, 1), cell)
+        def feed(volume, p):
+            dc = np.where(feeding[p], volume / self.wire_area, 0.0)
+            time = np.where(feeding[p], np.maximum(volume / self.wire_volumetric_rate, flat_time[p] / max_speedup), flat_time[p])
+            return dc, 60 / time
+        parities = np.arange(1, len(transient) + 1) % 2
+        self.layer_dc, self.layer_f = (np.array(v).reshape(-1, self.rows_per_layer) for v in
+                                       zip(*[feed(volume, p) for volume, p in zip(transient, parities)]))
+        for p in range(2):
+            self.template_dc[p], self.template['f'][p] = feed(steady[p], p)
+
+        # Each layer's moves, weighted by how many layers make them
+        later = np.arange(len(transient) + 1, self.num_layers + 1) % 2
+        weight = np.concatenate([np.ones(len(transient)), [np.sum(later == 0), np.sum(later == 1)]])
+        parities = np.concatenate([parities, [0, 1]])
+        dc = np.vstack([self.layer_dc, self.template_dc])
+        time = 60 / np.vstack([self.layer_f, self.template['f']])
+        xy = np.stack([self.template['x'], self.template['y']], axis=-1)
+        length = np.hypot(*np.diff(xy, axis=1, prepend=xy[:, :1]).transpose(2, 0, 1))
+        length[:, 0] = self.layer_height
+        length = length[parities]
+        kind = self.template['kind'][parities]
+        self.feed_length = float((weight @ dc).sum()) # Wire fed by the layers, [mm]
+        self.total_time = float((self.approach_duration + (weight @ time).sum()) / 60)
+        for name in self.calculated:
+            if name.endswith('_rate') and name[:-5] in kind_names:
+                rows = (kind == kind_names.index(name[:-5])) & (dc > 0)
+                if rows.any():
+                    setattr(self, name, float((weight @ (length * rows)).sum() / (weight @ (time * rows)).sum() * 60))
+
+    def heightmap_header(self):
+        # Header lines for the feed adapted by adapt_feed(), if it was
+        if not self.heightmap_cell:
+            return ''
+        line = '; {:<' + str(self.header_width) + '}{:7.2f} [{}] \n'
+        output = line.format('Heightmap Cell Size:', self.heightmap_cell, 'mm')
+        output += ('; {:<' + str(self.header_width) + '}{:7.0f} [unitless] \n').format('Settling Layers:', len(self.layer_dc))
+        output += line.format('Wire Saved:', self.flat_feed_length - self.feed_length, 'mm')
+        return output
+
+    def _num_layer_rows(self):
+        # The climb to layer 1 is always made, even without any layers
+        return max(self.num_layers * self.rows_per_layer, 1)
+
+    def iter_segments(self, chunk_layers=chunk_layers, first=1, c0=0.0, z0=0.0):
+        # Yields the layer segment tables a few thousand layers at a time, carrying C and Z across chunks.
+        # A later first layer starts from the C and Z at the end of the layer before it.
+        remaining = self._num_layer_rows() - (first - 1) * self.rows_per_layer
+        chunk_layers = max(1, min(chunk_layers, chunk_rows // self.rows_per_layer))
+        while remaining > 0:
+            table = self.layer_segments(first, first + chunk_layers, c0, z0)[:remaining]
+            yield table
+            remaining -= len(table)
+            first += chunk_layers
+            c0, z0 = table['c'][-1], table['z'][-1]
+
+    def segments(self):
+        # Segment table of the whole deposition, from the first move after reaching the substrate to the last layer
+        return np.concatenate([self.prefix_segments(), self.layer_segments(1, max(self.num_layers, 1) + 1)[:self._num_layer_rows()]])
+
+    def write(self, out, sample_id):
+        # Write the whole program to out (anything with a write() method, such as a GcodeWriter)
+        out.write(self.header(sample_id))
+        out.write(self.preamble())
+        out.write(''.join(fmt.format(x=x, y=y, c=0.0, f=f) for kind, x, y, f, fmt in self.prefix_moves()))
+        out.write(self.layer_separator)
+        for table in self.iter_segments():
+            out.write(self.format_layers(table))
+        out.write(self.escape())
+
+    def format_rows(self, table):
+        # Gcode line of each row of a table returned by layer_segments, which always starts at the climb of a layer
+        m = self.rows_per_layer
+        formats = self.layer_formats
+        return [formats[layer % 2][i % m].format(x=x, y=y, z=z, c=c, f=f, layer=layer)
+                for i, (x, y, z, c, f, kind, layer) in enumerate(table.tolist())]
+
+    def format_layers(self, table):
+        return ''.join(self.format_rows(table))
+
+    def escape_move(self):
+        # Z travel, [mm], wire fed, [mm], and duration, [s], of the move up at the end of the program
+        return escape_travel, escape_feed_length, self.escape_time
+
+    def dwell_time(self):
+        # Time spent in dwells (G4) by the program, [s]
+        return 0.0
+
+    def estimate_header(self):
+        # Header lines for the estimate made by timing.annotate(), if there is one
+        if self.estimate is None:
+            return ''
+        line = '; {:<' + str(self.header_width) + '}{:7.2f} [{}] \n'
+        output = line.format('Estimated Time:', self.estimate['total_time'], 'min')
+        for kind, rate in self.estimate['feed_rates'].items():
+            output += line.format('Effective {} Feed:'.format(kind.title()), rate * 60, 'mm/min')
+        output += line.format('Slowest Wire Feed:', self.estimate['slowest_feed_rate'] * 60, 'mm/min')
+        if self.estimate['limited']:
+            output += line.format('Speed Limited Moves:', self.estimate['limited'], 'unitless')
+        return output
+
+    def escape(self):
+        return ('\nG91 ; Relative positioning mode \n'
+                'G1 Z{:.2f} C{:.2f} F{:.2f} ; Move up while extruding \n'.format(escape_travel, escape_feed_length, 60/self.escape_time) +
+                'G94 ; Turn off Inverse Time mode \n'
+                'M05 ; Turn off spindle')
+
+class Line(Pattern):
+    name = 'line'
+    id_prefix = 'DEP-L-'
+    climb_format = 'G1 Z{z:.2f} C{c:.2f} F{f:.2f} ; Move up to layer {layer} \n'
+    layer_separator = '\n'
+    calculated = ['traverse_rate', 'climb_rate', 'total_time']
+
+    def __init__(self, approach_height=20.0, approach_duration=30.0, wire_diameter=0.9, deposition_diameter=3.3,
+                 line_length=10.0, num_layers=5, feed_rate=1.0, layer_height=0.05, spindle_speed=24000,
+                 left_right=False, first_pass=False, initial_pause=False, heightmap_cell=0.0):
+        self.approach_height = approach_height         # Height above surface to rapid to when program starts, [mm]
+        self.approach_duration = approach_duration     # Duration over which to approach the layer height, [s]
+        self.wire_diameter = wire_diameter             # Diameter of the feedstock wire, [mm]
+        self.deposition_diameter = deposition_diameter # Estimated diameter of deposition area, [mm]
+        self.line_length = line_length                 # Length of the line, [mm]
+        self.num_layers = num_layers                   # Number of layers to deposit, [unitless]
+        self.feed_rate = feed_rate                     # Wire feed rate, [mm/s]
+        self.layer_height = layer_height               # Height of tool tip above substrate or previous layer, [mm]
+        self.spindle_speed = spindle_speed             # Spindle speed, [rpm]
+        self.left_right = left_right                   # Whether to start going left (True) or right (False)
+        self.first_pass = first_pass                   # Whether to do a blank first pass at zero height
+        self.initial_pause = initial_pause             # Whether to wait at zero height for user input to start
+        self.heightmap_cell = heightmap_cell           # Cell size of the heightmap to adapt the feed to, 0 for the flat-layer model, [mm]
+
+        self.deposition_area = pi * deposition_diameter ** 2 / 4 # Area of deposition under the nozzle
+        self.wire_area = pi * wire_diameter ** 2 / 4             # Cross-sectional area of the wire, [mm^2]
+        self.wire_volumetric_rate = feed_rate * self.wire_area   # Volumetric rate of wire addition, [mm^3 s^-1]
+
+        self.climb_feed_volume = self.deposition_area * layer_height                # Volume to be filled while the tool is moving up one layer in Z, [mm^3]
+        self.climb_feed_length = self.climb_feed_volume / self.wire_area            # Length of material fed while changing layer, [mm]
+        self.climb_time = self.climb_feed_volume / self.wire_volumetric_rate        # Time taken to feed the wire while changing layer, [s]
+        self.climb_rate = layer_height / self.climb_time * 60                       # Linear feedrate shown on the controller, [mm/min]
+
+        self.traverse_feed_volume = line_length * deposition_diameter * layer_height # Volume to be filled while the tool is traversing in XY, [mm^3]
+        self.traverse_feed_length = self.traverse_feed_volume / self.wire_area       # Length of material fed while traversing, [mm]
+        self.traverse_time = self.traverse_feed_volume / self.wire_volumetric_rate   # Time taken to feed the wire while traversing, [s]
+        self.traverse_rate = line_length / self.traverse_time * 60                   # Linear feedrate shown on the controller, [mm/min]
+
+        self.escape_time = escape_feed_length / feed_rate # Time taken to feed the wire while escaping, [s]
+
+        self.total_time = (approach_duration + num_layers * (self.traverse_time + self.climb_time)) / 60 # Total time for deposition, [min]
+
+        self.start_direction = 1 if left_right else -1 # Direction of the first pass, blank or not
+        direction = -self.start_direction if first_pass else self.start_direction # Direction of the pass on layer 1
+        traverse = 'G1 X{x:.2f} Y0.0 C{c:.2f} F{f:.2f} ; Feed across layer {layer} \n'
+        bodies = [[(TRAVERSE, -direction * line_length/2, 0.0, self.traverse_feed_length, 60/self.traverse_time, traverse)],
+                  [(TRAVERSE, direction * line_length/2, 0.0, self.traverse_feed_length, 60/self.traverse_time, traverse)]]
+        self._set_layer_template(bodies, [bodies[1][0][1], bodies[0][0][1]], [0.0, 0.0])
+        if (heightmap_cell):
+            self.adapt_feed(heightmap_cell)
+
+    def header(self, sample_id):
+        return ('; Sample ID:                {} \n'.format(sample_id) +
+                '; ~~~ Arguments used for gcode generation ~~~\n' +
+                '; Approach Height:            {:7.2f} [mm] \n'.format(self.approach_height) +
+                '; Approach Duration:          {:7.2f} [s] \n'.format(self.approach_duration) +
+                '; Wire Diameter:              {:7.2f} [mm] \n'.format(self.wire_diameter) +
+                '; Deposition Diameter:        {:7.2f} [mm] \n'.format(self.deposition_diameter) +
+                '; Line Length:                {:7.2f} [mm] \n'.format(self.line_length) +
+                '; Number of Layers:           {:7.0f} [unitless] \n'.format(self.num_layers) +
+                '; Wire Feed Rate:             {:7.2f} [mm/s] \n'.format(self.feed_rate) +
+                '; Layer Height:               {:7.2f} [mm] \n'.format(self.layer_height) +
+                '; Spindle Speed:              {:7.0f} [rpm] \n'.format(self.spindle_speed) +
+                '; Initial Pass Left-to-Right:    {} \n'.format(self.left_right) +
+                '; Dummy First Pass:              {} \n'.format(self.first_pass) +
+                '; Initial Preheating Pause:      {} \n'.format(self.initial_pause) +
+                '; ~~~ Calculated Values ~~~\n' +
+                '; Wire Feed Rate:             {:7.2f} [mm/min] \n'.format(self.feed_rate*60) +
+                '; Traverse Rate:              {:7.2f} [mm/min] \n'.format(self.traverse_rate) +
+                '; Climb Rate:                 {:7.2f} [mm/min] \n'.format(self.climb_rate) +
+                '; Total Time:                 {:7.2f} [min] \n'.format(self.total_time) +
+                self.heightmap_header() + self.estimate_header() + '\n')
+
+    def preamble(self):
+        output = program_start
+        output += 'G0 Z{:.2f} ; Rapid to the approach height \n'.format(self.approach_height)
+        output += 'G0 X{:.2f} Y0.0 ; Rapid to the start of the line in XY \n'.format(-self.start_direction * self.line_length/2)
+        output += 'M3 S{} ; Start the spindle \n'.format(self.spindle_speed)
+        output += 'G93 ; Turn on Inverse Time mode \n'
+        output += '\nG1 Z0.0 F{:.2f} ; Feed down to the substrate in Z \n'.format(60/self.approach_duration)
+        if (self.initial_pause):
+            output += 'M0 ; Pause for operator to allow preheating \n'
+        return output
+
+    def start_position(self):
+        return -self.start_direction * self.line_length/2, 0.0
+
+    def prefix_moves(self):
+        if (self.first_pass):
+            return [(BLANK, self.start_direction * self.line_length/2, 0.0, 60/self.traverse_time,
+                     'G1 X{x:.2f} Y0.0 C{c:.2f} F{f:.2f} ; Blank pass \n')]
+        return []
+
+class N(Pattern):
+    name = 'N'
+    id_prefix = 'DEP-N-'
+    climb_format = 'G1 Z{z:.2f} C{c:.2f} F{f:.2f} ; Move up one layer height while feeding \n'
+    calculated = ['vertical_rate', 'diagonal_rate', 'climb_rate', 'total_time']
+
+    def __init__(self, approach_height=20.0, approach_duration=30.0, wire_diameter=0.86, deposition_diameter=3.5,
+                 vertical_length=10.0, horizontal_length=10.0, num_layers=100, feed_rate=1.0, layer_height=0.05,
+                 spindle_speed=24000, initial_pause=False, heightmap_cell=0.0):
+        self.approach_height = approach_height         # Height above surface to rapid to when program starts, [mm]
+        self.approach_duration = approach_duration     # Duration over which to approach the layer height, [s]
+        self.wire_diameter = wire_diameter             # Diameter of the feedstock wire, [mm]
+        self.deposition_diameter = deposition_diameter # Estimated diameter of deposition area, [mm]
+        self.vertical_length = vertical_length         # Height of the N, [mm]
+        self.horizontal_length = horizontal_length     # Distance between the two uprights of the N, [mm]
+        self.num_layers = num_layers                   # Number of layers to deposit, [unitless]
+        self.feed_rate = feed_rate                     # Wire feed rate, [mm/s]
+        self.layer_height = layer_height               # Height of tool tip above substrate or previous layer, [mm]
+        self.spindle_speed = spindle_speed             # Spindle speed, [rpm]
+        self.initial_pause = initial_pause             # Whether to wait at zero height for user input to start
+        self.heightmap_cell = heightmap_cell           # Cell size of the heightmap to adapt the feed to, 0 for the flat-layer model, [mm]
+
+        self.deposition_area = pi * deposition_diameter ** 2 / 4 # Area of deposition under the nozzle
+        self.wire_area = pi * wire_diameter ** 2 / 4             # Cross-sectional area of the wire, [mm^2]
+        self.wire_volumetric_rate = feed_rate * self.wire_area   # Volumetric rate of wire addition, [mm^3 s^-1]
+
+        self.climb_feed_volume = self.deposition_area * layer_height                # Volume to be filled while the tool is moving up one layer in Z, [mm^3]
+        self.climb_feed_length = self.climb_feed_volume / self.wire_area            # Length of material fed while changing layer, [mm]
+        self.climb_time = self.climb_feed_volume / self.wire_volumetric_rate        # Time taken to feed the wire while changing layer, [s]
+        self.climb_rate = layer_height / self.climb_time * 60                       # Linear feedrate shown on the controller, [mm/min]
+
+        self.vertical_feed_volume = vertical_length * deposition_diameter * layer_height # Volume to be filled while the tool is making the vertical part of the N, [mm^3]
+        self.vertical_feed_length = self.vertical_feed_volume / self.wire_area           # Length of material fed, [mm]
+        self.vertical_time = self.vertical_feed_volume / self.wire_volumetric_rate       # Time taken to feed the wire, [s]
+        self.vertical_rate = vertical_length / self.vertical_time * 60                   # Linear feedrate shown on the controller, [mm/min]
+
+        self.diagonal_length = (vertical_length**2 + horizontal_length**2)**0.5               # Diagonal length of the N, [mm]
+        self.diagonal_feed_volume = self.diagonal_length * deposition_diameter * layer_height # Volume to be filled while the tool is making the diagonal part of the N, [mm^3]
+        self.diagonal_feed_length = self.diagonal_feed_volume / self.wire_area                # Length of material fed, [mm]
+        self.diagonal_time = self.diagonal_feed_volume / self.wire_volumetric_rate            # Time taken to feed the wire, [s]
+        self.diagonal_rate = self.diagonal_length / self.diagonal_time * 60                   # Linear feedrate shown on the controller, [mm/min]
+
+        self.escape_time = escape_feed_length / feed_rate # Time taken to feed the wire while escaping, [s]
+
+        self.total_time = (approach_duration + num_layers * (2 * self.vertical_time + self.diagonal_time + self.climb_time)) / 60 # Total time for deposition, [min]
+
+        h, v = horizontal_length, vertical_length
+        fv, fd = 60/self.vertical_time, 60/self.diagonal_time
+        # Odd layers start at the upper right, even layers start at the lower left
+        bodies = [[(VERTICAL, -h/2, v/2, self.vertical_feed_length, fv, 'G1 X{x:.2f} Y{y:.2f} C{c:.2f} F{f:.2f} ; Move up the left vertical of the N \n'),
+                   (DIAGONAL, h/2, -v/2, self.diagonal_feed_length, fd, 'G1 X{x:.2f} Y{y:.2f} C{c:.2f} F{f:.2f} ; Move down across the diagonal of the N \n'),
+                   (VERTICAL, h/2, v/2, self.vertical_feed_length, fv, 'G1 X{x:.2f} Y{y:.2f} C{c:.2f} F{f:.2f} ; Move up the right vertical of the N \n')],
+                  [(VERTICAL, h/2, -v/2, self.vertical_feed_length, fv, 'G1 X{x:.2f} Y{y:.2f} C{c:.2f} F{f:.2f} ; Move down the right vertical of the N \n'),
+                   (DIAGONAL, -h/2, v/2, self.diagonal_feed_length, fd, 'G1 X{x:.2f} Y{y:.2f} C{c:.2f} F{f:.2f} ; Move up across the diagonal of the N \n'),
+                   (VERTICAL, -h/2, -v/2, self.vertical_feed_length, fv, 'G1 X{x:.2f} Y{y:.2f} C{c:.2f} F{f:.2f} ; Move down the left vertical of the N \n')]]
+        self._set_layer_template(bodies, [-h/2, h/2], [-v/2, v/2])
+        if (heightmap_cell):
+            self.adapt_feed(heightmap_cell)
+
+    def header(self, sample_id):
+        return ('; Sample ID:                {} \n'.format(sample_id) +
+                '; ~~~ Arguments used for gcode generation ~~~\n' +
+                '; Approach Height:            {:7.2f} [mm] \n'.format(self.approach_height) +
+                '; Approach Duration:          {:7.2f} [s] \n'.format(self.approach_duration) +
+                '; Wire Diameter:              {:7.2f} [mm] \n'.format(self.wire_diameter) +
+                '; Deposition Diameter:        {:7.2f} [mm] \n'.format(self.deposition_diameter) +
+                '; Vertical Length:            {:7.2f} [mm] \n'.format(self.vertical_length) +
+                '; Horizontal Length:          {:7.2f} [mm] \n'.format(self.horizontal_length) +
+                '; Number of Layers:           {:7.0f} [unitless] \n'.format(self.num_layers) +
+                '; Wire Feed Rate:             {:7.2f} [mm/s] \n'.format(self.feed_rate) +
+                '; Layer Height:               {:7.2f} [mm] \n'.format(self.layer_height) +
+                '; Spindle Speed:              {:7.0f} [rpm] \n'.format(self.spindle_speed) +
+                '; Initial Preheating Pause:      {} \n'.format(self.initial_pause) +
+                '; ~~~ Calculated Values ~~~\n' +
+                '; Wire Feed Rate:             {:7.2f} [mm/min] \n'.format(self.feed_rate*60) +
+                '; Vertical Rate:              {:7.2f} [mm/min] \n'.format(self.vertical_rate) +
+                '; Diagonal Rate:              {:7.2f} [mm/min] \n'.format(self.diagonal_rate) +
+                '; Climb Rate:                 {:7.2f} [mm/min] \n'.format(self.climb_rate) +
+                '; Total Time:                 {:7.2f} [min] \n'.format(self.total_time) +
+                self.heightmap_header() + self.estimate_header() + '\n')
+
+    def preamble(self):
+        output = program_start
+        output += 'G0 Z{:.2f} ; Rapid to the approach height \n'.format(self.approach_height)
+        output += 'G0 X{:.2f} Y{:.2f} ; Rapid to the start of the N in XY \n'.format(-self.horizontal_length/2, -self.vertical_length/2)
+        output += 'M3 S{} ; Start the spindle \n'.format(self.spindle_speed)
+        output += 'G93 ; Turn on Inverse Time mode \n'
+        output += '\nG1 Z0.0 F{:.2f} ; Feed down to the substrate in Z \n'.format(60/self.approach_duration)
+        if (self.initial_pause):
+            output += 'M0 ; Pause for operator to allow preheating \n'
+        return output
+
+    def start_position(self):
+        return -self.horizontal_length/2, -self.vertical_length/2
+
+    def prefix_moves(self):
+        # One pass over the even-layer N at zero height, without feeding
+        return [(BLANK, x, y, f, fmt) for kind, x, y, dc, f, fmt in self.bodies[0]]
+
+class Pillar(Pattern):
+    name = 'pillar'
+    id_prefix = 'DEP-P-'
+    header_width = 21
+    climb_format = 'G1 Z{z:.2f} C{c:.2f} F{f:.2f} ; Move up to the pillar height while feeding \n'
+    calculated = ['climb_rate', 'total_time']
+
+    def __init__(self, approach_height=20.0, approach_duration=30.0, wire_diameter=0.9, deposition_diameter=4.0,
+                 pillar_height=10.0, feed_rate=1.0, spindle_speed=24000, initial_pause=5.0):
+        self.approach_height = approach_height         # Height above surface to rapid to when program starts, [mm]
+        self.approach_duration = approach_duration     # Duration over which to approach the layer height, [s]
+        self.wire_diameter = wire_diameter             # Diameter of the feedstock wire, [mm]
+        self.deposition_diameter = deposition_diameter # Estimated diameter of deposition area, [mm]
+        self.pillar_height = pillar_height             # Height of the pillar, [mm]
+        self.feed_rate = feed_rate                     # Wire feed rate, [mm/s]
+        self.spindle_speed = spindle_speed             # Spindle speed, [rpm]
+        self.initial_pause = initial_pause             # Time spent paused at zero height, [s]
+        self.num_layers = 1                            # The pillar is deposited as a single climb
+        self.layer_height = pillar_height
+
+        self.deposition_area = pi * deposition_diameter ** 2 / 4 # Area of deposition under the nozzle
+        self.wire_area = pi * wire_diameter ** 2 / 4             # Cross-sectional area of the wire, [mm^2]
+        self.wire_volumetric_rate = feed_rate * self.wire_area   # Volumetric rate of wire addition, [mm^3 s^-1]
+
+        self.climb_feed_volume = self.deposition_area * pillar_height          # Volume to be filled for the entire pillar, [mm^3]
+        self.climb_feed_length = self.climb_feed_volume / self.wire_area       # Length of material fed while changing layer, [mm]
+        self.climb_time = self.climb_feed_volume / self.wire_volumetric_rate   # Time taken to feed the wire while changing layer, [s]
+        self.climb_rate = pillar_height / self.climb_time * 60                 # Linear feedrate shown on the controller, [mm/min]
+
+        self.total_time = (self.climb_time + initial_pause + approach_duration) / 60 # Total time for deposition, [min]
+
+        self._set_layer_template([[], []], [0.0, 0.0], [0.0, 0.0])
+
+    def header(self, sample_id):
+        return ('; Sample ID:           {} \n'.format(sample_id) +
+                '; ~~~ Arguments used for gcode generation ~~~\n' +
+                '; Approach Height:     {:7.2f} [mm] \n'.format(self.approach_height) +
+                '; Approach Duration:   {:7.2f} [s] \n'.format(self.approach_duration) +
+                '; Wire Diameter:       {:7.2f} [mm] \n'.format(self.wire_diameter) +
+                '; Deposition Diameter: {:7.2f} [mm] \n'.format(self.deposition_diameter) +
+                '; pillar Height:       {:7.2f} [mm] \n'.format(self.pillar_height) +
+                '; Wire Feed Rate:      {:7.2f} [mm/s] \n'.format(self.feed_rate) +
+                '; Spindle Speed        {:7.0f} [rpm] \n'.format(self.spindle_speed) +
+                '; Initial Pause:       {:7.2f} [s] \n'.format(self.initial_pause) +
+                '; ~~~ Calculated Values ~~~\n' +
+                '; Climb rate:          {:7.2f} [mm/min] \n'.format(self.climb_rate) +
+                '; Total time:          {:7.2f} [min] \n'.format(self.total_time) +
+                self.heightmap_header() + self.estimate_header() + '\n')
+
+    def preamble(self):
+        output = program_start
+        output += 'G0 Z{:.2f} ; Rapid to the approach height \n'.format(self.approach_height)
+        output += 'G0 X0.0 Y0.0; Rapid to the start of the pillar in XY \n'
+        output += 'M3 S{} ; Start the spindle \n'.format(self.spindle_speed)
+        output += 'G93 ; Turn on Inverse Time mode \n\n'
+        output += 'G1 Z0.0 F{:.2f} ; Feed down to the substrate in Z \n'.format(60/self.approach_duration)
+        output += 'G4 P{:.2f} ; Pause at zero height \n'.format(self.initial_pause)
+        return output
+
+    def start_position(self):
+        return 0.0, 0.0
+
+    def dwell_time(self):
+        return self.initial_pause
+
+    def escape_move(self):
+        return 15.0, 10.0, float(simulate.units_duration(15.0, 10.0, 60.0)) # Written in G94 at F60.0 [mm/min]
+
+    def escape(self):
+        return ('\nG94 ; Turn off Inverse Time mode \n'
+                'G91 ; Relative positioning mode \n\n'
+                'G1 Z15.0 C10.0 F60.0; Move up while extruding \n'
+                'M05 ; Turn off spindle')
+
+class Drawing(Pattern):
+    name = 'drawing'
+    id_prefix = 'DEP-D-'
+    climb_format = 'G1 Z{z:.2f} C{c:.2f} F{f:.2f} ; Move up to layer {layer} \n'
+    calculated = ['trace_rate', 'climb_rate', 'path_length', 'travel_length', 'total_time']
+    input_files = ['drawing']
+
+    def __init__(self, approach_height=20.0, approach_duration=30.0, wire_diameter=0.9, deposition_diameter=3.5,
+                 drawing='', scale=1.0, tolerance=0.01, num_layers=5, feed_rate=1.0, layer_height=0.05,
+                 travel_rate=600.0, spindle_speed=24000, initial_pause=False, heightmap_cell=0.0):
+        self.approach_height = approach_height         # Height above surface to rapid to when program starts, [mm]
+        self.approach_duration = approach_duration     # Duration over which to approach the layer height, [s]
+        self.wire_diameter = wire_diameter             # Diameter of the feedstock wire, [mm]
+        self.deposition_diameter = deposition_diameter # Estimated diameter of deposition area, [mm]
+        self.drawing = drawing                         # DXF, CSV or JSON file holding the paths to deposit
+        self.scale = scale                             # Size of one drawing unit, [mm]
+        self.tolerance = tolerance                     # Largest distance between an arc and the chords it is split into, [mm]
+        self.num_layers = num_layers                   # Number of layers to deposit, [unitless]
+        self.feed_rate = feed_rate                     # Wire feed rate, [mm/s]
+        self.layer_height = layer_height               # Height of tool tip above substrate or previous layer, [mm]
+        self.travel_rate = travel_rate                 # Linear feedrate of the moves between paths, without feeding, [mm/min]
+        self.spindle_speed = spindle_speed             # Spindle speed, [rpm]
+        self.initial_pause = initial_pause             # Whether to wait at zero height for user input to start
+        self.heightmap_cell = heightmap_cell           # Cell size of the heightmap to adapt the feed to, 0 for the flat-layer model, [mm]
+        if not drawing:
+            raise ValueError('The drawing pattern needs a drawing file')
+
+        self.deposition_area = pi * deposition_diameter ** 2 / 4 # Area of deposition under the nozzle
+        self.wire_area = pi * wire_diameter ** 2 / 4             # Cross-sectional area of the wire, [mm^2]
+        self.wire_volumetric_rate = feed_rate * self.wire_area   # Volumetric rate of wire addition, [mm^3 s^-1]
+
+        self.climb_feed_volume = self.deposition_area * layer_height                # Volume to be filled while the tool is moving up one layer in Z, [mm^3]
+        self.climb_feed_length = self.climb_feed_volume / self.wire_area            # Length of material fed while changing layer, [mm]
+        self.climb_time = self.climb_feed_volume / self.wire_volumetric_rate        # Time taken to feed the wire while changing layer, [s]
+        self.climb_rate = layer_height / self.climb_time * 60                       # Linear feedrate shown on the controller, [mm/min]
+
+        # Chords too short to feed output_resolution of wire are merged with their neighbours, as a move feeding less
+        # would be written with no change in C
+        min_length = output_resolution * self.wire_area / (deposition_diameter * layer_height) # Shortest move along a path, [mm]
+        paths = [geometry.merge_short(path, min_length) for path in geometry.join(geometry.load(drawing, scale, tolerance))]
+        short = [path for path in paths if np.hypot(*np.diff(path, axis=0).T).sum() < min_length]
+        if short:
+            warnings.warn('{} paths of {} are shorter than {:.3f} [mm] at scale {} and are left out, as they would feed '
+                          'less wire than the {} [mm] C is written to'.format(len(short), drawing, min_length, scale, output_resolution))
+            paths = [path for path in paths if np.hypot(*np.diff(path, axis=0).T).sum() >= min_length]
+            if not paths:
+                raise ValueError('Drawing {} has no paths long enough to deposit at scale {}'.format(drawing, scale))
+
+        # The paths of the drawing in the order they are deposited, as one list of points and the kind of each move
+        paths = geometry.order_paths(paths)
+        points = np.vstack(paths)
+        kinds = np.concatenate([np.full(len(path), TRACE) for path in paths])
+        kinds[np.cumsum([len(path) for path in paths[:-1]], dtype=int)] = BLANK # The first point of each later path is reached by a travel move
+        length = np.hypot(*np.diff(points, axis=0).T)
+        kinds = kinds[1:][length > 0]
+        points = np.vstack([points[:1], points[1:][length > 0]])
+        length = length[length > 0]
+        tracing = kinds == TRACE
+
+        self.path_length = length[tracing].sum()                                      # Length of the paths deposited on each layer, [mm]
+        self.travel_length = length[~tracing].sum()                                   # Length of the moves between paths on each layer, [mm]
+        self.trace_feed_volume = length * deposition_diameter * layer_height * tracing # Volume to be filled along each move, [mm^3]
+        self.trace_feed_length = self.trace_feed_volume / self.wire_area              # Length of material fed along each move, [mm]
+        self.trace_time = self.trace_feed_volume / self.wire_volumetric_rate          # Time taken to feed the wire along each move, [s]
+        self.trace_rate = self.wire_volumetric_rate / (deposition_diameter * layer_height) * 60 # Linear feedrate shown on the controller, [mm/min]
+        self.travel_time = length / travel_rate * 60 * ~tracing                       # Time taken by each move between paths, [s]
+
+        self.escape_time = escape_feed_length / feed_rate # Time taken to feed the wire while escaping, [s]
+
+        layer_time = self.trace_time.sum() + self.travel_time.sum() + self.climb_time
+        self.total_time = (approach_duration + num_layers * layer_time) / 60 # Total time for deposition, [min]
+
+        # Odd layers follow the paths forward from the first point, even layers backward from the last point
+        f = 60 / (self.trace_time + self.travel_time)
+        formats = {TRACE: 'G1 X{x:.2f} Y{y:.2f} C{c:.2f} F{f:.2f} ; Feed along the drawing \n',
+                   BLANK: 'G1 X{x:.2f} Y{y:.2f} C{c:.2f} F{f:.2f} ; Move to the next path without feeding \n'}
+        forward = [(kind, x, y, dc, f, formats[kind]) for kind, (x, y), dc, f
+                   in zip(kinds.tolist(), points[1:].tolist(), self.trace_feed_length.tolist(), f.tolist())]
+        backward = [(kind, x, y, dc, f, formats[kind]) for kind, (x, y), dc, f
+                    in zip(kinds[::-1].tolist(), points[-2::-1].tolist(), self.trace_feed_length[::-1].tolist(), f[::-1].tolist())]
+        self._set_layer_template([backward, forward], [points[-1, 0], points[0, 0]], [points[-1, 1], points[0, 1]])
+        if (heightmap_cell):
+            self.adapt_feed(heightmap_cell)
+
+    def header(self, sample_id):
+        return ('; Sample ID:                {} \n'.format(sample_id) +
+                '; ~~~ Arguments used for gcode generation ~~~\n' +
+                '; Approach Height:            {:7.2f} [mm] \n'.format(self.approach_height) +
+                '; Approach Duration:          {:7.2f} [s] \n'.format(self.approach_duration) +
+                '; Wire Diameter:              {:7.2f} [mm] \n'.format(self.wire_diameter) +
+                '; Deposition Diameter:        {:7.2f} [mm] \n'.format(self.deposition_diameter) +
+                '; Drawing:                       {} \n'.format(self.drawing) +
+                '; Drawing Scale:              {:7.2f} [mm] \n'.format(self.scale) +
+                '; Arc Tolerance:              {:7.2f} [mm] \n'.format(self.tolerance) +
+                '; Number of Layers:           {:7.0f} [unitless] \n'.format(self.num_layers) +
+                '; Wire Feed Rate:             {:7.2f} [mm/s] \n'.format(self.feed_rate) +
+                '; Layer Height:               {:7.2f} [mm] \n'.format(self.layer_height) +
+                '; Travel Rate:                {:7.2f} [mm/min] \n'.format(self.travel_rate) +
+                '; Spindle Speed:              {:7.0f} [rpm] \n'.format(self.spindle_speed) +
+                '; Initial Preheating Pause:      {} \n'.format(self.initial_pause) +
+                '; ~~~ Calculated Values ~~~\n' +
+                '; Wire Feed Rate:             {:7.2f} [mm/min] \n'.format(self.feed_rate*60) +
+                '; Trace Rate:                 {:7.2f} [mm/min] \n'.format(self.trace_rate) +
+                '; Climb Rate:                 {:7.2f} [mm/min] \n'.format(self.climb_rate) +
+                '; Path Length:                {:7.2f} [mm] \n'.format(self.path_length) +
+                '; Travel Length:              {:7.2f} [mm] \n'.format(self.travel_length) +
+                '; Total Time:                 {:7.2f} [min] \n'.format(self.total_time) +
+                self.heightmap_header() + self.estimate_header() + '\n')
+
+    def preamble(self):
+        x, y = self.start_position()
+        output = program_start
+        output += 'G0 Z{:.2f} ; Rapid to the approach height \n'.format(self.approach_height)
+        output += 'G0 X{:.2f} Y{:.2f} ; Rapid to the start of the drawing in XY \n'.format(x, y)
+        output += 'M3 S{} ; Start the spindle \n'.format(self.spindle_speed)
+        output += 'G93 ; Turn on Inverse Time mode \n'
+        output += '\nG1 Z0.0 F{:.2f} ; Feed down to the substrate in Z \n'.format(60/self.approach_duration)
+        if (self.initial_pause):
+            output += 'M0 ; Pause for operator to allow preheating \n'
+        return output
+
+    def start_position(self):
+        return self.template[1, 0]['x'], self.template[1, 0]['y']
+
+patterns = {cls.name: cls for cls in (Line, N, Pillar, Drawing)}
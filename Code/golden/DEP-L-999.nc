@@ -0,0 +1,48 @@
+; Sample ID:                DEP-L-999 
+; ~~~ Arguments used for gcode generation ~~~
+; Approach Height:              20.00 [mm] 
+; Approach Duration:            30.00 [s] 
+; Wire Diameter:                 0.90 [mm] 
+; Deposition Diameter:           3.30 [mm] 
+; Line Length:                  10.00 [mm] 
+; Number of Layers:                 5 [unitless] 
+; Wire Feed Rate:                1.00 [mm/s] 
+; Layer Height:                  0.05 [mm] 
+; Spindle Speed:                24000 [rpm] 
+; Initial Pass Left-to-Right:    False 
+; Dummy First Pass:              False 
+; Initial Preheating Pause:      False 
+; ~~~ Calculated Values ~~~
+; Wire Feed Rate:               60.00 [mm/min] 
+; Traverse Rate:               231.34 [mm/min] 
+; Climb Rate:                    4.46 [mm/min] 
+; Total Time:                    0.77 [min] 
+
+G17 ; Select XY plane for circular interpolation 
+G21 ; Select metric units of [mm] 
+G54 ; Select G54 Work Coordinate System 
+G90 ; Absolute positioning mode 
+
+G92 C0.0 ; Reset the C axis to zero 
+G0 Z20.00 ; Rapid to the approach height 
+G0 X5.00 Y0.0 ; Rapid to the start of the line in XY 
+M3 S24000 ; Start the spindle 
+G93 ; Turn on Inverse Time mode 
+
+G1 Z0.0 F2.00 ; Feed down to the substrate in Z 
+
+G1 Z0.05 C0.67 F89.26 ; Move up to layer 1 
+G1 X-5.00 Y0.0 C3.27 F23.13 ; Feed across layer 1 
+G1 Z0.10 C3.94 F89.26 ; Move up to layer 2 
+G1 X5.00 Y0.0 C6.53 F23.13 ; Feed across layer 2 
+G1 Z0.15 C7.20 F89.26 ; Move up to layer 3 
+G1 X-5.00 Y0.0 C9.80 F23.13 ; Feed across layer 3 
+G1 Z0.20 C10.47 F89.26 ; Move up to layer 4 
+G1 X5.00 Y0.0 C13.06 F23.13 ; Feed across layer 4 
+G1 Z0.25 C13.74 F89.26 ; Move up to layer 5 
+G1 X-5.00 Y0.0 C16.33 F23.13 ; Feed across layer 5 
+
+G91 ; Relative positioning mode 
+G1 Z20.00 C10.00 F6.00 ; Move up while extruding 
+G94 ; Turn off Inverse Time mode 
+M05 ; Turn off spindle
\ No newline at end of file
@@ -0,0 +1,440 @@
+; Sample ID:                DEP-N-999 
+; ~~~ Arguments used for gcode generation ~~~
+; Approach Height:              20.00 [mm] 
+; Approach Duration:            30.00 [s] 
+; Wire Diameter:                 0.86 [mm] 
+; Deposition Diameter:           3.50 [mm] 
+; Vertical Length:              10.00 [mm] 
+; Horizontal Length:            10.00 [mm] 
+; Number of Layers:               100 [unitless] 
+; Wire Feed Rate:                1.00 [mm/s] 
+; Layer Height:                  0.05 [mm] 
+; Spindle Speed:                24000 [rpm] 
+; Initial Preheating Pause:      False 
+; ~~~ Calculated Values ~~~
+; Wire Feed Rate:               60.00 [mm/min] 
+; Vertical Rate:               199.16 [mm/min] 
+; Diagonal Rate:               199.16 [mm/min] 
+; Climb Rate:                    3.62 [mm/min] 
+; Total Time:                   19.02 [min] 
+
+G17 ; Select XY plane for circular interpolation 
+G21 ; Select metric units of [mm] 
+G54 ; Select G54 Work Coordinate System 
+G90 ; Absolute positioning mode 
+
+G92 C0.0 ; Reset the C axis to zero 
+G0 Z20.00 ; Rapid to the approach height 
+G0 X-5.00 Y-5.00 ; Rapid to the start of the N in XY 
+M3 S24000 ; Start the spindle 
+G93 ; Turn on Inverse Time mode 
+
+G1 Z0.0 F2.00 ; Feed down to the substrate in Z 
+G1 X-5.00 Y5.00 C0.00 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C0.00 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C0.00 F19.92 ; Move up the right vertical of the N 
+G1 Z0.05 C0.83 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C3.84 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C8.10 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C11.11 F19.92 ; Move down the left vertical of the N 
+G1 Z0.10 C11.94 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C14.95 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C19.22 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C22.23 F19.92 ; Move up the right vertical of the N 
+G1 Z0.15 C23.06 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C26.07 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C30.33 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C33.34 F19.92 ; Move down the left vertical of the N 
+G1 Z0.20 C34.17 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C37.18 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C41.44 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C44.46 F19.92 ; Move up the right vertical of the N 
+G1 Z0.25 C45.28 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C48.30 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C52.56 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C55.57 F19.92 ; Move down the left vertical of the N 
+G1 Z0.30 C56.40 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C59.41 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C63.67 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C66.68 F19.92 ; Move up the right vertical of the N 
+G1 Z0.35 C67.51 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C70.53 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C74.79 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C77.80 F19.92 ; Move down the left vertical of the N 
+G1 Z0.40 C78.63 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C81.64 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C85.90 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C88.91 F19.92 ; Move up the right vertical of the N 
+G1 Z0.45 C89.74 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C92.75 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C97.01 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C100.03 F19.92 ; Move down the left vertical of the N 
+G1 Z0.50 C100.85 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C103.87 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C108.13 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C111.14 F19.92 ; Move up the right vertical of the N 
+G1 Z0.55 C111.97 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C114.98 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C119.24 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C122.25 F19.92 ; Move down the left vertical of the N 
+G1 Z0.60 C123.08 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C126.10 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C130.36 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C133.37 F19.92 ; Move up the right vertical of the N 
+G1 Z0.65 C134.20 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C137.21 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C141.47 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C144.48 F19.92 ; Move down the left vertical of the N 
+G1 Z0.70 C145.31 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C148.32 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C152.58 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C155.60 F19.92 ; Move up the right vertical of the N 
+G1 Z0.75 C156.42 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C159.44 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C163.70 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C166.71 F19.92 ; Move down the left vertical of the N 
+G1 Z0.80 C167.54 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C170.55 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C174.81 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C177.82 F19.92 ; Move up the right vertical of the N 
+G1 Z0.85 C178.65 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C181.67 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C185.93 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C188.94 F19.92 ; Move down the left vertical of the N 
+G1 Z0.90 C189.77 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C192.78 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C197.04 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C200.05 F19.92 ; Move up the right vertical of the N 
+G1 Z0.95 C200.88 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C203.89 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C208.15 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C211.17 F19.92 ; Move down the left vertical of the N 
+G1 Z1.00 C212.00 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C215.01 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C219.27 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C222.28 F19.92 ; Move up the right vertical of the N 
+G1 Z1.05 C223.11 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C226.12 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C230.38 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C233.40 F19.92 ; Move down the left vertical of the N 
+G1 Z1.10 C234.22 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C237.24 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C241.50 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C244.51 F19.92 ; Move up the right vertical of the N 
+G1 Z1.15 C245.34 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C248.35 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C252.61 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C255.62 F19.92 ; Move down the left vertical of the N 
+G1 Z1.20 C256.45 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C259.46 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C263.72 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C266.74 F19.92 ; Move up the right vertical of the N 
+G1 Z1.25 C267.57 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C270.58 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C274.84 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C277.85 F19.92 ; Move down the left vertical of the N 
+G1 Z1.30 C278.68 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C281.69 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C285.95 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C288.97 F19.92 ; Move up the right vertical of the N 
+G1 Z1.35 C289.79 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C292.81 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C297.07 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C300.08 F19.92 ; Move down the left vertical of the N 
+G1 Z1.40 C300.91 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C303.92 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C308.18 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C311.19 F19.92 ; Move up the right vertical of the N 
+G1 Z1.45 C312.02 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C315.03 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C319.29 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C322.31 F19.92 ; Move down the left vertical of the N 
+G1 Z1.50 C323.14 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C326.15 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C330.41 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C333.42 F19.92 ; Move up the right vertical of the N 
+G1 Z1.55 C334.25 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C337.26 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C341.52 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C344.54 F19.92 ; Move down the left vertical of the N 
+G1 Z1.60 C345.36 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C348.38 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C352.64 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C355.65 F19.92 ; Move up the right vertical of the N 
+G1 Z1.65 C356.48 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C359.49 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C363.75 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C366.76 F19.92 ; Move down the left vertical of the N 
+G1 Z1.70 C367.59 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C370.60 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C374.87 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C377.88 F19.92 ; Move up the right vertical of the N 
+G1 Z1.75 C378.71 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C381.72 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C385.98 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C388.99 F19.92 ; Move down the left vertical of the N 
+G1 Z1.80 C389.82 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C392.83 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C397.09 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C400.11 F19.92 ; Move up the right vertical of the N 
+G1 Z1.85 C400.93 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C403.95 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C408.21 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C411.22 F19.92 ; Move down the left vertical of the N 
+G1 Z1.90 C412.05 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C415.06 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C419.32 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C422.33 F19.92 ; Move up the right vertical of the N 
+G1 Z1.95 C423.16 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C426.17 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C430.44 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C433.45 F19.92 ; Move down the left vertical of the N 
+G1 Z2.00 C434.28 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C437.29 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C441.55 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C444.56 F19.92 ; Move up the right vertical of the N 
+G1 Z2.05 C445.39 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C448.40 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C452.66 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C455.68 F19.92 ; Move down the left vertical of the N 
+G1 Z2.10 C456.50 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C459.52 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C463.78 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C466.79 F19.92 ; Move up the right vertical of the N 
+G1 Z2.15 C467.62 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C470.63 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C474.89 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C477.90 F19.92 ; Move down the left vertical of the N 
+G1 Z2.20 C478.73 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C481.75 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C486.01 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C489.02 F19.92 ; Move up the right vertical of the N 
+G1 Z2.25 C489.85 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C492.86 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C497.12 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C500.13 F19.92 ; Move down the left vertical of the N 
+G1 Z2.30 C500.96 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C503.97 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C508.23 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C511.25 F19.92 ; Move up the right vertical of the N 
+G1 Z2.35 C512.07 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C515.09 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C519.35 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C522.36 F19.92 ; Move down the left vertical of the N 
+G1 Z2.40 C523.19 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C526.20 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C530.46 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C533.47 F19.92 ; Move up the right vertical of the N 
+G1 Z2.45 C534.30 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C537.32 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C541.58 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C544.59 F19.92 ; Move down the left vertical of the N 
+G1 Z2.50 C545.42 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C548.43 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C552.69 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C555.70 F19.92 ; Move up the right vertical of the N 
+G1 Z2.55 C556.53 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C559.54 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C563.80 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C566.82 F19.92 ; Move down the left vertical of the N 
+G1 Z2.60 C567.64 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C570.66 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C574.92 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C577.93 F19.92 ; Move up the right vertical of the N 
+G1 Z2.65 C578.76 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C581.77 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C586.03 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C589.04 F19.92 ; Move down the left vertical of the N 
+G1 Z2.70 C589.87 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C592.89 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C597.15 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C600.16 F19.92 ; Move up the right vertical of the N 
+G1 Z2.75 C600.99 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C604.00 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C608.26 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C611.27 F19.92 ; Move down the left vertical of the N 
+G1 Z2.80 C612.10 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C615.11 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C619.37 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C622.39 F19.92 ; Move up the right vertical of the N 
+G1 Z2.85 C623.21 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C626.23 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C630.49 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C633.50 F19.92 ; Move down the left vertical of the N 
+G1 Z2.90 C634.33 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C637.34 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C641.60 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C644.61 F19.92 ; Move up the right vertical of the N 
+G1 Z2.95 C645.44 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C648.46 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C652.72 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C655.73 F19.92 ; Move down the left vertical of the N 
+G1 Z3.00 C656.56 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C659.57 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C663.83 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C666.84 F19.92 ; Move up the right vertical of the N 
+G1 Z3.05 C667.67 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C670.68 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C674.94 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C677.96 F19.92 ; Move down the left vertical of the N 
+G1 Z3.10 C678.79 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C681.80 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C686.06 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C689.07 F19.92 ; Move up the right vertical of the N 
+G1 Z3.15 C689.90 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C692.91 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C697.17 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C700.19 F19.92 ; Move down the left vertical of the N 
+G1 Z3.20 C701.01 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C704.03 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C708.29 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C711.30 F19.92 ; Move up the right vertical of the N 
+G1 Z3.25 C712.13 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C715.14 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C719.40 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C722.41 F19.92 ; Move down the left vertical of the N 
+G1 Z3.30 C723.24 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C726.25 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C730.51 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C733.53 F19.92 ; Move up the right vertical of the N 
+G1 Z3.35 C734.36 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C737.37 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C741.63 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C744.64 F19.92 ; Move down the left vertical of the N 
+G1 Z3.40 C745.47 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C748.48 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C752.74 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C755.76 F19.92 ; Move up the right vertical of the N 
+G1 Z3.45 C756.58 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C759.60 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C763.86 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C766.87 F19.92 ; Move down the left vertical of the N 
+G1 Z3.50 C767.70 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C770.71 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C774.97 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C777.98 F19.92 ; Move up the right vertical of the N 
+G1 Z3.55 C778.81 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C781.82 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C786.08 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C789.10 F19.92 ; Move down the left vertical of the N 
+G1 Z3.60 C789.93 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C792.94 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C797.20 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C800.21 F19.92 ; Move up the right vertical of the N 
+G1 Z3.65 C801.04 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C804.05 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C808.31 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C811.33 F19.92 ; Move down the left vertical of the N 
+G1 Z3.70 C812.15 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C815.17 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C819.43 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C822.44 F19.92 ; Move up the right vertical of the N 
+G1 Z3.75 C823.27 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C826.28 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C830.54 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C833.55 F19.92 ; Move down the left vertical of the N 
+G1 Z3.80 C834.38 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C837.39 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C841.66 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C844.67 F19.92 ; Move up the right vertical of the N 
+G1 Z3.85 C845.50 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C848.51 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C852.77 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C855.78 F19.92 ; Move down the left vertical of the N 
+G1 Z3.90 C856.61 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C859.62 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C863.88 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C866.90 F19.92 ; Move up the right vertical of the N 
+G1 Z3.95 C867.72 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C870.74 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C875.00 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C878.01 F19.92 ; Move down the left vertical of the N 
+G1 Z4.00 C878.84 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C881.85 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C886.11 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C889.12 F19.92 ; Move up the right vertical of the N 
+G1 Z4.05 C889.95 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C892.96 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C897.23 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C900.24 F19.92 ; Move down the left vertical of the N 
+G1 Z4.10 C901.07 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C904.08 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C908.34 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C911.35 F19.92 ; Move up the right vertical of the N 
+G1 Z4.15 C912.18 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C915.19 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C919.45 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C922.47 F19.92 ; Move down the left vertical of the N 
+G1 Z4.20 C923.29 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C926.31 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C930.57 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C933.58 F19.92 ; Move up the right vertical of the N 
+G1 Z4.25 C934.41 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C937.42 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C941.68 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C944.69 F19.92 ; Move down the left vertical of the N 
+G1 Z4.30 C945.52 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C948.54 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C952.80 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C955.81 F19.92 ; Move up the right vertical of the N 
+G1 Z4.35 C956.64 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C959.65 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C963.91 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C966.92 F19.92 ; Move down the left vertical of the N 
+G1 Z4.40 C967.75 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C970.76 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C975.02 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C978.04 F19.92 ; Move up the right vertical of the N 
+G1 Z4.45 C978.86 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C981.88 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C986.14 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C989.15 F19.92 ; Move down the left vertical of the N 
+G1 Z4.50 C989.98 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C992.99 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C997.25 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C1000.26 F19.92 ; Move up the right vertical of the N 
+G1 Z4.55 C1001.09 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C1004.11 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C1008.37 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C1011.38 F19.92 ; Move down the left vertical of the N 
+G1 Z4.60 C1012.21 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C1015.22 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C1019.48 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C1022.49 F19.92 ; Move up the right vertical of the N 
+G1 Z4.65 C1023.32 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C1026.33 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C1030.59 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C1033.61 F19.92 ; Move down the left vertical of the N 
+G1 Z4.70 C1034.43 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C1037.45 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C1041.71 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C1044.72 F19.92 ; Move up the right vertical of the N 
+G1 Z4.75 C1045.55 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C1048.56 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C1052.82 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C1055.83 F19.92 ; Move down the left vertical of the N 
+G1 Z4.80 C1056.66 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C1059.68 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C1063.94 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C1066.95 F19.92 ; Move up the right vertical of the N 
+G1 Z4.85 C1067.78 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C1070.79 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C1075.05 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C1078.06 F19.92 ; Move down the left vertical of the N 
+G1 Z4.90 C1078.89 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C1081.90 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C1086.16 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C1089.18 F19.92 ; Move up the right vertical of the N 
+G1 Z4.95 C1090.01 F72.45 ; Move up one layer height while feeding 
+G1 X5.00 Y-5.00 C1093.02 F19.92 ; Move down the right vertical of the N 
+G1 X-5.00 Y5.00 C1097.28 F14.08 ; Move up across the diagonal of the N 
+G1 X-5.00 Y-5.00 C1100.29 F19.92 ; Move down the left vertical of the N 
+G1 Z5.00 C1101.12 F72.45 ; Move up one layer height while feeding 
+G1 X-5.00 Y5.00 C1104.13 F19.92 ; Move up the left vertical of the N 
+G1 X5.00 Y-5.00 C1108.39 F14.08 ; Move down across the diagonal of the N 
+G1 X5.00 Y5.00 C1111.41 F19.92 ; Move up the right vertical of the N 
+
+G91 ; Relative positioning mode 
+G1 Z20.00 C10.00 F6.00 ; Move up while extruding 
+G94 ; Turn off Inverse Time mode 
+M05 ; Turn off spindle
\ No newline at end of file
@@ -0,0 +1,34 @@
+; Sample ID:           DEP-P-999 
+; ~~~ Arguments used for gcode generation ~~~
+; Approach Height:       20.00 [mm] 
+; Approach Duration:     30.00 [s] 
+; Wire Diameter:          0.90 [mm] 
+; Deposition Diameter:    4.00 [mm] 
+; pillar Height:         10.00 [mm] 
+; Wire Feed Rate:         1.00 [mm/s] 
+; Spindle Speed          24000 [rpm] 
+; Initial Pause:          5.00 [s] 
+; ~~~ Calculated Values ~~~
+; Climb rate:             3.04 [mm/min] 
+; Total time:             3.88 [min] 
+
+G17 ; Select XY plane for circular interpolation 
+G21 ; Select metric units of [mm] 
+G54 ; Select G54 Work Coordinate System 
+G90 ; Absolute positioning mode 
+
+G92 C0.0 ; Reset the C axis to zero 
+G0 Z20.00 ; Rapid to the approach height 
+G0 X0.0 Y0.0; Rapid to the start of the pillar in XY 
+M3 S24000 ; Start the spindle 
+G93 ; Turn on Inverse Time mode 
+
+G1 Z0.0 F2.00 ; Feed down to the substrate in Z 
+G4 P5.00 ; Pause at zero height 
+G1 Z10.00 C197.53 F0.30 ; Move up to the pillar height while feeding 
+
+G94 ; Turn off Inverse Time mode 
+G91 ; Relative positioning mode 
+
+G1 Z15.0 C10.0 F60.0; Move up while extruding 
+M05 ; Turn off spindle
\ No newline at end of file
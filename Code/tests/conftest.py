@@ -0,0 +1,5 @@
+# The tests import dauber from Code/, wherever pytest is run from
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
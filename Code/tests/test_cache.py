@@ -0,0 +1,41 @@
+import io
+
+from dauber import cache, toolpath
+
+def generate(cls, sample_num, **params):
+    out = io.StringIO()
+    cls(**params).write(out, cls.sample_id(sample_num))
+    return out.getvalue()
+
+def test_extend_while_another_process_extends(tmp_path, monkeypatch):
+    # Another writer extending the same layer stream while it is being copied must not add its layers to the output
+    cache.Cache(str(tmp_path)).write(toolpath.N, {'num_layers': 50}, io.StringIO(), 1)
+    copy_file = cache._copy_file
+    def concurrent(file, out, size=None):
+        monkeypatch.setattr(cache, '_copy_file', copy_file)
+        cache.Cache(str(tmp_path)).write(toolpath.N, {'num_layers': 100}, io.StringIO(), 2)
+        copy_file(file, out, size)
+    monkeypatch.setattr(cache, '_copy_file', concurrent)
+    out = io.StringIO()
+    assert cache.Cache(str(tmp_path)).write(toolpath.N, {'num_layers': 150}, out, 3) == 'extend'
+    assert out.getvalue() == generate(toolpath.N, 3, num_layers=150)
+
+def test_event_log_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, 'events_max_bytes', 64)
+    programs = cache.Cache(str(tmp_path))
+    for n in range(10, 30):
+        programs.write(toolpath.Line, {'num_layers': n}, io.StringIO(), 1)
+    assert (tmp_path / cache.events_file).stat().st_size <= 64 + 32
+    stats = programs.stats()
+    assert stats['requests'] == 20 and stats['misses'] == 1 and stats['extensions'] == 19
+
+def test_equivalent_requests_share_a_key():
+    keys = {cache.key('program', toolpath.Line, params) for params in ({'line_length': 10}, {'line_length': 10.0}, {}, toolpath.Line.parameters())}
+    assert len(keys) == 1
+    assert cache.key('program', toolpath.Line, {'line_length': 11}) not in keys
+
+def test_layer_streams_count_towards_the_size(tmp_path):
+    programs = cache.Cache(str(tmp_path), max_bytes=10**9)
+    for n in range(5):
+        programs.write(toolpath.N, {'num_layers': 100 + n, 'feed_rate': 1.0 + n / 10}, io.StringIO(), 1)
+    assert programs.size == sum(size for mtime, size, names in programs.entries())
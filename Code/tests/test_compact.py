@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+
+from dauber import compact, toolpath
+
+# The unrolled programs are written to 0.01 [mm], so they sit up to 0.005 [mm] from the exact path themselves
+tolerance = 0.005 + compact.max_drift
+
+@pytest.mark.parametrize('pattern', [toolpath.N(num_layers=20000), toolpath.Line(num_layers=20001), toolpath.N(num_layers=3),
+                                     toolpath.N(num_layers=2000, heightmap_cell=0.1), toolpath.Line(num_layers=2001, heightmap_cell=0.1)])
+def test_long_runs_do_not_drift(pattern):
+    difference = compact.deviation(pattern)
+    assert np.all(difference.max(axis=0) <= tolerance)
+    assert np.all(difference[-1] <= tolerance) # Final X/Y/Z/C, where the rounding of every call has added up
@@ -0,0 +1,29 @@
+import io
+import os
+import numpy as np
+import pytest
+
+from dauber import geometry, simulate, toolpath
+
+cad_directory = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'CAD')
+
+def test_shipped_dxf_verifies():
+    pattern = toolpath.Drawing(drawing=os.path.join(cad_directory, 'Buildplate', 'Upper Plate Side.DXF'))
+    out = io.StringIO()
+    pattern.write(out, pattern.sample_id(1))
+    result = simulate.verify(out.getvalue().split('\n'))
+    assert result['problems'] == []
+
+def test_short_chords_are_merged():
+    points = np.array([[0.0, 0.0], [0.01, 0.0], [0.02, 0.0], [0.5, 0.0], [0.51, 0.0]])
+    # The short last chord is merged into the one before it, keeping the ends of the path
+    assert geometry.merge_short(points, 0.1).tolist() == [[0.0, 0.0], [0.51, 0.0]]
+    assert geometry.merge_short(points, 0.3).tolist() == [[0.0, 0.0], [0.51, 0.0]]
+    assert geometry.merge_short(points, 0.005).tolist() == points.tolist()
+
+def test_paths_too_short_to_feed_are_left_out(tmp_path):
+    drawing = tmp_path / 'drawing.csv'
+    drawing.write_text('path,x,y\na,0,0\na,10,0\nb,20,0\nb,20.01,0\n')
+    with pytest.warns(UserWarning, match='1 paths'):
+        pattern = toolpath.Drawing(drawing=str(drawing))
+    assert np.isclose(pattern.path_length, 10.0)
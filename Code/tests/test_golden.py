@@ -0,0 +1,5 @@
+from dauber import benchmark
+
+def test_generators_write_the_golden_programs():
+    # Regenerates DEP-L-999, DEP-N-999 and DEP-P-999 with the scripts' default arguments
+    assert benchmark.golden_check() == []
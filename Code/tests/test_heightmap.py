@@ -0,0 +1,34 @@
+import io
+import os
+import numpy as np
+import pytest
+
+from dauber import benchmark, toolpath
+
+def test_fed_volume_fills_the_footprint():
+    # The deposit of a line is a stadium the width of the deposition, num_layers layer heights tall
+    pattern = toolpath.Line(num_layers=20, heightmap_cell=0.05)
+    d = pattern.deposition_diameter
+    area = pattern.line_length * d + np.pi * d**2 / 4
+    assert np.isclose(pattern.feed_length * pattern.wire_area, area * pattern.num_layers * pattern.layer_height, rtol=0.01)
+    assert np.isclose(pattern.segments()['c'][-1], pattern.feed_length)
+
+@pytest.mark.parametrize('cls', [toolpath.Line, toolpath.N])
+def test_settling_is_even_and_stable(cls):
+    settling = [len(cls(num_layers=n, heightmap_cell=0.1).layer_dc) for n in (10, 11, 100, 1000)]
+    assert settling[0] % 2 == 0
+    assert settling == [settling[0]] * len(settling)
+
+def test_adapted_values_are_floats():
+    pattern = toolpath.N(num_layers=10, heightmap_cell=0.1)
+    for value in [pattern.feed_length, pattern.flat_feed_length, pattern.total_time] + list(pattern.calculated_values().values()):
+        assert type(value) is float
+
+@pytest.mark.parametrize('cls, name', [(toolpath.Line, 'DEP-L-999.nc'), (toolpath.N, 'DEP-N-999.nc')])
+def test_flat_patterns_unchanged(cls, name):
+    # Adapting one pattern to a heightmap leaves patterns built without one writing the flat-layer program
+    cls(heightmap_cell=0.1)
+    out = io.StringIO()
+    cls().write(out, name[:-3])
+    with open(os.path.join(benchmark.golden_directory, name)) as file:
+        assert out.getvalue() == file.read()
@@ -0,0 +1,32 @@
+import io
+import json
+import numpy as np
+
+from dauber import plate, simulate
+
+layout = {'parts': [{'pattern': 'N', 'num_layers': 3}, {'pattern': 'line', 'num_layers': 4}, {'pattern': 'pillar'}],
+          'wire_diameter': 0.9}
+
+def write_plate(tmp_path):
+    filename = tmp_path / 'plate.json'
+    filename.write_text(json.dumps(layout))
+    out = io.StringIO()
+    plate.load_layout(str(filename)).write(out, plate.plate_id(1))
+    return out.getvalue()
+
+def test_travel_matches_simulation(tmp_path):
+    program = write_plate(tmp_path)
+    table, header, pauses = simulate.parse(program.split('\n'))
+    result = simulate.simulate(table)
+    delta = result['delta']
+    rapid = table['code'] == simulate.RAPID
+    travel = np.hypot(delta['x'], delta['y'])[rapid].sum()
+    assert np.isclose(header['calculated']['travel distance'], travel, atol=0.01)
+
+def test_escape_of_last_part(tmp_path):
+    program = write_plate(tmp_path)
+    deposited = [line for line in program.split('\n') if ' layer ' in line and line.startswith('G1')]
+    last_part = deposited[-1].split(' ; ')[1].split()[0]
+    escape = program[program.rindex('; Rapid to '):]
+    # Pillars escape in G94, lines and Ns under G93 with the C axis fed at the end
+    assert ('G94 ; Turn off Inverse Time mode \nG91' in escape) == last_part.startswith('DEP-P-')
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from dauber import compact, simulate
+
+def run(program):
+    table, header, pauses = simulate.parse(program.strip().split('\n'))
+    return table, simulate.simulate(table)
+
+def test_absolute_and_relative_positions():
+    table, result = run('''
+G90
+G92 C0.0
+G1 X10.0 Y0.0 F600.0
+G91
+G1 X-2.5 Y4.0 C1.5
+G1 Z1.0
+G90
+G1 X0.0 C0.5
+''')
+    position = result['position']
+    assert position['x'].tolist() == [0.0, 10.0, 7.5, 7.5, 0.0]
+    assert position['y'].tolist() == [0.0, 0.0, 4.0, 4.0, 4.0]
+    assert position['z'][-1] == 1.0
+    assert position['c'].tolist() == [0.0, 0.0, 1.5, 1.5, 0.5]
+    assert result['wire_length'] == 1.5 # Moving C back does not feed wire
+    # G94: 10 mm at F600 [mm/min] takes 1 s
+    assert result['duration'][1] == pytest.approx(1.0)
+    assert result['duration'][3] == pytest.approx(0.1)
+
+def test_inverse_time():
+    table, result = run('''
+G93
+G1 X10.0 C2.0 F30.0
+G1 X20.0 C4.0 F120.0
+G94
+G1 C5.0 F60.0
+''')
+    # G93: F [1/min] is the inverse of the duration, whatever the distance. A move of C alone under G94 is timed by C.
+    assert result['duration'].tolist() == pytest.approx([2.0, 0.5, 1.0])
+    assert result['total_time'] == pytest.approx(3.5 / 60)
+
+def test_inverse_time_needs_f_on_every_move():
+    with pytest.raises(ValueError, match='line 3'):
+        simulate.parse(['G93', 'G1 X1.0 F60.0', 'G1 X2.0'])
+
+def test_subprogram_expansion():
+    program = '''
+G90
+G92 C0.0
+M98 P1000 L3
+M30
+
+O1000
+G91
+G1 Z0.1 C1.0 F60.0
+G1 X5.0 C2.0 F60.0
+G1 X-5.0 C2.0 F60.0
+G90
+M99
+'''.strip().split('\n')
+    with pytest.raises(ValueError, match='M98'):
+        simulate.parse(program)
+    table, header, pauses = simulate.parse(list(compact.expand(program)))
+    result = simulate.simulate(table)
+    assert np.count_nonzero(table['code'] == simulate.FEED) == 9
+    assert result['final_z'] == pytest.approx(0.3)
+    assert result['position']['x'][-1] == pytest.approx(0.0)
+    assert result['wire_length'] == pytest.approx(15.0)
+
+header = '''; Sample ID:                DEP-T-001
+; ~~~ Calculated Values ~~~
+; Traverse Rate:              {rate:.2f} [mm/min]
+; Total Time:                 {time:.2f} [min]
+G90
+G93
+G92 C0.0
+G1 X10.0 C1.0 F6.0
+G1 X0.0 C2.0 F6.0
+G91
+G1 Z20.0 C10.0 F6.0
+'''
+
+def test_check_accepts_matching_header():
+    result = simulate.verify(header.format(rate=60.0, time=20 / 60).split('\n'))
+    assert result['problems'] == []
+
+def test_check_reports_mismatches():
+    result = simulate.verify(header.format(rate=90.0, time=1.0).split('\n'))
+    assert len(result['problems']) == 2
+    assert result['problems'][0].startswith('Total Time is 1.00 [min]')
+    assert result['problems'][1].startswith('Traverse Rate is 90.00 [mm/min]')
+
+def test_unsupported_code():
+    with pytest.raises(ValueError, match='G2 on line 2'):
+        simulate.parse(['G90', 'G2 X1.0 Y1.0 F60.0'])
@@ -0,0 +1,65 @@
+import asyncio
+import pytest
+
+from dauber import stream
+
+class Link:
+    # Reader and writer standing in for a controller that acknowledges every line, after some extra responses
+    def __init__(self, extra=(), fail_after=None):
+        self.responses = asyncio.Queue()
+        for response in extra:
+            self.responses.put_nowait(response)
+        self.fail_after = fail_after
+        self.lines = []
+
+    def write(self, data):
+        self.lines.append(data)
+        if self.fail_after is None or len(self.lines) <= self.fail_after:
+            self.responses.put_nowait(b'ok\n')
+
+    async def drain(self):
+        pass
+
+    async def readline(self):
+        if self.fail_after is not None and len(self.lines) > self.fail_after and self.responses.empty():
+            raise RuntimeError('link failed')
+        return await self.responses.get()
+
+def send(link, lines, **options):
+    async def run():
+        return await asyncio.wait_for(stream.Sender(link, link, pause_at_m0=False, **options).send(lines), 5)
+    return asyncio.run(run())
+
+def test_unmatched_ok_is_ignored():
+    link = Link(extra=[b'ok\n', b'ok\n'])
+    stats = send(link, ['G1 X{}'.format(i) for i in range(50)], window=4)
+    assert stats['lines_acked'] == 50
+    assert stats['unmatched_acks'] >= 1
+
+def test_reader_failure_stops_send():
+    with pytest.raises(RuntimeError, match='link failed'):
+        send(Link(fail_after=3), ['G1 X{}'.format(i) for i in range(50)], window=4)
+
+def test_mock_reports_overflow_in_order(tmp_path):
+    async def run():
+        with open(tmp_path / 'log.nc', 'w') as log:
+            controller = stream.MockController(delay=0.01, rx_buffer=20, log=log)
+            server = await controller.serve('localhost', 0)
+            reader, writer = await asyncio.open_connection('localhost', server.sockets[0].getsockname()[1])
+            writer.write(b'G1 X1.000\nG1 X2.000\nG1 X3.000\nG1 X4.000\n') # Only the first two fit the buffer
+            responses = [(await reader.readline()).strip() for i in range(4)]
+            writer.close()
+            server.close()
+        return responses, (tmp_path / 'log.nc').read_text()
+    responses, log = asyncio.run(run())
+    assert responses == [b'ok', b'ok', b'error:overflow', b'error:overflow']
+    assert log == 'G1 X1.000\nG1 X2.000\n'
+
+def test_errors_name_program_lines():
+    class Rejecting(Link):
+        def write(self, data):
+            self.lines.append(data)
+            self.responses.put_nowait(b'error:20\n' if data.startswith(b'G2') else b'ok\n')
+    program = ['; Header comment', '', 'G90', '; Layer 1', 'G1 X1.0', 'G2 X2.0 ; Not supported', 'G1 X3.0']
+    stats = send(Rejecting(), program, window=2)
+    assert stats['errors'] == [(6, 'error:20')]
@@ -0,0 +1,34 @@
+import pytest
+
+from dauber import sweep
+
+@pytest.mark.parametrize('value', ['100', '100.0', 100, 100.0, ' 1e2 '])
+def test_whole_numbers(value):
+    assert sweep.convert(value, 5) == 100
+
+@pytest.mark.parametrize('value', ['2.5', 2.5])
+def test_fractions_are_rejected(value):
+    with pytest.raises(ValueError):
+        sweep.convert(value, 5)
+
+def test_make_pattern_from_spreadsheet_row():
+    pattern = sweep.make_pattern({'pattern': 'N', 'num_layers': '10.0', 'feed_rate': '1.5'})
+    assert pattern.num_layers == 10 and isinstance(pattern.num_layers, int)
+
+def test_rows_are_checked_without_building_patterns(tmp_path, monkeypatch):
+    built = []
+    monkeypatch.setattr(sweep, 'make_pattern', lambda row: built.append(row) or sweep.toolpath.patterns[row['pattern']]())
+    with pytest.raises(ValueError):
+        sweep.run([{'pattern': 'N'}, {'pattern': 'line', 'line_lenght': 5}], str(tmp_path), jobs=1)
+    with pytest.raises(ValueError):
+        sweep.run([{'pattern': 'N'}, {'pattern': 'line', 'num_layers': '2.5'}], str(tmp_path), jobs=1)
+    assert built == []
+    sweep.run([{'pattern': 'N', 'num_layers': 2}, {'pattern': 'line', 'num_layers': 2}], str(tmp_path), jobs=1)
+    assert len(built) == 2
+
+def test_sample_nums_from_spreadsheet():
+    rows = sweep.assign_sample_nums([{'pattern': 'N', 'sample_num': '5.0'}, {'pattern': 'N'}, {'pattern': 'N', 'sample_num': 6.0}], 5)
+    assert [row['sample_num'] for row in rows] == [5, 7, 6]
+    assert all(isinstance(row['sample_num'], int) for row in rows)
+    with pytest.raises(ValueError):
+        sweep.assign_sample_nums([{'pattern': 'N', 'sample_num': '5.5'}], 1)
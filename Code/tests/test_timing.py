@@ -0,0 +1,15 @@
+import io
+import numpy as np
+import pytest
+
+from dauber import simulate, toolpath
+
+@pytest.mark.parametrize('pattern', [toolpath.Pillar(), toolpath.Line(), toolpath.N(num_layers=10)])
+def test_escape_time_matches_simulation(pattern):
+    # The estimate times the escape with escape_move(), which must agree with how the simulator times the written move
+    out = io.StringIO()
+    pattern.write(out, pattern.sample_id(1))
+    table, header, pauses = simulate.parse(out.getvalue().split('\n'))
+    result = simulate.simulate(table)
+    escape = np.flatnonzero(table['code'] == simulate.FEED)[-1]
+    assert np.isclose(result['duration'][escape], pattern.escape_move()[2])
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from dauber import toolpath
+
+def test_no_layers():
+    # The climb to layer 1 is made even without any layers
+    pattern = toolpath.N(num_layers=0)
+    table = np.concatenate(list(pattern.iter_segments()))
+    assert len(table) == 1 and table[0]['kind'] == toolpath.CLIMB
+    assert np.array_equal(table, pattern.segments()[len(pattern.prefix_moves()):])
+
+def test_layers_repeat_with_c_and_z_summed():
+    pattern = toolpath.N(num_layers=5)
+    table = pattern.layer_segments(1, 6)
+    m = pattern.rows_per_layer
+    assert table['layer'].tolist() == np.repeat(np.arange(1, 6), m).tolist()
+    assert np.allclose(table['z'][::m], pattern.layer_height * np.arange(1, 6))
+    assert np.allclose(np.diff(table['c'], prepend=0.0), np.tile(pattern.template_dc[[1, 0]].ravel(), 3)[:5 * m])
+    # Layers of the same parity make the same moves
+    assert np.array_equal(table[['x', 'y', 'f', 'kind']][:m], table[['x', 'y', 'f', 'kind']][2 * m:3 * m])
+
+@pytest.mark.parametrize('chunk', [1, 2, 3, 7, 100])
+@pytest.mark.parametrize('cell', [0.0, 0.1])
+def test_chunks_join_up(chunk, cell):
+    # Odd chunk sizes start chunks on layers of either parity, chunks may start inside the settling layers of a
+    # heightmap, and C and Z carry over between them
+    pattern = toolpath.N(num_layers=20, heightmap_cell=cell)
+    chunked = np.concatenate(list(pattern.iter_segments(chunk_layers=chunk)))
+    assert np.array_equal(chunked, pattern.layer_segments(1, 21))
+
+def test_chunks_smaller_than_a_layer(monkeypatch):
+    # A pattern with more rows per layer than chunk_rows is still generated a whole layer at a time
+    monkeypatch.setattr(toolpath, 'chunk_rows', 3)
+    pattern = toolpath.N(num_layers=5)
+    chunks = list(pattern.iter_segments())
+    assert [len(chunk) for chunk in chunks] == [pattern.rows_per_layer] * 5
+    assert np.array_equal(np.concatenate(chunks), pattern.layer_segments(1, 6))
+
+@pytest.mark.parametrize('first', [2, 3])
+def test_later_first_layer(first):
+    # Carrying on from the end of layer first-1 gives the same layers as generating them all
+    pattern = toolpath.Line(num_layers=9)
+    whole = pattern.layer_segments(1, 10)
+    before = whole[whole['layer'] == first - 1][-1]
+    rest = np.concatenate(list(pattern.iter_segments(chunk_layers=2, first=first, c0=before['c'], z0=before['z'])))
+    assert len(rest) == np.count_nonzero(whole['layer'] >= first)
+    for name in ('x', 'y', 'z', 'c', 'f', 'kind', 'layer'):
+        assert np.allclose(rest[name], whole[whole['layer'] >= first][name])